@@ -0,0 +1,74 @@
+"""基准测试：纹理图集 + convert_alpha 对每帧绘制耗时的影响
+
+在第5关的完整地图上整屏绘制所有精灵，分别测量使用独立 SRCALPHA 图像
+和使用转换为显示格式的图集时每帧的 blit 耗时。
+
+    python benchmarks/bench_atlas.py [--frames 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import pygame
+from tank_battle.game.config import Config
+from tank_battle.game.game_manager import GameManager
+from tank_battle.game.resources.resource_manager import ResourceManager
+
+
+def build_level(screen, resource_manager, seed):
+    """生成第5关的地图，并在空地上补满坦克和道具"""
+    game = GameManager(screen, resource_manager)
+    game.start_game(seed)
+    game.current_level = Config.MAX_LEVEL
+    game.init_level()
+    for index, enemy_type in enumerate(['normal', 'fast', 'heavy', 'elite'] * 3):
+        game.create_enemy((index * 3 % Config.GRID_WIDTH) * Config.TILE_SIZE,
+                          (index // 5 * 4 + 1) * Config.TILE_SIZE, enemy_type)
+    for tank in game.player_group.sprites() + game.enemy_group.sprites():
+        for _ in range(3):
+            tank.last_shot = -10 ** 9
+            tank.shoot(0)
+    return game
+
+
+def measure(screen, game, frames):
+    """整屏绘制若干帧，返回每帧平均耗时（毫秒）"""
+    sprites = game.all_sprites.sprites() + game.bullet_group.sprites()
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill(Config.BLACK)
+        for sprite in sprites:
+            screen.blit(sprite.image, sprite.rect)
+    return (time.perf_counter() - start) * 1000 / frames, len(sprites)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+    resource_manager = ResourceManager()
+
+    loose_ms, count = measure(screen, build_level(screen, resource_manager, args.seed), args.frames)
+    resource_manager.build_atlas()
+    atlas_ms, _ = measure(screen, build_level(screen, resource_manager, args.seed), args.frames)
+
+    print(f"sprites per frame: {count}")
+    print(f"separate images: {loose_ms:.3f} ms/frame")
+    print(f"texture atlas:   {atlas_ms:.3f} ms/frame")
+    print(f"speedup:         {loose_ms / atlas_ms:.2f}x")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""基准测试：流场的增量修复与整张地图重新计算
+
+在 20x15（游戏地图）和 200x150 的随机地图上反复打掉砖墙、切换基地
+周围的砖墙和钢墙，分别测量每次变化后增量修复和整张地图重新计算的耗时
+及两者之比。
+
+    python benchmarks/bench_flow_field.py [--events 300]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from tank_battle.game.ai.flow_field import FlowField
+from tank_battle.game.resources.resource_manager import NullResourceManager
+from tank_battle.game.sprites.terrain import Terrain
+from tank_battle.game.tile_map import TileMap
+
+
+def build_map(width, height, resource_manager, rng, density=0.3):
+    """生成随机地图，基地在底部中央，周围是砖墙"""
+    tile_map = TileMap(width, height)
+    size = tile_map.tile_size
+    base = (width // 2, height - 1)
+    walls = [(base[0] - 1, base[1]), (base[0] + 1, base[1]), (base[0], base[1] - 1),
+             (base[0] - 1, base[1] - 1), (base[0] + 1, base[1] - 1)]
+    for row in range(height):
+        for col in range(width):
+            if (col, row) == base or (col, row) in walls or rng.random() >= density:
+                continue
+            terrain_type = rng.choice(['brick', 'brick', 'steel', 'water', 'grass'])
+            tile_map.place(Terrain(col * size, row * size, terrain_type, resource_manager))
+    tile_map.place(Terrain(base[0] * size, base[1] * size, 'base', resource_manager))
+    for col, row in walls:
+        tile_map.place(Terrain(col * size, row * size, 'brick', resource_manager))
+    return tile_map, base, walls
+
+
+def apply_event(tile_map, walls, resource_manager, rng, shielded):
+    """打掉一块随机的砖墙，或者（约每 10 次一次）切换基地周围的墙，返回 (事件, 是否加固)"""
+    size = tile_map.tile_size
+    if rng.random() < 0.1:
+        terrain_type = 'brick' if shielded else 'steel'
+        for col, row in walls:
+            tile_map.place(Terrain(col * size, row * size, terrain_type, resource_manager))
+        return 'base walls toggled', not shielded
+    bricks = [sprite for row in tile_map.sprites for sprite in row
+              if sprite is not None and sprite.type == 'brick' and
+              tile_map.tile_of(sprite.rect.x, sprite.rect.y) not in walls]
+    if bricks:
+        tile_map.remove(rng.choice(bricks))
+    return 'brick destroyed', shielded
+
+
+def measure(width, height, events, seed, resource_manager):
+    """按事件类型返回 {事件: (增量修复耗时列表, 整张重新计算耗时列表, 修复格子数列表)}，单位毫秒"""
+    rng = random.Random(seed)
+    tile_map, base, walls = build_map(width, height, resource_manager, rng)
+    field = FlowField(tile_map)
+    field.set_target(*base)
+    field.update()
+    shielded = False
+    results = {}
+    for _ in range(events):
+        event, shielded = apply_event(tile_map, walls, resource_manager, rng, shielded)
+        repair_ms, full_ms, repaired = results.setdefault(event, ([], [], []))
+        start = time.perf_counter()
+        field.update()
+        repair_ms.append((time.perf_counter() - start) * 1000)
+        repaired.append(field.repaired_tiles)
+        start = time.perf_counter()
+        field.compute()
+        full_ms.append((time.perf_counter() - start) * 1000)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    resource_manager = NullResourceManager()
+    for width, height in ((20, 15), (200, 150)):
+        print(f"{width}x{height} ({width * height} tiles):")
+        for event, (repair_ms, full_ms, repaired) in measure(
+                width, height, args.events, args.seed, resource_manager).items():
+            print(f"  {event} x{len(repair_ms)}, {statistics.mean(repaired):.0f} tiles repaired on average")
+            print(f"    incremental repair: mean {statistics.mean(repair_ms):.3f} ms, "
+                  f"max {max(repair_ms):.3f} ms")
+            print(f"    full recompute:     mean {statistics.mean(full_ms):.3f} ms, "
+                  f"max {max(full_ms):.3f} ms")
+            print(f"    repair / recompute: {statistics.mean(repair_ms) / statistics.mean(full_ms):.2f}x")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""基准测试：敌人按射线射击与随机射击的子弹数量和每帧耗时
+
+用相同的种子和随机玩家输入，分别在 Config.ENEMY_LINE_OF_FIRE 打开和
+关闭时运行若干局 headless 游戏（结束后用下一个种子重新开始），报告
+平均每帧存在的敌人子弹数、每秒发射的敌人子弹数、每帧模拟耗时，以及
+基地被摧毁和玩家被击中的次数。
+
+    python benchmarks/bench_line_of_fire.py [--ticks 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from tank_battle.game import actions
+from tank_battle.game.config import Config
+from tank_battle.game.game_manager import GameManager
+from tank_battle.game.resources.resource_manager import NullResourceManager
+
+MOVES = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+
+
+def measure(line_of_fire, ticks, seed):
+    """运行 ticks 步，返回统计字典"""
+    Config.ENEMY_LINE_OF_FIRE = line_of_fire
+    game = GameManager(None, NullResourceManager(), headless=True)
+    game.reset(seed)
+    rng = random.Random(seed)
+    move = actions.NOOP
+    enemy_bullets = 0
+    fired = 0
+    deaths = 0
+    bases_lost = 0
+    lives = game.lives
+    elapsed = 0.0
+    for tick in range(ticks):
+        if tick % 15 == 0:
+            move = rng.choice(MOVES)
+        player_actions = move | (actions.FIRE if rng.random() < 0.3 else 0)
+        start = time.perf_counter()
+        game.simulate(player_actions)
+        elapsed += time.perf_counter() - start
+
+        enemy_bullets += sum(bullet.tank_type == 'enemy' for bullet in game.bullet_group)
+        now = game.sim_clock.now
+        fired += sum(enemy.last_shot == now for enemy in game.enemy_group)
+        if game.lives < lives:
+            deaths += lives - game.lives
+        lives = game.lives
+        if game.game_over:
+            bases_lost += game.game_over_reason == 'base_destroyed'
+            seed += 1
+            game.reset(seed)
+            lives = game.lives
+    return {
+        'bullets': enemy_bullets / ticks,
+        'fired_per_s': fired / (ticks / Config.FPS),
+        'step_us': elapsed / ticks * 1e6,
+        'deaths': deaths,
+        'bases_lost': bases_lost,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=20000, help='每种设置模拟的步数')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    original = Config.ENEMY_LINE_OF_FIRE
+    try:
+        for name, line_of_fire in (('random 5%', False), ('line of fire', True)):
+            stats = measure(line_of_fire, args.ticks, args.seed)
+            print(f"{name:<13} {stats['bullets']:6.2f} enemy bullets/frame  "
+                  f"{stats['fired_per_s']:6.2f} fired/s  {stats['step_us']:7.1f} us/step  "
+                  f"{stats['deaths']} player deaths  {stats['bases_lost']} bases lost")
+    finally:
+        Config.ENEMY_LINE_OF_FIRE = original
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""基准测试：子弹和道具对象池在连射时减少的分配
+
+玩家保持连射和护盾，每帧开火并随机移动，分别在不使用对象池（容量 0）
+和使用默认容量的对象池时运行相同的种子和输入，报告每秒（模拟时间）
+新建的子弹/道具精灵数、对象池命中率和每步耗时。
+
+    python benchmarks/bench_pools.py [--ticks 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from tank_battle.game import actions
+from tank_battle.game.config import Config
+from tank_battle.game.game_manager import GameManager
+from tank_battle.game.resources.resource_manager import NullResourceManager
+from tank_battle.game.sprite_pool import SpritePool
+from tank_battle.game.sprites.bullet import Bullet
+from tank_battle.game.sprites.powerup import PowerUp
+
+MOVES = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+
+
+def measure(bullet_pool_size, powerup_pool_size, ticks, seed):
+    """运行 ticks 步，返回统计字典"""
+    game = GameManager(None, NullResourceManager(), headless=True)
+    game.reset(seed)
+    game.bullet_pool = SpritePool(Bullet, bullet_pool_size)
+    game.powerup_pool = SpritePool(PowerUp, powerup_pool_size)
+    rng = random.Random(seed)
+    move = actions.NOOP
+
+    elapsed = 0.0
+    for tick in range(ticks):
+        player = next(iter(game.player_group), None)
+        if player is not None:
+            # 保持连射和护盾，让场上一直有大量子弹
+            now = game.sim_clock.now
+            player.rapid_fire_end_time = now + 1000
+            player.shield_end_time = now + 1000
+        if tick % 15 == 0:
+            move = rng.choice(MOVES)
+        start = time.perf_counter()
+        game.simulate(move | actions.FIRE)
+        elapsed += time.perf_counter() - start
+        if game.game_over:
+            seed += 1
+            game.reset(seed)
+
+    seconds = ticks / Config.FPS
+    bullets = game.bullet_pool.stats()
+    powerups = game.powerup_pool.stats()
+    return {
+        'created_per_s': (bullets['misses'] + powerups['misses']) / seconds,
+        'bullet_hit_rate': bullets['hit_rate'],
+        'powerup_hit_rate': powerups['hit_rate'],
+        'step_us': elapsed / ticks * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=20000, help='每种设置模拟的步数')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    for name, bullet_pool_size, powerup_pool_size in (
+            ('no pool', 0, 0),
+            ('pooled', Config.BULLET_POOL_SIZE, Config.POWERUP_POOL_SIZE)):
+        stats = measure(bullet_pool_size, powerup_pool_size, args.ticks, args.seed)
+        print(f"{name:<8} {stats['created_per_s']:7.2f} sprites created/s  "
+              f"hit rate {stats['bullet_hit_rate']:.1%} bullets, "
+              f"{stats['powerup_hit_rate']:.1%} power-ups  {stats['step_us']:7.1f} us/step")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""基准测试：完整游戏状态的快照与恢复
+
+在第5关的完整地图上补满坦克、子弹和道具，测量 GameManager.snapshot()
+和 restore() 每次的耗时以及快照的字节数（BulletSystem 开启和关闭各一次）。
+
+    python benchmarks/bench_snapshot.py [--rounds 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from tank_battle.game.config import Config
+from tank_battle.game.game_manager import GameManager
+from tank_battle.game.resources.resource_manager import ResourceManager
+from tank_battle.game.sprites.powerup import PowerUp
+
+
+def build_level(resource_manager, seed):
+    """生成第5关的地图，并补满坦克、子弹和道具"""
+    game = GameManager(None, resource_manager, headless=True)
+    game.reset(seed)
+    game.current_level = Config.MAX_LEVEL
+    game.init_level()
+    for index, enemy_type in enumerate(['normal', 'fast', 'heavy', 'elite'] * 3):
+        game.create_enemy((index * 3 % Config.GRID_WIDTH) * Config.TILE_SIZE,
+                          (index // 5 * 4 + 1) * Config.TILE_SIZE, enemy_type)
+    for tank in game.player_group.sprites() + game.enemy_group.sprites():
+        tank.last_shot = -10 ** 9
+        tank.shoot(0)
+    for index, powerup_type in enumerate(Config.POWERUP_TYPES):
+        powerup = PowerUp(index * 2 * Config.TILE_SIZE, Config.TILE_SIZE, powerup_type,
+                          resource_manager, 0)
+        game.powerup_group.add(powerup)
+        game.all_sprites.add(powerup)
+    return game
+
+
+def measure(game, rounds):
+    """返回 (快照字节数, 每次快照耗时, 每次恢复耗时)，耗时单位为毫秒"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        data = game.snapshot()
+    snapshot_ms = (time.perf_counter() - start) * 1000 / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        game.restore(data)
+    restore_ms = (time.perf_counter() - start) * 1000 / rounds
+    return len(data), snapshot_ms, restore_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    resource_manager = ResourceManager(lazy=True)
+    for use_bullet_system in (False, True):
+        Config.USE_BULLET_SYSTEM = use_bullet_system
+        game = build_level(resource_manager, args.seed)
+        size, snapshot_ms, restore_ms = measure(game, args.rounds)
+        print(f"bullet system {'on' if use_bullet_system else 'off'}: "
+              f"{len(game.terrain_group)} terrain, {len(game.player_group) + len(game.enemy_group)} tanks, "
+              f"{len(game.bullet_group) + (len(game.bullet_system) if game.bullet_system else 0)} bullets, "
+              f"{len(game.powerup_group)} powerups")
+        print(f"  snapshot: {size} bytes, {snapshot_ms:.3f} ms")
+        print(f"  restore:  {restore_ms:.3f} ms")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
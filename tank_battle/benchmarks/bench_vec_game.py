@@ -0,0 +1,64 @@
+"""基准测试：VecGame 批量模拟的吞吐量
+
+分别用 N = 1、16、256 局同时运行随机动作，报告每秒的环境步数
+（N 局各推进一步算 N 个环境步）。默认使用 NullResourceManager，
+--images 时共享一个真实的 ResourceManager。
+
+    python benchmarks/bench_vec_game.py [--steps 40000] [--images]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from tank_battle.game import actions
+from tank_battle.game.resources.resource_manager import ResourceManager
+from tank_battle.game.vec_game import VecGame
+
+MOVES = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+
+
+def measure(num_envs, env_steps, resource_manager, seed):
+    """运行约 env_steps 个环境步，返回 (每秒环境步数, 结束的局数)"""
+    vec = VecGame(num_envs, resource_manager)
+    vec.reset(seed)
+    rng = random.Random(seed)
+    batches = [[rng.choice(MOVES) | rng.choice((0, actions.FIRE)) for _ in range(num_envs)]
+               for _ in range(64)]
+    steps = max(1, env_steps // num_envs)
+    episodes = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        _, _, dones = vec.step(batches[step % len(batches)])
+        episodes += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    return steps * num_envs / elapsed, episodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--steps', type=int, default=40000, help='每种 N 运行的环境步数')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--images', action='store_true', help='共享真实的 ResourceManager')
+    args = parser.parse_args()
+
+    pygame.init()
+    resource_manager = ResourceManager(lazy=True) if args.images else None
+    for num_envs in (1, 16, 256):
+        rate, episodes = measure(num_envs, args.steps, resource_manager, args.seed)
+        print(f"N={num_envs:<4} {rate:10.0f} env-steps/s  ({episodes} episodes finished)")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
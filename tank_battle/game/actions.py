@@ -0,0 +1,38 @@
+import pygame
+
+# 玩家动作位标志，可以按位或组合（例如 UP | FIRE）
+NOOP = 0
+UP = 1
+DOWN = 2
+LEFT = 4
+RIGHT = 8
+FIRE = 16
+
+# 移动方向的优先级与键盘操作一致：上 > 下 > 左 > 右
+MOVE_ACTIONS = ((UP, 'up'), (DOWN, 'down'), (LEFT, 'left'), (RIGHT, 'right'))
+
+# 键盘按键对应的动作
+KEY_ACTIONS = (
+    (pygame.K_UP, UP),
+    (pygame.K_DOWN, DOWN),
+    (pygame.K_LEFT, LEFT),
+    (pygame.K_RIGHT, RIGHT),
+    (pygame.K_SPACE, FIRE),
+)
+
+
+def actions_from_keys(keys):
+    """把 pygame.key.get_pressed() 的按键状态转换为动作位标志"""
+    actions = NOOP
+    for key, action in KEY_ACTIONS:
+        if keys[key]:
+            actions |= action
+    return actions
+
+
+def move_direction(actions):
+    """动作对应的移动方向，没有移动时返回 None"""
+    for action, direction in MOVE_ACTIONS:
+        if actions & action:
+            return direction
+    return None
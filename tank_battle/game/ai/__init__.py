@@ -0,0 +1 @@
+# ai package
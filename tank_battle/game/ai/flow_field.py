@@ -0,0 +1,268 @@
+import heapq
+from ..config import Config
+from ..tile_map import EMPTY, GRASS, TERRAIN_CODES
+
+# 无法到达目标的格子的距离
+UNREACHABLE = 1 << 30
+
+# 增量修复涉及的格子超过地图的这个比例（且多于 REPAIR_MIN_TILES 个）时改为
+# 整张重新计算：逐格修复的开销更大，超过后再继续修复只会比重新计算更慢
+REPAIR_LIMIT = 0.05
+REPAIR_MIN_TILES = 16
+
+# 相邻格子的偏移及朝它走的方向（距离相同时按这个顺序选方向）
+NEIGHBORS = ((0, -1, 'up'), (0, 1, 'down'), (-1, 0, 'left'), (1, 0, 'right'))
+
+
+def enter_costs(brick_cost):
+    """各地形编码的进入代价，None 表示无法通过"""
+    return {
+        EMPTY: 1,
+        GRASS: 1,
+        TERRAIN_CODES['brick']: brick_cost,
+        TERRAIN_CODES['steel']: None,
+        TERRAIN_CODES['water']: None,
+        TERRAIN_CODES['base']: 1,
+    }
+
+
+def adjacent_index(index, direction, width):
+    """格子朝 direction 走一步后的下标"""
+    if direction == 'up':
+        return index - width
+    if direction == 'down':
+        return index + width
+    if direction == 'left':
+        return index - 1
+    return index + 1
+
+
+class FlowField:
+    """从目标格子（基地）出发的距离场，所有敌人共享
+
+    用 Dijkstra 计算每个格子到目标的最短代价：空地和草地代价为 1，
+    砖墙需要先打掉，代价更高，钢墙和水无法通过。每个格子的方向指向
+    代价最小的邻格（相同时按 NEIGHBORS 的顺序），只由距离决定。
+
+    地形变化时先记下变化的格子，下一次查询时再统一处理：整张地图变化
+    （清空、切换关卡）时重新计算，个别格子变化时只修复受影响的区域，
+    所以每帧最多处理一次。
+    """
+    def __init__(self, tile_map, brick_cost=Config.FLOW_BRICK_COST):
+        self.tile_map = tile_map
+        self.costs = enter_costs(brick_cost)
+        self.target = None
+        self.dirty = True
+        self.changed = set()  # 上次计算之后变化过的格子下标
+        self.codes = []  # 上次计算时的地形编码
+        self.distances = []
+        self.directions = []
+        self.recomputes = 0  # 整张地图重新计算的次数（用于测试和基准）
+        self.repaired_tiles = 0  # 最近一次修复时重新计算的格子数
+
+        # 每个格子的邻格下标及朝邻格走的方向
+        width, height = tile_map.width, tile_map.height
+        self.adjacent = []
+        for row in range(height):
+            for col in range(width):
+                self.adjacent.append([((row + dy) * width + col + dx, direction)
+                                      for dx, dy, direction in NEIGHBORS
+                                      if 0 <= col + dx < width and 0 <= row + dy < height])
+        tile_map.add_listener(self.on_tiles_changed)
+
+    def set_target(self, col, row):
+        """设置目标格子"""
+        if self.target != (col, row):
+            self.target = (col, row)
+            self.dirty = True
+
+    def on_tiles_changed(self, tiles):
+        """地形变化回调：记下变化的格子，None 表示整张地图"""
+        if tiles is None:
+            self.dirty = True
+            self.changed.clear()
+        elif not self.dirty:
+            width = self.tile_map.width
+            self.changed.update(row * width + col for col, row in tiles)
+
+    def update(self):
+        """处理上次计算之后的地形或目标变化"""
+        if self.target is None:
+            return
+        if self.dirty:
+            self.compute()
+        elif self.changed:
+            self.repair()
+
+    def _propagate(self, heap, touched, limit=None):
+        """从堆中的格子继续 Dijkstra，把距离变化的格子加入 touched
+
+        touched 超过 limit 个格子时提前停止并返回 False（距离只更新了一部分）。
+        """
+        distances = self.distances
+        codes = self.codes
+        costs = self.costs
+        adjacent = self.adjacent
+        while heap:
+            distance, index = heapq.heappop(heap)
+            if distance > distances[index]:
+                continue
+            step = distance + (costs[codes[index]] or 1)  # 目标格子本身可能无法通过
+            for neighbor, _ in adjacent[index]:
+                if step < distances[neighbor] and costs[codes[neighbor]] is not None:
+                    distances[neighbor] = step
+                    touched.add(neighbor)
+                    if limit is not None and len(touched) > limit:
+                        return False
+                    heapq.heappush(heap, (step, neighbor))
+        return True
+
+    def _target_index(self):
+        """目标格子的下标"""
+        col, row = self.target
+        return row * self.tile_map.width + col
+
+    def _update_directions(self, indices):
+        """重新确定这些格子的方向：朝 距离 + 进入代价 最小的邻格走"""
+        distances = self.distances
+        directions = self.directions
+        codes = self.codes
+        costs = self.costs
+        target = self._target_index()
+        for index in indices:
+            best = None
+            if distances[index] < UNREACHABLE and distances[index] > 0:
+                best_cost = UNREACHABLE
+                for neighbor, direction in self.adjacent[index]:
+                    cost = costs[codes[neighbor]]
+                    if neighbor == target:
+                        cost = cost or 1  # 与 _propagate 相同，目标格子总能进入
+                    if cost is not None and distances[neighbor] + cost < best_cost:
+                        best_cost = distances[neighbor] + cost
+                        best = direction
+            directions[index] = best
+
+    def compute(self):
+        """用 Dijkstra 重新计算整张地图的距离和方向"""
+        self.codes = self.tile_map.codes.ravel().tolist()
+        count = len(self.codes)
+        self.distances = [UNREACHABLE] * count
+        self.directions = [None] * count
+        start = self._target_index()
+        self.distances[start] = 0
+        self._propagate([(0, start)], set())
+        self._update_directions(range(count))
+        self.dirty = False
+        self.changed.clear()
+        self.recomputes += 1
+
+    def repair(self):
+        """只修复受变化格子影响的区域
+
+        代价变高（或变得无法通过）的格子：最短路径经过它的格子（最短路径树
+        中它的所有后代）距离失效，重置后从周围仍然有效的格子重新扩展；
+        代价变低的格子：从它开始向外扩展，直到距离不再变小。
+        """
+        tile_map = self.tile_map
+        width = tile_map.width
+        new_codes = tile_map.codes.ravel()
+        codes = self.codes
+        costs = self.costs
+        distances = self.distances
+        directions = self.directions
+        adjacent = self.adjacent
+        target = self._target_index()
+
+        limit = max(int(len(codes) * REPAIR_LIMIT), REPAIR_MIN_TILES)
+        changed = []
+        invalid = set()
+        for index in self.changed:
+            old_cost = costs[codes[index]]
+            code = int(new_codes[index])
+            codes[index] = code
+            new_cost = costs[code]
+            if index == target:
+                # 与 _propagate 相同，目标格子无法通过时进入代价按 1 计
+                old_cost, new_cost = old_cost or 1, new_cost or 1
+            if old_cost == new_cost:
+                continue
+            changed.append(index)
+            if new_cost is not None and (old_cost is None or new_cost < old_cost):
+                continue
+            # 代价变高：收集最短路径经过这个格子的所有格子
+            if new_cost is None:
+                invalid.add(index)
+            stack = [index]
+            while stack and len(invalid) <= limit:
+                parent = stack.pop()
+                for neighbor, direction in adjacent[parent]:
+                    if neighbor not in invalid and directions[neighbor] is not None and \
+                            adjacent_index(neighbor, directions[neighbor], width) == parent:
+                        invalid.add(neighbor)
+                        stack.append(neighbor)
+            if len(invalid) > limit:
+                break
+        self.changed.clear()
+        if len(invalid) > limit:
+            # 大片区域失效（例如基地被围住），整张重新计算更快
+            self.compute()
+            self.repaired_tiles = len(codes)
+            return
+        if not changed:
+            self.repaired_tiles = 0
+            return
+
+        for index in invalid:
+            distances[index] = UNREACHABLE
+        # 失效的格子和变化格子的邻格：先用周围有效的距离估计
+        seeds = set(invalid)
+        for index in changed:
+            seeds.add(index)
+            seeds.update(neighbor for neighbor, _ in adjacent[index])
+        heap = []
+        touched = set(invalid)
+        for index in seeds:
+            if costs[codes[index]] is None and index != target:
+                distances[index] = UNREACHABLE
+                continue
+            best = 0 if index == target else UNREACHABLE
+            for neighbor, _ in adjacent[index]:
+                cost = costs[codes[neighbor]]
+                if neighbor == target:
+                    cost = cost or 1
+                if cost is not None and distances[neighbor] + cost < best:
+                    best = distances[neighbor] + cost
+            if best < distances[index] or index in invalid:
+                distances[index] = best
+                touched.add(index)
+                if best < UNREACHABLE:
+                    heap.append((best, index))
+        heapq.heapify(heap)
+        if len(touched) > limit or not self._propagate(heap, touched, limit):
+            # 代价变低时距离的变化可能扩散到大半张地图（例如拆掉基地周围的钢墙）
+            self.compute()
+            self.repaired_tiles = len(codes)
+            return
+
+        # 距离变化的格子及其邻格、代价变化格子的邻格需要重新确定方向
+        around = set(touched)
+        around.update(seeds)
+        for index in touched:
+            around.update(neighbor for neighbor, _ in adjacent[index])
+        self._update_directions(around)
+        self.repaired_tiles = len(touched)
+
+    def distance_at(self, col, row):
+        """格子到目标的代价，无法到达或在地图外时返回 UNREACHABLE"""
+        self.update()
+        if not self.tile_map.in_bounds(col, row) or not self.distances:
+            return UNREACHABLE
+        return self.distances[row * self.tile_map.width + col]
+
+    def direction_at(self, col, row):
+        """从格子出发沿最短路径走的方向，没有路径时返回 None"""
+        self.update()
+        if not self.tile_map.in_bounds(col, row) or not self.directions:
+            return None
+        return self.directions[row * self.tile_map.width + col]
+
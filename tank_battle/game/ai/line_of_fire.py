@@ -0,0 +1,65 @@
+from itertools import accumulate
+from ..tile_map import EMPTY, GRASS
+
+
+def prefix_counts(codes):
+    """一行或一列格子中阻挡子弹（除空地和草地以外）的格子数的前缀和"""
+    return list(accumulate((code != EMPTY and code != GRASS for code in codes), initial=0))
+
+
+class LineOfFire:
+    """每行、每列阻挡子弹的格子数的前缀和表，用于 O(1) 判断射线是否畅通
+
+    rows[row][col] 是这一行第 0 ~ col-1 格中阻挡子弹的格子数，cols 同理。
+    和流场一样，地形变化时只记下变化的行和列，下一次查询时再重建。
+    """
+    def __init__(self, tile_map):
+        self.tile_map = tile_map
+        self.dirty = True
+        self.changed_rows = set()
+        self.changed_cols = set()
+        self.rows = []
+        self.cols = []
+        tile_map.add_listener(self.on_tiles_changed)
+
+    def on_tiles_changed(self, tiles):
+        """地形变化回调：记下变化的行和列，None 表示整张地图"""
+        if tiles is None:
+            self.dirty = True
+        elif not self.dirty:
+            for col, row in tiles:
+                self.changed_rows.add(row)
+                self.changed_cols.add(col)
+
+    def update(self):
+        """重建上次查询之后变化过的行和列"""
+        codes = self.tile_map.codes
+        if self.dirty:
+            self.rows = [prefix_counts(row) for row in codes.tolist()]
+            self.cols = [prefix_counts(col) for col in codes.T.tolist()]
+            self.dirty = False
+        else:
+            for row in self.changed_rows:
+                self.rows[row] = prefix_counts(codes[row].tolist())
+            for col in self.changed_cols:
+                self.cols[col] = prefix_counts(codes[:, col].tolist())
+        self.changed_rows.clear()
+        self.changed_cols.clear()
+
+    def clear_between(self, col0, row0, col1, row1):
+        """两个格子在同一行或同一列，且之间（不含两端）没有阻挡子弹的格子"""
+        if self.dirty or self.changed_rows or self.changed_cols:
+            self.update()
+        if not (self.tile_map.in_bounds(col0, row0) and self.tile_map.in_bounds(col1, row1)):
+            return False
+        if row0 == row1:
+            prefix = self.rows[row0]
+            low, high = min(col0, col1), max(col0, col1)
+        elif col0 == col1:
+            prefix = self.cols[col0]
+            low, high = min(row0, row1), max(row0, row1)
+        else:
+            return False
+        if high - low < 2:
+            return True
+        return prefix[high] == prefix[low + 1]
@@ -0,0 +1,63 @@
+import time
+from ..config import Config
+
+
+class AIScheduler:
+    """把敌人的决策（Tank.think）分散到多帧执行
+
+    每帧让最久没有决策的坦克优先，最多 thinks_per_frame 辆重新决策，
+    其余坦克继续执行上次的决策（轮流进行）。budget_us 不为 None 时，
+    本帧的决策用时超过预算后停止（至少决策一辆）；这取决于机器速度，
+    回放和快照不能再精确复现，所以默认关闭。
+    """
+    def __init__(self, thinks_per_frame=Config.AI_THINKS_PER_FRAME,
+                 budget_us=Config.AI_THINK_BUDGET_US):
+        self.thinks_per_frame = thinks_per_frame
+        self.budget_us = budget_us
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """清零统计数据"""
+        self.frames = 0
+        self.thinks = 0
+        self.skipped = 0  # 各帧没有轮到决策的坦克数之和
+        self.latency_total = 0  # 相邻两次决策间隔的帧数之和
+        self.latency_count = 0
+        self.max_latency = 0
+        self.think_time = 0.0  # 决策总用时（秒）
+
+    def run(self, tanks, frame):
+        """为本帧轮到的坦克决策，返回决策的坦克数"""
+        pending = sorted(tanks, key=lambda tank: tank.last_think)
+        limit = len(pending)
+        if self.thinks_per_frame is not None:
+            limit = min(limit, self.thinks_per_frame)
+        budget = None if self.budget_us is None else self.budget_us / 1e6
+        start = time.perf_counter()
+        count = 0
+        for tank in pending[:limit]:
+            if count and budget is not None and time.perf_counter() - start >= budget:
+                break
+            if tank.last_think >= 0:
+                latency = frame - tank.last_think
+                self.latency_total += latency
+                self.latency_count += 1
+                self.max_latency = max(self.max_latency, latency)
+            tank.think(frame)
+            count += 1
+        self.think_time += time.perf_counter() - start
+        self.frames += 1
+        self.thinks += count
+        self.skipped += len(pending) - count
+        return count
+
+    def metrics(self):
+        """统计数据：决策次数、跳过次数、决策间隔（帧）和每次决策的平均用时（微秒）"""
+        return {
+            'frames': self.frames,
+            'thinks': self.thinks,
+            'skipped': self.skipped,
+            'mean_latency': self.latency_total / max(self.latency_count, 1),
+            'max_latency': self.max_latency,
+            'mean_think_us': self.think_time / max(self.thinks, 1) * 1e6,
+        }
@@ -0,0 +1,243 @@
+import numpy as np
+import pygame
+from .config import Config
+from .tile_map import EMPTY, GRASS
+from .sprites.bullet import DIRECTION_VECTORS, HIT_TANK, sweep_bullet, damage_terrain
+
+# 子弹所属阵营
+SIDE_PLAYER = 0
+SIDE_ENEMY = 1
+SIDE_NAMES = ('player', 'enemy')
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
+
+class BulletView:
+    """子弹的只读精灵视图，用于绘制和调试"""
+    __slots__ = ('image', 'rect', 'tank_type', 'direction')
+
+    def __init__(self, image, rect, tank_type, direction):
+        self.image = image
+        self.rect = rect
+        self.tank_type = tank_type
+        self.direction = direction
+
+
+class BulletSystem:
+    """子弹系统：用结构数组（SoA）保存所有子弹并批量更新
+
+    行为与 sprites/bullet.py 中的扫掠碰撞一致：先用向量化运算筛出本帧
+    可能命中地形或坦克的子弹，只有这些子弹逐个走精确的扫掠判定，
+    其余子弹整体移动并剔除飞出屏幕的子弹。
+    """
+    def __init__(self, game_manager, capacity=256):
+        self.game_manager = game_manager
+        self.width = Config.BULLET_SIZE
+        self.height = Config.BULLET_SIZE
+        self.frame = 0
+        self._allocate(capacity)
+        self.count = 0  # 已使用的槽位上限
+        self.free_slots = []
+
+        # 每个阵营、方向的子弹图像
+        resource_manager = game_manager.resource_manager
+        self.images = {}
+        for side, tank_type in enumerate(SIDE_NAMES):
+            for index, direction in enumerate(DIRECTIONS):
+                self.images[side, index] = resource_manager.get_image(
+                    'bullet', f'{tank_type}_{direction}')
+
+    def _allocate(self, capacity):
+        """分配（或扩容）子弹数组"""
+        old = getattr(self, 'x', None)
+        self.capacity = capacity
+        arrays = {
+            'x': np.int32, 'y': np.int32, 'vx': np.int32, 'vy': np.int32,
+            'side': np.uint8, 'direction': np.uint8, 'alive': np.bool_,
+            'born': np.int64,
+        }
+        for name, dtype in arrays.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                previous = getattr(self, name)
+                array[:len(previous)] = previous
+            setattr(self, name, array)
+        owners = getattr(self, 'owners', [])
+        self.owners = owners + [None] * (capacity - len(owners))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def clear(self):
+        """移除所有子弹"""
+        self.alive[:] = False
+        self.owners = [None] * self.capacity
+        self.count = 0
+        self.free_slots = []
+
+    def spawn(self, x, y, direction, tank_type, owner, speed=None):
+        """发射一颗子弹，返回槽位编号"""
+        if self.free_slots:
+            index = self.free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._allocate(self.capacity * 2)
+            index = self.count
+            self.count += 1
+
+        if speed is None:
+            speed = Config.PLAYER_BULLET_SPEED if tank_type == 'player' else Config.ENEMY_BULLET_SPEED
+        step_x, step_y = DIRECTION_VECTORS[direction]
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = step_x * speed
+        self.vy[index] = step_y * speed
+        self.side[index] = SIDE_PLAYER if tank_type == 'player' else SIDE_ENEMY
+        self.direction[index] = DIRECTIONS.index(direction)
+        self.alive[index] = True
+        self.born[index] = self.frame  # 本帧发射的子弹下一帧才移动
+        self.owners[index] = owner
+        return index
+
+    def kill(self, index):
+        """移除一颗子弹"""
+        self.alive[index] = False
+        self.owners[index] = None
+        self.free_slots.append(index)
+
+    def update(self, current_time):
+        """批量更新所有子弹"""
+        n = self.count
+        active = np.flatnonzero(self.alive[:n] & (self.born[:n] != self.frame))
+        self.frame += 1
+        if active.size == 0:
+            return
+
+        x = self.x[active]
+        y = self.y[active]
+        vx = self.vx[active]
+        vy = self.vy[active]
+        side = self.side[active]
+
+        # 本帧的扫掠矩形 [left, right) x [top, bottom)
+        left = np.minimum(x, x + vx)
+        right = np.maximum(x, x + vx) + self.width
+        top = np.minimum(y, y + vy)
+        bottom = np.maximum(y, y + vy) + self.height
+
+        candidates = self._terrain_candidates(left, right, top, bottom)
+        candidates |= self._tank_candidates(left, right, top, bottom, side)
+
+        # 没有可能命中的子弹整体移动，并剔除飞出屏幕的子弹
+        movers = active[~candidates]
+        self.x[movers] += self.vx[movers]
+        self.y[movers] += self.vy[movers]
+        self._cull(movers)
+
+        # 可能命中的子弹逐个做精确的扫掠判定
+        for index in active[candidates]:
+            self._resolve(int(index), current_time)
+
+    def _terrain_candidates(self, left, right, top, bottom):
+        """筛出扫掠矩形覆盖了阻挡地形的子弹"""
+        tile_map = self.game_manager.tile_map
+        size = tile_map.tile_size
+        codes = tile_map.codes
+        blocking = (codes != EMPTY) & (codes != GRASS)
+
+        col_start = left // size
+        col_end = (right - 1) // size
+        row_start = top // size
+        row_end = (bottom - 1) // size
+
+        # 扫掠范围最多跨两个格子时，检查四个角所在的格子即可覆盖全部
+        hit = (col_end - col_start > 1) | (row_end - row_start > 1)
+        for cols, rows in ((col_start, row_start), (col_end, row_start),
+                           (col_start, row_end), (col_end, row_end)):
+            inside = (cols >= 0) & (cols < tile_map.width) & (rows >= 0) & (rows < tile_map.height)
+            safe_cols = np.clip(cols, 0, tile_map.width - 1)
+            safe_rows = np.clip(rows, 0, tile_map.height - 1)
+            hit |= inside & blocking[safe_rows, safe_cols]
+        return hit
+
+    def _tank_candidates(self, left, right, top, bottom, side):
+        """筛出扫掠矩形与对方坦克重叠的子弹"""
+        game_manager = self.game_manager
+        tanks = game_manager.player_group.sprites() + game_manager.enemy_group.sprites()
+        if not tanks:
+            return np.zeros(left.shape, dtype=np.bool_)
+        rects = np.array([(t.rect.left, t.rect.right, t.rect.top, t.rect.bottom) for t in tanks],
+                         dtype=np.int32)
+        tank_side = np.array([SIDE_PLAYER if t.tank_type == 'player' else SIDE_ENEMY for t in tanks],
+                             dtype=np.uint8)
+        overlap = ((left[:, None] < rects[None, :, 1]) & (right[:, None] > rects[None, :, 0]) &
+                   (top[:, None] < rects[None, :, 3]) & (bottom[:, None] > rects[None, :, 2]) &
+                   (side[:, None] != tank_side[None, :]))
+        return overlap.any(axis=1)
+
+    def _cull(self, indices):
+        """移除完全飞出屏幕的子弹"""
+        if indices.size == 0:
+            return
+        x = self.x[indices]
+        y = self.y[indices]
+        off = ((y + self.height < 0) | (y > Config.SCREEN_HEIGHT) |
+               (x + self.width < 0) | (x > Config.SCREEN_WIDTH))
+        for index in indices[off]:
+            self.kill(int(index))
+
+    def _resolve(self, index, current_time):
+        """对单颗子弹做精确扫掠判定（与 Bullet.update_swept 相同的规则）"""
+        if not self.alive[index]:
+            return
+        game_manager = self.game_manager
+        rect = pygame.Rect(int(self.x[index]), int(self.y[index]), self.width, self.height)
+        dx = int(self.vx[index])
+        dy = int(self.vy[index])
+        tank_type = SIDE_NAMES[self.side[index]]
+        for _, kind, target in sweep_bullet(game_manager, rect, dx, dy, tank_type):
+            if kind == HIT_TANK:
+                # 护盾有效时子弹穿过坦克继续飞行
+                if target.hit(current_time):
+                    self.kill(index)
+                    return
+            else:
+                damage_terrain(game_manager, target)
+                self.kill(index)
+                return
+
+        self.x[index] += dx
+        self.y[index] += dy
+        self._cull(np.array([index]))
+
+    def sprites(self, alpha=0.0):
+        """返回所有存活子弹的精灵视图
+
+        alpha 不为 0 时把位置插值到上一步和当前步之间（上一步刚发射、
+        还没有移动过的子弹保持原位）。
+        """
+        views = []
+        back = 1.0 - alpha if alpha else 0.0
+        for index in np.flatnonzero(self.alive[:self.count]):
+            image = self.images[self.side[index], self.direction[index]]
+            x = int(self.x[index])
+            y = int(self.y[index])
+            if back and self.born[index] != self.frame - 1:
+                x -= round(int(self.vx[index]) * back)
+                y -= round(int(self.vy[index]) * back)
+            rect = pygame.Rect(x, y, self.width, self.height)
+            views.append(BulletView(image, rect, SIDE_NAMES[self.side[index]],
+                                    DIRECTIONS[self.direction[index]]))
+        return views
+
+    def draw(self, surface):
+        """绘制所有存活的子弹"""
+        indices = np.flatnonzero(self.alive[:self.count])
+        if indices.size == 0:
+            return
+        images = self.images
+        surface.blits([(images[side, direction], (x, y))
+                       for side, direction, x, y in zip(self.side[indices].tolist(),
+                                                        self.direction[indices].tolist(),
+                                                        self.x[indices].tolist(),
+                                                        self.y[indices].tolist())],
+                      doreturn=False)
@@ -1,14 +1,34 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+
 class Config:
     """游戏配置"""
+    # 调试模式（设置环境变量 TANK_BATTLE_DEBUG=1 开启）
+    DEBUG = os.environ.get('TANK_BATTLE_DEBUG', '') not in ('', '0')
+    
+    # 游戏种子（None 表示每局随机；设置环境变量 TANK_BATTLE_SEED 可复现一局游戏）
+    GAME_SEED = int(os.environ['TANK_BATTLE_SEED']) if os.environ.get('TANK_BATTLE_SEED') else None
+    
+    # 回放录制（设置环境变量 TANK_BATTLE_REPLAY_DIR 后每局游戏都会录制到该目录）
+    REPLAY_DIR = os.environ.get('TANK_BATTLE_REPLAY_DIR') or None
+    REPLAY_KEYFRAME_SECONDS = 10  # 关键帧间隔（秒），用于快速跳转
+    
     # 屏幕设置
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
     WINDOW_WIDTH = SCREEN_WIDTH + 150  # 增加HUD显示区域
     WINDOW_HEIGHT = SCREEN_HEIGHT
-    FPS = 60
+    FPS = 60  # 模拟频率（每秒步数），所有速度都以每步的像素数计
+    SIM_CLOCK_MODE = 'realtime'  # 模拟时钟模式：realtime、fixed 或 fast_forward
+    RENDER_FPS = 144  # 实时模式下的渲染帧率上限，0 表示不限制
+    MAX_CATCH_UP_STEPS = 5  # 每个渲染帧最多补跑的模拟步数
+    FRAME_SPIN_MS = 2  # 等待下一帧时只在最后这几毫秒忙等，其余时间睡眠
+    DIRTY_RECT_RENDERING = True  # 缓存地形层并只刷新变化的区域
+    USE_TEXTURE_ATLAS = True  # 把所有图像打包成转换为显示格式的图集
+    LAZY_ASSET_LOADING = True  # 图像首次使用时才生成，菜单界面期间在后台预热
+    ASSET_WARM_UP_BUDGET_MS = 4  # 菜单界面每帧用于预热图像的时间（毫秒）
     
     # 颜色设置
     BLACK = (0, 0, 0)
@@ -100,31 +120,44 @@ class Config:
             'bullet_speed': 8,
             'shoot_delay': 1000,
             'health': 1,
-            'points': 100
+            'points': 100,
+            'path_weight': 0.15  # 每到一个新格子时沿流场走向基地的概率
         },
         'fast': {
             'speed': 6,
             'bullet_speed': 10,
             'shoot_delay': 1200,
             'health': 1,
-            'points': 200
+            'points': 200,
+            'path_weight': 0.1
         },
         'heavy': {
             'speed': 2,
             'bullet_speed': 6,
             'shoot_delay': 1500,
             'health': 3,
-            'points': 300
+            'points': 300,
+            'path_weight': 0.25
         },
         'elite': {
             'speed': 4,
             'bullet_speed': 12,
             'shoot_delay': 800,
             'health': 2,
-            'points': 500
+            'points': 500,
+            'path_weight': 0.3
         }
     }
     
+    # 寻路设置
+    ENEMY_PATHFINDING = True  # 敌人沿通往基地的流场移动（False 时为随机游走）
+    FLOW_BRICK_COST = 4  # 流场中穿过砖墙的代价（需要先把砖墙打掉）
+    ENEMY_LINE_OF_FIRE = True  # 敌人只在能打到玩家或基地时射击（False 时每帧 5% 概率随机射击）
+    
+    # AI 调度设置（敌人的决策分散到多帧，其余帧继续执行上次的决策）
+    AI_THINKS_PER_FRAME = 2  # 每帧最多几辆敌人坦克重新决策（None 表示全部）
+    AI_THINK_BUDGET_US = None  # 每帧决策的时间预算（微秒）；与机器速度有关，设置后回放和快照不能精确复现
+    
     # 地形设置
     TERRAIN_TYPES = {
         'brick': {
@@ -169,6 +202,12 @@ class Config:
     
     # 碰撞设置
     TANK_SPACING = TANK_SIZE + 10  # 坦克之间的最小间距
+    SWEPT_BULLET_COLLISION = True  # 子弹使用沿网格扫掠的碰撞检测（防止高速穿透）
+    USE_BULLET_SYSTEM = False  # 使用 NumPy 批量子弹系统代替子弹精灵
+    
+    # 对象池设置（空闲实例的上限，0 表示不重复使用）
+    BULLET_POOL_SIZE = 64
+    POWERUP_POOL_SIZE = 8
     
     # 道具类型
     POWERUP_TYPES = {
@@ -0,0 +1,107 @@
+import logging
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+# 会返回新 Surface 的 Surface 方法（在计数子类中统计）
+SURFACE_METHODS = ('copy', 'subsurface', 'convert', 'convert_alpha')
+
+
+class SurfaceAllocationCounter:
+    """调试用：统计每帧创建的 pygame.Surface 数量
+
+    install() 会把 pygame.Surface 和 pygame.font.Font 替换为带计数的子类，
+    并包装 pygame.transform 中返回 Surface 的函数，只应在调试模式
+    （Config.DEBUG）下使用。统计的来源：
+
+    - pygame.Surface(...)，以及这些 Surface 的 copy/subsurface/convert 等
+    - pygame.transform.*（返回 Surface 时）
+    - install() 之后创建的字体的 render()
+    - watch() 登记的 TextCache 的未命中次数（每次未命中渲染一次文字），
+      用来覆盖 install() 之前创建的字体
+
+    pygame 的 C 类型不能修改，install() 之前创建的 Surface（例如加载的
+    图像）调用 copy() 等方法不会被统计；install() 之后创建的字体经过登记的
+    TextCache 渲染时会统计两次（只会多算，不会漏算）。
+    """
+    def __init__(self):
+        self.total = 0  # 通过 Surface、transform 和字体创建的数量
+        self.frame_start = 0
+        self.last_frame = 0
+        self.frames = 0
+        self.allocating_frames = 0
+        self.text_caches = []
+        self._originals = None
+
+    def watch(self, text_cache):
+        """把文字缓存的未命中（每次渲染一个新 Surface）计入统计"""
+        if text_cache not in self.text_caches:
+            self.text_caches.append(text_cache)
+
+    def count(self):
+        """到目前为止统计到的 Surface 创建次数"""
+        return self.total + sum(cache.misses for cache in self.text_caches)
+
+    def install(self):
+        """开始统计"""
+        if self._originals is not None:
+            return
+        counter = self
+        surface_class = pygame.Surface
+        font_class = pygame.font.Font
+
+        def counted(function):
+            def wrapper(*args, **kwargs):
+                result = function(*args, **kwargs)
+                if isinstance(result, surface_class):
+                    counter.total += 1
+                return result
+            return wrapper
+
+        class CountingSurface(surface_class):
+            def __init__(self, *args, **kwargs):
+                counter.total += 1
+                super().__init__(*args, **kwargs)
+
+        for name in SURFACE_METHODS:
+            setattr(CountingSurface, name, counted(getattr(surface_class, name)))
+
+        class CountingFont(font_class):
+            render = counted(font_class.render)
+
+        self._originals = {'Surface': surface_class, 'Font': font_class, 'transform': {}}
+        pygame.Surface = CountingSurface
+        pygame.font.Font = CountingFont
+        for name in dir(pygame.transform):
+            function = getattr(pygame.transform, name)
+            if not name.startswith('_') and callable(function):
+                self._originals['transform'][name] = function
+                setattr(pygame.transform, name, counted(function))
+
+    def uninstall(self):
+        """停止统计，恢复 pygame.Surface、pygame.font.Font 和 pygame.transform"""
+        if self._originals is not None:
+            pygame.Surface = self._originals['Surface']
+            pygame.font.Font = self._originals['Font']
+            for name, function in self._originals['transform'].items():
+                setattr(pygame.transform, name, function)
+            self._originals = None
+
+    def begin_frame(self):
+        """标记一帧的开始"""
+        self.frame_start = self.count()
+
+    def end_frame(self, steady=True):
+        """标记一帧的结束，返回本帧创建的 Surface 数量
+
+        steady 表示本帧处于稳定的游戏过程中（而不是切换界面或关卡），
+        这种帧里出现的分配会记录警告日志。
+        """
+        self.last_frame = self.count() - self.frame_start
+        self.frames += 1
+        if self.last_frame:
+            self.allocating_frames += 1
+            if steady:
+                logger.warning(f"第{self.frames}帧创建了{self.last_frame}个Surface")
+        return self.last_frame
@@ -1,18 +1,53 @@
-from .sprites.tank import Tank
+from .sprites.tank import Tank, POWERUP_TIMERS
 from .sprites.terrain import Terrain
 from .ui.button import Button
+from .ui.hud import Hud
+from .ui.text_cache import TextCache
 from .config import Config
-from .resources.resource_manager import ResourceManager
 from .sprites.powerup import PowerUp
+from .sprites.bullet import Bullet
+from .tile_map import TileMap
+from .spatial_hash import SpatialHash
+from .sprite_pool import SpritePool
+from .bullet_system import BulletSystem
+from .ai.flow_field import FlowField
+from .ai.line_of_fire import LineOfFire
+from .ai.scheduler import AIScheduler
+from .renderer import DirtyRenderer, blit_sprites
+from .debug import SurfaceAllocationCounter
+from .sim_clock import SimClock, FAST_FORWARD
+from .timers import TimerQueue
+from .rng import RandomStreams
+from .replay import Replay, ReplayRecorder
+from . import actions, snapshot
+import logging
+import os
 import pygame
-import random
+import time
+
+logger = logging.getLogger(__name__)
 
 class GameManager:
-    def __init__(self, screen, resource_manager):
-        """初始化游戏管理器"""
+    def __init__(self, screen, resource_manager, headless=False):
+        """初始化游戏管理器
+
+        headless 为 True 时不绘制任何画面（screen 可以为 None），
+        通过 reset() / step() 以固定步长快速推进模拟。
+        """
         self.screen = screen
         self.resource_manager = resource_manager
-        self.clock = pygame.time.Clock()
+        self.headless = headless
+        # 模拟时钟：游戏逻辑的唯一时间来源
+        self.sim_clock = SimClock(FAST_FORWARD if headless else Config.SIM_CLOCK_MODE)
+        # 按子系统划分的随机数流，每局游戏用一个种子重新初始化
+        self.rng = RandomStreams(Config.GAME_SEED)
+        # 道具到期、基地加固结束和敌人生成等定时事件（按模拟时间触发）
+        self.timers = TimerQueue()
+        self.timers.register('enemy_spawn', self.on_enemy_spawn_due)
+        self.timers.register('base_shield_end', lambda key, now: self.update_base_shield(now))
+        for name in POWERUP_TIMERS.values():
+            self.timers.register(name, lambda tank, now: tank.update_powerups(now))
+        self.timers.register('powerup_expire', self.on_powerup_expire)
         self.running = True
         self.game_state = 'MENU'  # MENU, PLAYING, GAME_OVER
         
@@ -22,6 +57,16 @@ class GameManager:
         self.lives = Config.PLAYER_LIVES
         self.enemies_remaining = Config.ENEMIES_PER_LEVEL
         self.last_enemy_spawn = 0
+        self.enemy_spawn_ready = False  # 生成间隔已过，等待屏幕上有空位
+        
+        # step() 注入的玩家动作（位标志），为 None 时读取键盘
+        self.player_actions = None
+        # 上一模拟步的精灵位置（用于插值渲染）
+        self.previous_positions = {}
+        
+        # 回放录制与播放
+        self.recorder = None
+        self.replay = None
         
         # 创建精灵组
         self.all_sprites = pygame.sprite.Group()
@@ -31,6 +76,36 @@ class GameManager:
         self.terrain_group = pygame.sprite.Group()
         self.powerup_group = pygame.sprite.Group()
         
+        # 地形网格，用于快速查询地形碰撞
+        self.tile_map = TileMap()
+        
+        # 坦克粗检测空间哈希，每帧重建一次
+        self.tank_hash = SpatialHash(Config.TILE_SIZE * 2)
+        
+        # 敌人共享的通往基地的流场（地形变化后重新计算）
+        self.flow_field = FlowField(self.tile_map)
+        
+        # 每行、每列阻挡子弹的格子数，用于判断敌人能否打到目标
+        self.line_of_fire = LineOfFire(self.tile_map)
+        
+        # 把敌人的决策分散到多帧的调度器
+        self.ai_scheduler = AIScheduler()
+        
+        # 子弹和道具的对象池（每帧结束时回收本帧移除的精灵）
+        self.bullet_pool = SpritePool(Bullet, Config.BULLET_POOL_SIZE)
+        self.powerup_pool = SpritePool(PowerUp, Config.POWERUP_POOL_SIZE)
+        
+        # 可选的批量子弹系统
+        self.bullet_system = BulletSystem(self) if Config.USE_BULLET_SYSTEM else None
+        
+        # 脏矩形渲染器（缓存地形层）
+        self.renderer = None
+        if Config.DIRTY_RECT_RENDERING and not headless:
+            self.renderer = DirtyRenderer(self.screen, self.tile_map, self.resource_manager)
+        
+        # 文字渲染缓存（HUD、按钮和各界面共用）
+        self.text_cache = TextCache()
+        
         # ���建按钮
         button_width = 200
         button_height = 50
@@ -41,21 +116,16 @@ class GameManager:
         self.start_button = Button(
             button_x, start_y, button_width, button_height,
             "开始游戏", self.start_game,
-            self.resource_manager.fonts['medium']
+            self.resource_manager.fonts['medium'], self.text_cache
         )
         self.quit_button = Button(
             button_x, quit_y, button_width, button_height,
             "退出游戏", self.quit_game,
-            self.resource_manager.fonts['medium']
+            self.resource_manager.fonts['medium'], self.text_cache
         )
         
-        # 尝试加载中文字体，如果失败则使用默认字体
-        try:
-            self.font_path = "C:/Windows/Fonts/msyh.ttc"  # 微软雅黑
-            # 测试字体是否可用
-            test_font = pygame.font.Font(self.font_path, 12)
-        except:
-            self.font_path = pygame.font.get_default_font()
+        # 使用资源管理器选好的字体（没有中文字体时为 None，即默认字体）
+        self.font_path = self.resource_manager.font_path
             
         # 初始化字体
         self.font = pygame.font.Font(self.font_path, 36)
@@ -70,7 +140,8 @@ class GameManager:
             button_height,
             '重新开始',
             lambda: self.restart_game(),  # 使用lambda避免立即调用
-            button_font
+            button_font,
+            self.text_cache
         )
         
         self.menu_button = Button(
@@ -80,13 +151,25 @@ class GameManager:
             button_height,
             '返回菜单',
             lambda: self.return_to_menu(),  # 使用lambda避免立即调用
-            button_font
+            button_font,
+            self.text_cache
         )
         
+        # HUD面板（数值变化时才重新绘制）
+        self.hud = Hud(self.resource_manager.fonts['small'], self.text_cache)
+        
         self.game_over = False
         self.game_over_reason = None
         self.base_shield_end_time = 0  # 添加基地加固结束时间
         self.base_walls = []  # 存储基地周围的墙
+        self.overlay = None  # 游戏结束遮罩（首次使用时创建）
+        
+        # 调试模式下统计每帧的Surface分配
+        self.allocation_counter = None
+        if Config.DEBUG:
+            self.allocation_counter = SurfaceAllocationCounter()
+            self.allocation_counter.install()
+            self.allocation_counter.watch(self.text_cache)
         
     def restart_game(self):
         """重新开始游戏"""
@@ -101,8 +184,21 @@ class GameManager:
         self.game_state = 'MENU'
         self.clear_all_sprites()
         
-    def start_game(self):
-        """开始新游戏"""
+    def start_game(self, seed=None):
+        """开始新游戏
+
+        seed 为 None 时使用 Config.GAME_SEED，两者都为 None 时随机生成。
+        种子会写入日志，用于复现整局游戏。
+        """
+        # 懒加载模式下菜单期间可能还没预热完，开始前加载剩余图像
+        self.resource_manager.warm_up()
+        self.sim_clock.reset()
+        # 时钟归零，上一局没有到期的事件（包括基地加固）一并取消
+        self.timers.clear()
+        self.base_shield_end_time = 0
+        self.stop_recording()
+        seed = self.rng.reseed(seed if seed is not None else Config.GAME_SEED)
+        logger.info(f"Game seed: {seed}")
         self.clear_all_sprites()
         self.game_state = 'PLAYING'
         self.score = 0
@@ -110,6 +206,35 @@ class GameManager:
         self.lives = Config.PLAYER_LIVES
         self.enemies_remaining = Config.ENEMIES_PER_LEVEL
         self.init_level()
+        if Config.REPLAY_DIR:
+            self.start_recording(os.path.join(
+                Config.REPLAY_DIR, f'replay-{seed}-{time.strftime("%Y%m%d-%H%M%S")}.tbr'))
+
+    def start_recording(self, path, keyframe_interval=None):
+        """开始把本局游戏录制为回放文件"""
+        self.stop_recording()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.recorder = ReplayRecorder(path, self.rng.seed, keyframe_interval)
+        logger.info(f"Recording replay: {path}")
+        
+    def stop_recording(self):
+        """结束录制并写完回放文件"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+            
+    def play_replay(self, path):
+        """在窗口模式下播放回放文件（播放结束后恢复键盘操作）"""
+        self.replay = Replay(path)
+        self.replay.start(self)
+
+    def snapshot(self):
+        """把当前游戏状态打包为字节串（用于存档和回滚）"""
+        return snapshot.capture(self)
+
+    def restore(self, data):
+        """恢复 snapshot() 保存的游戏状态"""
+        snapshot.restore(self, data)
 
     def init_level(self):
         """初始化关卡"""
@@ -133,7 +258,7 @@ class GameManager:
         self.create_initial_enemies(level_config)
         
         # 开始定期生成敌人
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.schedule_enemy_spawn(self.sim_clock.now)
         
     def create_player(self, respawn=False):
         """创建玩家坦克"""
@@ -152,10 +277,11 @@ class GameManager:
         
         # 如果是复活，给予短暂的无敌时间
         if respawn:
-            player.shield_end_time = pygame.time.get_ticks() + Config.INITIAL_SHIELD_DURATION
+            player.set_timer('shield_end_time', self.sim_clock.now + Config.INITIAL_SHIELD_DURATION)
             
         self.player_group.add(player)
         self.all_sprites.add(player)
+        self.tank_hash.insert(player)
         
     def check_tank_collision(self, tank, x, y):
         """检查坦克碰撞"""
@@ -168,14 +294,13 @@ class GameManager:
             return True
             
         # 检查与其他坦克的碰撞
-        for other_tank in self.player_group.sprites() + self.enemy_group.sprites():
-            if other_tank != tank and other_tank.rect.colliderect(temp_rect):
+        for other_tank in self.tank_hash.query(temp_rect):
+            if other_tank is not tank:
                 return True
                 
         # 检查与地形的碰撞（除了草地）
-        for terrain in self.terrain_group:
-            if terrain.type != 'grass' and terrain.rect.colliderect(temp_rect):
-                return True
+        if self.tile_map.blocks_tank(temp_rect):
+            return True
                 
         return False
         
@@ -193,31 +318,22 @@ class GameManager:
             # 尝试找到合适的生成位置
             for _ in range(max_attempts_per_enemy):
                 # 随机选择生成位置
-                x = random.randint(0, Config.GRID_WIDTH - 1) * Config.TILE_SIZE
+                x = self.rng.spawn.randint(0, Config.GRID_WIDTH - 1) * Config.TILE_SIZE
                 y = 0
                 
                 # 创建临时矩形用于碰撞检测
                 temp_rect = pygame.Rect(x, y, Config.TANK_SIZE, Config.TANK_SIZE)
                 
                 # 检查是否与地形碰撞（除了草地）
-                collision = False
-                for terrain in self.terrain_group:
-                    if terrain.type != 'grass' and terrain.rect.colliderect(temp_rect):
-                        collision = True
-                        break
+                collision = self.tile_map.blocks_tank(temp_rect)
                         
                 # 检查是否与其他坦克碰撞
-                if not collision:
-                    for tank in self.player_group.sprites() + self.enemy_group.sprites():
-                        if tank.rect.colliderect(temp_rect):
-                            collision = True
-                            break
+                if not collision and self.tank_hash.query(temp_rect):
+                    collision = True
                 
                 # 如果没有碰撞，创建敌人
                 if not collision:
-                    enemy = Tank(x, y, self.resource_manager, enemy_type, self)
-                    self.enemy_group.add(enemy)
-                    self.all_sprites.add(enemy)
+                    self.create_enemy(x, y, enemy_type)
                     enemies_created += 1
                     break
                 
@@ -225,7 +341,7 @@ class GameManager:
         """根据权重选择敌人类型"""
         types = list(type_weights.keys())
         weights = list(type_weights.values())
-        return random.choices(types, weights=weights)[0]
+        return self.rng.spawn.choices(types, weights=weights)[0]
         
     def create_enemy(self, x, y, enemy_type):
         """���建敌人坦克"""
@@ -238,6 +354,8 @@ class GameManager:
         )
         self.enemy_group.add(enemy)
         self.all_sprites.add(enemy)
+        self.tank_hash.insert(enemy)
+        return enemy
         
     def create_base(self):
         """创建基地"""
@@ -246,9 +364,8 @@ class GameManager:
         y = (Config.GRID_HEIGHT - 1) * Config.TILE_SIZE
         
         # 创建基地
-        self.base = Terrain(x, y, 'base', self.resource_manager)
-        self.terrain_group.add(self.base)
-        self.all_sprites.add(self.base)
+        self.base = self.add_terrain(x, y, 'base')
+        self.flow_field.set_target(x // Config.TILE_SIZE, y // Config.TILE_SIZE)
         
         # 创建基地周围的砖墙保护
         wall_positions = [
@@ -261,15 +378,24 @@ class GameManager:
         
         self.base_walls = []  # 清空原有的墙列表
         for wall_x, wall_y in wall_positions:
-            wall = Terrain(wall_x, wall_y, 'brick', self.resource_manager)
-            self.terrain_group.add(wall)
-            self.all_sprites.add(wall)
+            wall = self.add_terrain(wall_x, wall_y, 'brick')
             self.base_walls.append(wall)  # 记录基地周围的墙
             
+    def add_terrain(self, x, y, terrain_type):
+        """在指定位置创建地形并登记到地形网格，替换该格子上原有的地形"""
+        terrain = Terrain(x, y, terrain_type, self.resource_manager)
+        old = self.tile_map.place(terrain)
+        if old is not None:
+            old.kill()
+        self.terrain_group.add(terrain)
+        self.all_sprites.add(terrain)
+        return terrain
+        
     def apply_base_shield(self, current_time):
         """应用基地加固效果"""
         # 设置基地加固结束时间
         self.base_shield_end_time = current_time + Config.BASE_SHIELD_DURATION
+        self.timers.schedule('base_shield_end', self.base_shield_end_time)
         
         # 将基地周围的墙转换为钢铁
         for wall in self.base_walls:
@@ -279,9 +405,7 @@ class GameManager:
                 # 移除原有的墙
                 wall.kill()
                 # 创建新的钢铁墙
-                steel_wall = Terrain(x, y, 'steel', self.resource_manager)
-                self.terrain_group.add(steel_wall)
-                self.all_sprites.add(steel_wall)
+                steel_wall = self.add_terrain(x, y, 'steel')
                 # 更新墙的引用
                 self.base_walls[self.base_walls.index(wall)] = steel_wall
                 
@@ -296,14 +420,27 @@ class GameManager:
                     # 移除钢铁墙
                     wall.kill()
                     # 创建新的砖墙
-                    brick_wall = Terrain(x, y, 'brick', self.resource_manager)
-                    self.terrain_group.add(brick_wall)
-                    self.all_sprites.add(brick_wall)
+                    brick_wall = self.add_terrain(x, y, 'brick')
                     # 更新墙的引用
                     self.base_walls[self.base_walls.index(wall)] = brick_wall
             # 重置结束时间
             self.base_shield_end_time = 0
-            
+
+    def schedule_enemy_spawn(self, current_time):
+        """从 current_time 起重新计算敌人生成间隔，间隔结束时触发 enemy_spawn 事件"""
+        self.last_enemy_spawn = current_time
+        self.enemy_spawn_ready = False
+        self.timers.schedule('enemy_spawn', current_time + Config.ENEMY_SPAWN_DELAY)
+
+    def on_enemy_spawn_due(self, key, current_time):
+        """生成间隔已过，屏幕上有空位且还有敌人时在本帧末尾生成"""
+        self.enemy_spawn_ready = True
+
+    def on_powerup_expire(self, powerup, current_time):
+        """道具存在时间到期后消失（已被拾取的道具不处理）"""
+        if powerup.alive():
+            powerup.kill()
+
     def create_terrain(self, density):
         """创建地形"""
         # 创建基地周围的保护墙
@@ -319,26 +456,7 @@ class GameManager:
             (base_x // Config.TILE_SIZE + 1, base_y // Config.TILE_SIZE - 1), # 右上
         ]
         
-        # 创建基地
-        base = Terrain(
-            base_x,
-            base_y,
-            'base',
-            self.resource_manager
-        )
-        self.terrain_group.add(base)
-        self.all_sprites.add(base)
-        
-        # 创建基地保护墙
-        for grid_x, grid_y in protected_positions:
-            wall = Terrain(
-                grid_x * Config.TILE_SIZE,
-                grid_y * Config.TILE_SIZE,
-                'brick',
-                self.resource_manager
-            )
-            self.terrain_group.add(wall)
-            self.all_sprites.add(wall)
+        # 基地及其保护墙由 create_base 创建
         
         # 创建随机地形
         for y in range(Config.GRID_HEIGHT - 2):  # 减2是为了留出基地区域
@@ -352,19 +470,14 @@ class GameManager:
                     continue
                     
                 # 根据密度随机生成地形
-                if random.random() < density:
-                    terrain_type = random.choice(['brick', 'steel', 'water', 'grass'])
-                    terrain = Terrain(
-                        x * Config.TILE_SIZE,
-                        y * Config.TILE_SIZE,
-                        terrain_type,
-                        self.resource_manager
-                    )
-                    self.terrain_group.add(terrain)
-                    self.all_sprites.add(terrain)
+                if self.rng.terrain.random() < density:
+                    terrain_type = self.rng.terrain.choice(['brick', 'steel', 'water', 'grass'])
+                    self.add_terrain(x * Config.TILE_SIZE, y * Config.TILE_SIZE, terrain_type)
                     
-    def update(self, current_time):
-        """更新游戏状态"""
+    def update(self, current_time=None):
+        """更新游戏状态（current_time 默认为模拟时钟的当前时间）"""
+        if current_time is None:
+            current_time = self.sim_clock.now
         if self.game_over:
             # 游戏结束状态下更新按钮
             self.restart_button.update()
@@ -374,19 +487,36 @@ class GameManager:
         if self.game_state == 'MENU':
             self.start_button.update()
             self.quit_button.update()
+            # 显示菜单的同时分批预热游戏图像
+            self.resource_manager.warm_up(Config.ASSET_WARM_UP_BUDGET_MS)
         elif self.game_state == 'PLAYING':
-            # 更新基地加固状态
-            self.update_base_shield(current_time)
+            # 执行到期的定时事件（道具效果结束、基地加固结束、敌人生成间隔等）
+            self.timers.run_due(current_time)
             
-            # 更新所有精灵
+            # 重建坦克空间哈希（移除已销毁的坦克）
+            self.tank_hash.rebuild(self.player_group.sprites() + self.enemy_group.sprites())
+            
+            # 轮到的敌人重新决策，其余敌人继续执行上次的决策
+            self.ai_scheduler.run(self.enemy_group, self.sim_clock.frame)
+            
+            # 更新所有精灵，子弹在坦克之后统一更新（本帧发射的子弹下一帧才移动）
+            bullets = self.bullet_group.sprites()
             self.all_sprites.update(current_time)
+            if self.bullet_system is not None:
+                self.bullet_system.update(current_time)
+            for bullet in bullets:
+                if bullet.alive():
+                    bullet.update(current_time)
+            
+            # 处理坦克之间的碰撞
+            self.resolve_tank_collisions()
             
             # 检查是否需要生成新敌人
-            if (len(self.enemy_group) < Config.MAX_ENEMIES_ON_SCREEN and 
-                self.enemies_remaining > 0 and 
-                current_time - self.last_enemy_spawn >= Config.ENEMY_SPAWN_DELAY):
+            if (self.enemy_spawn_ready and
+                len(self.enemy_group) < Config.MAX_ENEMIES_ON_SCREEN and 
+                self.enemies_remaining > 0):
                 self.spawn_enemy()
-                self.last_enemy_spawn = current_time
+                self.schedule_enemy_spawn(current_time)
             
             # 检查是否完成关卡
             if self.enemies_remaining <= 0 and len(self.enemy_group) == 0:
@@ -395,11 +525,37 @@ class GameManager:
             # 检查玩家是否失败
             if len(self.player_group) == 0:
                 self.handle_player_death()
+            
+            # 回收本帧移除的子弹和道具
+            self.bullet_pool.flush()
+            self.powerup_pool.flush()
                 
         elif self.game_state == 'GAME_OVER':
             self.restart_button.update()
             self.menu_button.update()
             
+    def resolve_tank_collisions(self):
+        """处理相互重叠的坦克，每对坦克只处理一次"""
+        for tank, other_tank in self.tank_hash.pairs():
+            if not (tank.alive() and other_tank.alive()):
+                continue
+            if (tank.tank_type == 'player') != (other_tank.tank_type == 'player'):
+                # 玩家和敌人相撞，两者都死亡
+                tank.kill()
+                other_tank.kill()
+                for crashed in (tank, other_tank):
+                    if crashed.tank_type == 'player':
+                        self.handle_player_death()
+                    else:
+                        self.handle_enemy_death(crashed)
+            elif tank.tank_type != 'player':
+                # 敌人之间相撞，返回原位置并改变方向
+                for crashed in (tank, other_tank):
+                    crashed.rect.x = crashed.old_x
+                    crashed.rect.y = crashed.old_y
+                    crashed.direction = self.rng.ai.choice(['up', 'down', 'left', 'right'])
+                    self.tank_hash.move(crashed)
+                    
     def spawn_enemy(self):
         """生成敌人"""
         # 获取当前关卡配置
@@ -411,31 +567,22 @@ class GameManager:
         max_attempts = 10  # 最大尝试次数
         for _ in range(max_attempts):
             # 在屏幕��部随机位置生成敌人
-            x = random.randint(0, Config.GRID_WIDTH - 1) * Config.TILE_SIZE
+            x = self.rng.spawn.randint(0, Config.GRID_WIDTH - 1) * Config.TILE_SIZE
             y = 0
             
             # 创建临时矩形用于碰撞检测
             temp_rect = pygame.Rect(x, y, Config.TANK_SIZE, Config.TANK_SIZE)
             
             # 检查是否与地形碰撞（除了草地）
-            collision = False
-            for terrain in self.terrain_group:
-                if terrain.type != 'grass' and terrain.rect.colliderect(temp_rect):
-                    collision = True
-                    break
+            collision = self.tile_map.blocks_tank(temp_rect)
                     
             # 检查是否与其他坦克碰撞
-            if not collision:
-                for tank in self.player_group.sprites() + self.enemy_group.sprites():
-                    if tank.rect.colliderect(temp_rect):
-                        collision = True
-                        break
+            if not collision and self.tank_hash.query(temp_rect):
+                collision = True
             
             # 如果没有碰撞，创建敌人
             if not collision:
-                enemy = Tank(x, y, self.resource_manager, enemy_type, self)
-                self.enemy_group.add(enemy)
-                self.all_sprites.add(enemy)
+                self.create_enemy(x, y, enemy_type)
                 self.enemies_remaining -= 1
                 return True
                 
@@ -447,21 +594,38 @@ class GameManager:
         self.score += Config.POINTS_FOR_LEVEL_UP
         self.current_level += 1
         if self.current_level > Config.MAX_LEVEL:
-            self.game_over(victory=True)
+            self.current_level = Config.MAX_LEVEL
+            self.game_over = True
+            self.game_over_reason = 'victory'
         else:
             self.enemies_remaining = Config.ENEMIES_PER_LEVEL
             self.init_level()
             
     def draw(self):
         """绘制游戏画面"""
+        if self.headless:
+            return
+        if self.renderer is not None:
+            if self.game_state == 'PLAYING' and not self.game_over:
+                # 游戏进行中只刷新变化的区域
+                self.renderer.draw(self.get_render_groups(), self.draw_hud_panel,
+                                   self.previous_positions, self.sim_clock.alpha)
+                return
+            # 其他界面整屏重绘，返回游戏时需要重新铺满背景
+            self.renderer.invalidate()
+            
         self.screen.fill(Config.BLACK)
         
         if self.game_state == 'MENU':
             # 绘制菜单
             self.show_menu()
         elif self.game_state == 'PLAYING' or self.game_over:
-            # 绘制游戏元素
-            self.all_sprites.draw(self.screen)
+            # 绘制游戏元素（与 DirtyRenderer 一样按 alpha 插值移动的精灵）
+            alpha = self.sim_clock.alpha
+            groups = [self.all_sprites, self.bullet_group]
+            if self.bullet_system is not None:
+                groups.append(self.bullet_system.sprites(alpha))
+            blit_sprites(self.screen, groups, self.previous_positions, alpha)
             # 绘制HUD
             self.draw_hud(self.screen)
             
@@ -475,27 +639,50 @@ class GameManager:
             
         pygame.display.flip()
         
+    def record_positions(self):
+        """记录移动精灵在本步之前的位置，渲染时在两步之间插值"""
+        self.previous_positions = {
+            sprite: sprite.rect.topleft
+            for group in (self.player_group, self.enemy_group, self.bullet_group, self.powerup_group)
+            for sprite in group
+        }
+        
+    def get_render_groups(self):
+        """获取需要逐帧绘制的移动精灵（按绘制顺序）"""
+        groups = [self.powerup_group, self.player_group, self.enemy_group, self.bullet_group]
+        if self.bullet_system is not None:
+            groups.append(self.bullet_system.sprites(self.sim_clock.alpha))
+        return groups
+        
+    def draw_hud_panel(self, surface, full):
+        """重绘HUD区域，返回HUD区域是否需要刷新"""
+        return self.hud.draw(surface, self, self.sim_clock.now, force=full)
+        
     def draw_game_over(self, screen):
         """绘制游戏结束画面"""
-        # 创建半透明遮罩
-        overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        # 半透明遮罩只创建一次
+        if self.overlay is None:
+            self.overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            self.overlay.fill((0, 0, 0))
+            self.overlay.set_alpha(128)
+        screen.blit(self.overlay, (0, 0))
         
         # 获取字体
         font = self.resource_manager.get_font('large')
+        render = self.text_cache.render
         
         # 显示游戏结束原因
         if self.game_over_reason == 'base_destroyed':
-            text = font.render('基地被摧毁，游戏结束！', True, Config.WHITE)
+            text = render(font, '基地被摧毁，游戏结束！', Config.WHITE)
         elif self.game_over_reason == 'player_dead':
-            text = font.render('玩家生命耗尽，游戏结束！', True, Config.WHITE)
+            text = render(font, '玩家生命耗尽，游戏结束！', Config.WHITE)
+        elif self.game_over_reason == 'victory':
+            text = render(font, '胜利！', Config.WHITE)
         else:
-            text = font.render('游戏结束！', True, Config.WHITE)
+            text = render(font, '游戏结束！', Config.WHITE)
             
         # 显示得分
-        score_text = font.render(f'最终得分：{self.score}', True, Config.WHITE)
+        score_text = render(font, f'最终得分：{self.score}', Config.WHITE)
         
         # 计算文本位置
         text_rect = text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 30))
@@ -515,7 +702,7 @@ class GameManager:
         self.screen.fill(Config.BLACK)
         
         # 绘制标题
-        title_text = self.title_font.render('坦克大战', True, Config.WHITE)
+        title_text = self.text_cache.render(self.title_font, '坦克大战', Config.WHITE)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 4))
         self.screen.blit(title_text, title_rect)
         
@@ -525,70 +712,7 @@ class GameManager:
         
     def draw_hud(self, surface):
         """绘制HUD（生命值、分数等）"""
-        # 获取字体
-        font = self.resource_manager.fonts['small']
-        
-        # 设置文本颜色
-        text_color = Config.WHITE
-        
-        # 绘制生命数
-        lives_text = font.render(f"生命: {self.lives}", True, text_color)
-        surface.blit(lives_text, (Config.SCREEN_WIDTH + 10, 10))
-        
-        # 绘制分数
-        score_text = font.render(f"分数: {self.score}", True, text_color)
-        surface.blit(score_text, (Config.SCREEN_WIDTH + 10, 40))
-        
-        # 绘制关卡
-        level_text = font.render(f"关卡: {self.current_level}", True, text_color)
-        surface.blit(level_text, (Config.SCREEN_WIDTH + 10, 70))
-        
-        # 绘制剩余敌人数量
-        enemies_text = font.render(f"敌人: {len(self.enemy_group)}", True, text_color)
-        surface.blit(enemies_text, (Config.SCREEN_WIDTH + 10, 100))
-        
-        # 绘制道具状态标题
-        powerup_title = font.render("道具状态:", True, text_color)
-        surface.blit(powerup_title, (Config.SCREEN_WIDTH + 10, 130))
-        
-        # 获取玩家坦克
-        player = next(iter(self.player_group.sprites()), None)
-        current_time = pygame.time.get_ticks()
-        
-        # 定义所有道具类型及其显示名称
-        powerup_types = {
-            'shield': '护盾',
-            'speed': '加速',
-            'rapid_fire': '快射',
-            'base_shield': '基地加固'
-        }
-        
-        # 显示每种道具的状态
-        y_offset = 160  # 起始Y坐标
-        for powerup_type, display_name in powerup_types.items():
-            # 检查道具是否激活
-            is_active = False
-            remaining_time = 0
-            
-            if player:
-                if powerup_type == 'shield' and current_time < player.shield_end_time:
-                    is_active = True
-                    remaining_time = (player.shield_end_time - current_time) // 1000
-                elif powerup_type == 'speed' and current_time < player.speed_boost_end_time:
-                    is_active = True
-                    remaining_time = (player.speed_boost_end_time - current_time) // 1000
-                elif powerup_type == 'rapid_fire' and current_time < player.rapid_fire_end_time:
-                    is_active = True
-                    remaining_time = (player.rapid_fire_end_time - current_time) // 1000
-                elif powerup_type == 'base_shield' and current_time < self.base_shield_end_time:
-                    is_active = True
-                    remaining_time = (self.base_shield_end_time - current_time) // 1000
-            
-            # 显示道具状态
-            status = f"{display_name}: {'激活 (%d秒)' % remaining_time if is_active else '未激活'}"
-            status_text = font.render(status, True, Config.GREEN if is_active else Config.GRAY)
-            surface.blit(status_text, (Config.SCREEN_WIDTH + 10, y_offset))
-            y_offset += 25  # 每个道具状态之间的间距
+        self.hud.draw(surface, self, self.sim_clock.now, force=True)
         
     def show_game_over(self, victory=False):
         """显示游戏结束画面"""
@@ -597,15 +721,15 @@ class GameManager:
         
         # 绘制主要文本
         if victory:
-            main_text = self.title_font.render('胜利！', True, Config.WHITE)
+            main_text = self.text_cache.render(self.title_font, '胜利！', Config.WHITE)
         else:
-            main_text = self.title_font.render('游戏结束', True, Config.WHITE)
+            main_text = self.text_cache.render(self.title_font, '游戏结束', Config.WHITE)
             
         main_rect = main_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 3))
         self.screen.blit(main_text, main_rect)
         
         # 绘制得分
-        score_text = self.font.render(f'得分: {self.score}', True, Config.WHITE)
+        score_text = self.text_cache.render(self.font, f'得分: {self.score}', Config.WHITE)
         score_rect = score_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
         
@@ -625,6 +749,10 @@ class GameManager:
         self.bullet_group.empty()
         self.terrain_group.empty()
         self.powerup_group.empty()
+        self.tile_map.clear()
+        self.tank_hash.clear()
+        if self.bullet_system is not None:
+            self.bullet_system.clear()
         
     def show_victory_screen(self):
         """显示胜利画面"""
@@ -650,17 +778,89 @@ class GameManager:
         enemy.kill()
         
         # 随机掉落道具
-        if random.random() < Config.POWERUP_DROP_CHANCE:
-            powerup_type = random.choice(['shield', 'speed', 'rapid_fire', 'base_shield'])
-            powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery,
-                            powerup_type, self.resource_manager)
+        if self.rng.loot.random() < Config.POWERUP_DROP_CHANCE:
+            powerup_type = self.rng.loot.choice(['shield', 'speed', 'rapid_fire', 'base_shield'])
+            powerup = self.powerup_pool.acquire(enemy.rect.centerx, enemy.rect.centery,
+                                                powerup_type, self.resource_manager,
+                                                self.sim_clock.now)
             self.powerup_group.add(powerup)
             self.all_sprites.add(powerup)
+            self.timers.schedule('powerup_expire', powerup.spawn_time + Config.POWERUP_DURATION,
+                                 powerup)
             
-    def run(self):
-        """运行游戏主循环"""
+    def reset(self, seed=None):
+        """开始新游戏并返回初始观测（用于 step() 驱动的模拟）"""
+        self.game_over = False
+        self.game_over_reason = None
+        self.start_game(seed)
+        return self.get_observation()
+        
+    def step(self, player_actions=0):
+        """按固定步长推进一帧并返回观测
+
+        player_actions 为 game.actions 中的位标志组合。不处理事件、不绘制、
+        不等待，模拟速度只受 CPU 限制。游戏结束后再调用不会继续推进。
+        """
+        self.simulate(player_actions)
+        return self.get_observation()
+        
+    def simulate(self, player_actions):
+        """执行一个模拟步（录制回放时记录输入），游戏未在进行时返回 False"""
+        if self.game_state != 'PLAYING' or self.game_over:
+            return False
+        self.player_actions = player_actions
+        try:
+            self.update(self.sim_clock.advance())
+        finally:
+            self.player_actions = None
+        if self.recorder is not None:
+            self.recorder.record(player_actions, self)
+            if self.game_over:
+                self.stop_recording()
+        return True
+        
+    def get_observation(self):
+        """当前游戏状态的观测（坐标为像素，地形为格子编码数组的副本）"""
+        bullets = self.bullet_group.sprites()
+        if self.bullet_system is not None:
+            bullets += self.bullet_system.sprites()
+        player = next(iter(self.player_group), None)
+        return {
+            'frame': self.sim_clock.frame,
+            'time': self.sim_clock.now,
+            'score': self.score,
+            'lives': self.lives,
+            'level': self.current_level,
+            'enemies_remaining': self.enemies_remaining,
+            'game_over': self.game_over,
+            'game_over_reason': self.game_over_reason,
+            'player': (player.rect.x, player.rect.y, player.direction) if player else None,
+            'enemies': [(enemy.rect.x, enemy.rect.y, enemy.direction, enemy.tank_type)
+                        for enemy in self.enemy_group],
+            'bullets': [(bullet.rect.x, bullet.rect.y, bullet.direction, bullet.tank_type)
+                        for bullet in bullets],
+            'powerups': [(powerup.rect.x, powerup.rect.y, powerup.type)
+                         for powerup in self.powerup_group],
+            'tiles': self.tile_map.codes.copy(),
+        }
+        
+    def run(self, start_time=None):
+        """运行游戏主循环
+
+        start_time 为程序启动时的 time.perf_counter()，用于报告首帧耗时。
+        """
         self.running = True
+        counter = self.allocation_counter
+        first_frame = True
         while self.running:
+            # 等待下一帧，并算出本帧要执行的模拟步数（只有游戏进行中模拟时间才会流逝）
+            self.sim_clock.set_paused(self.game_state != 'PLAYING' or self.game_over)
+            steps = self.sim_clock.tick()
+            
+            if counter is not None:
+                counter.begin_frame()
+                was_playing = self.game_state == 'PLAYING' and not self.game_over
+                
             # 处理事件
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -680,14 +880,33 @@ class GameManager:
                     self.restart_button.handle_event(event)
                     self.menu_button.handle_event(event)
             
-            # 更新游戏状态
-            current_time = pygame.time.get_ticks()
-            self.update(current_time)
+            # 更新游戏状态：游戏进行中按固定步长执行若干步，其他界面每帧更新一次
+            if self.sim_clock.paused:
+                self.update()
+            else:
+                for _ in range(steps):
+                    player_actions = None
+                    if self.replay is not None:
+                        player_actions = self.replay.action_at(self.sim_clock.frame)
+                        if player_actions is None:
+                            self.replay = None
+                    if player_actions is None:
+                        player_actions = actions.actions_from_keys(pygame.key.get_pressed())
+                    self.record_positions()
+                    self.simulate(player_actions)
+                    if self.game_state != 'PLAYING' or self.game_over:
+                        break
             
             # 绘制游戏画面
             self.draw()
+            if first_frame:
+                first_frame = False
+                if start_time is not None:
+                    print(f"Time to first frame: {(time.perf_counter() - start_time) * 1000:.1f} ms")
             
-            # 控制帧率
-            self.clock.tick(Config.FPS)
+            if counter is not None:
+                steady = was_playing and self.game_state == 'PLAYING' and not self.game_over
+                counter.end_frame(steady)
             
+        self.stop_recording()
         pygame.quit()
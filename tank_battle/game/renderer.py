@@ -0,0 +1,155 @@
+import pygame
+from .config import Config
+from .tile_map import CODE_NAMES, EMPTY, GRASS
+
+
+def interpolate_position(rect, previous, alpha):
+    """在上一步位置和当前位置之间插值；跳变（如重生）时直接使用当前位置"""
+    dx = rect.x - previous[0]
+    dy = rect.y - previous[1]
+    if abs(dx) > Config.TILE_SIZE or abs(dy) > Config.TILE_SIZE:
+        return rect.topleft
+    return (previous[0] + round(dx * alpha), previous[1] + round(dy * alpha))
+
+
+def blit_sprites(surface, sprite_groups, previous_positions=None, alpha=0.0):
+    """按顺序绘制各组精灵，返回绘制的矩形列表
+
+    alpha 不为 0 时，有上一步位置的精灵绘制在两步之间的插值位置。
+    """
+    drawn = []
+    interpolate = previous_positions if alpha else None
+    for group in sprite_groups:
+        for sprite in group:
+            position = sprite.rect
+            if interpolate:
+                previous = interpolate.get(sprite)
+                if previous is not None:
+                    position = interpolate_position(position, previous, alpha)
+            drawn.append(surface.blit(sprite.image, position))
+    return drawn
+
+
+class TerrainLayer:
+    """预渲染的静态地形层，只重绘发生变化的格子"""
+    def __init__(self, tile_map, resource_manager):
+        self.tile_map = tile_map
+        self.resource_manager = resource_manager
+        size = (Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        # 背景：黑色底色 + 全部地形
+        self.background = pygame.Surface(size)
+        self.background.fill(Config.BLACK)
+        # 草地覆盖层：绘制在坦克之上，提供隐蔽效果
+        self.grass_overlay = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            # 转换为显示格式，避免每次blit时转换像素格式
+            self.background = self.background.convert()
+            self.grass_overlay = self.grass_overlay.convert_alpha()
+        self.has_grass = False
+        self.dirty_tiles = set()
+        self.rebuild_all = True
+        tile_map.add_listener(self.on_tiles_changed)
+
+    def on_tiles_changed(self, tiles):
+        """地形网格变化回调"""
+        if tiles is None:
+            self.rebuild_all = True
+            self.dirty_tiles.clear()
+        elif not self.rebuild_all:
+            self.dirty_tiles.update(tiles)
+
+    def refresh(self):
+        """重绘变化的格子，返回需要刷新到屏幕上的矩形；整张地图重建时返回 None"""
+        tile_map = self.tile_map
+        if self.rebuild_all:
+            self.rebuild_all = False
+            self.dirty_tiles.clear()
+            self.background.fill(Config.BLACK)
+            self.grass_overlay.fill((0, 0, 0, 0))
+            self.has_grass = False
+            for row in range(tile_map.height):
+                for col in range(tile_map.width):
+                    if tile_map.codes[row, col] != EMPTY:
+                        self._draw_tile(col, row)
+            return None
+
+        rects = []
+        for col, row in self.dirty_tiles:
+            rects.append(self._draw_tile(col, row))
+        self.dirty_tiles.clear()
+        return rects
+
+    def _draw_tile(self, col, row):
+        """在缓存层上重绘单个格子"""
+        size = self.tile_map.tile_size
+        rect = pygame.Rect(col * size, row * size, size, size)
+        code = self.tile_map.codes[row, col]
+        self.background.fill(Config.BLACK, rect)
+        self.grass_overlay.fill((0, 0, 0, 0), rect)
+        if code != EMPTY:
+            image = self.resource_manager.get_image('terrain', CODE_NAMES[code])
+            self.background.blit(image, rect)
+            if code == GRASS:
+                self.grass_overlay.blit(image, rect)
+                self.has_grass = True
+        return rect
+
+
+class DirtyRenderer:
+    """脏矩形渲染：只恢复和重绘发生变化的区域，并只把这些区域提交到显示器"""
+    def __init__(self, screen, tile_map, resource_manager):
+        self.screen = screen
+        self.terrain = TerrainLayer(tile_map, resource_manager)
+        self.game_area = pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+        self.hud_area = pygame.Rect(Config.SCREEN_WIDTH, 0,
+                                    Config.WINDOW_WIDTH - Config.SCREEN_WIDTH,
+                                    Config.WINDOW_HEIGHT)
+        self.previous_rects = []
+        self.needs_full_redraw = True
+
+    def invalidate(self):
+        """下一帧整屏重绘（切换界面后调用）"""
+        self.needs_full_redraw = True
+
+    def draw(self, sprite_groups, draw_hud, previous_positions=None, alpha=0.0):
+        """绘制一帧游戏画面，返回本帧刷新的矩形列表
+
+        previous_positions 为精灵在上一模拟步的位置，alpha 为插值比例
+        （固定步长模拟时渲染帧落在两步之间）。
+        """
+        screen = self.screen
+        background = self.terrain.background
+        changed_tiles = self.terrain.refresh()
+        full = self.needs_full_redraw or changed_tiles is None
+        self.needs_full_redraw = False
+
+        if full:
+            screen.blit(background, (0, 0))
+            dirty = []
+        else:
+            # 用背景擦除上一帧精灵所在的区域，并提交变化的地形格子
+            dirty = self.previous_rects + changed_tiles
+            for rect in dirty:
+                screen.blit(background, rect, rect)
+
+        # 绘制移动的精灵（限制在游戏区域内）
+        screen.set_clip(self.game_area)
+        drawn = blit_sprites(screen, sprite_groups, previous_positions, alpha)
+        # 草地覆盖在坦克之上
+        if self.terrain.has_grass:
+            overlay = self.terrain.grass_overlay
+            for rect in drawn:
+                screen.blit(overlay, rect, rect)
+        screen.set_clip(None)
+        self.previous_rects = drawn
+
+        # HUD 区域
+        if draw_hud(screen, full):
+            dirty.append(self.hud_area)
+
+        if full:
+            pygame.display.flip()
+            return [screen.get_rect()]
+        dirty.extend(drawn)
+        pygame.display.update(dirty)
+        return dirty
@@ -0,0 +1,126 @@
+import bisect
+import struct
+import zlib
+from .config import Config
+
+# 回放文件格式：文件头之后是一串记录（类型 + 长度 + 内容）
+REPLAY_MAGIC = b'TBRP'
+REPLAY_VERSION = 2
+REPLAY_HEADER = struct.Struct('<4sHQHI')  # 标识、版本、种子、模拟频率、关键帧间隔（步）
+RECORD_HEADER = struct.Struct('<cI')  # 记录类型、内容长度
+KEYFRAME_TICK = struct.Struct('<I')
+
+RECORD_INPUTS = b'I'  # 连续若干步的输入，每步一个字节的动作位标志
+RECORD_KEYFRAME = b'K'  # 某一步之后的完整状态快照
+RECORD_END = b'E'  # 回放结束，内容为总步数
+
+
+class ReplayRecorder:
+    """录制回放：种子 + 每步的输入，每隔一段时间写入一个关键帧"""
+    def __init__(self, path, seed, keyframe_interval=None, buffer_size=64 * 1024):
+        if keyframe_interval is None:
+            keyframe_interval = Config.REPLAY_KEYFRAME_SECONDS * Config.FPS
+        self.path = path
+        self.seed = seed
+        self.keyframe_interval = keyframe_interval
+        self.ticks = 0
+        self.inputs = bytearray()  # 尚未写入文件的输入
+        self.file = open(path, 'wb', buffering=buffer_size)
+        self.file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed,
+                                           Config.FPS, keyframe_interval))
+
+    def _write_record(self, kind, payload):
+        self.file.write(RECORD_HEADER.pack(kind, len(payload)))
+        self.file.write(payload)
+
+    def _flush_inputs(self):
+        if self.inputs:
+            self._write_record(RECORD_INPUTS, bytes(self.inputs))
+            self.inputs.clear()
+
+    def record(self, player_actions, game):
+        """记录刚执行完的一步，到达间隔时写入关键帧"""
+        self.inputs.append(player_actions & 0xFF)
+        self.ticks += 1
+        if self.ticks % self.keyframe_interval == 0:
+            self._flush_inputs()
+            payload = KEYFRAME_TICK.pack(self.ticks) + zlib.compress(game.snapshot())
+            self._write_record(RECORD_KEYFRAME, payload)
+
+    def close(self):
+        """写入剩余的输入并关闭文件"""
+        if self.file is None:
+            return
+        self._flush_inputs()
+        self._write_record(RECORD_END, KEYFRAME_TICK.pack(self.ticks))
+        self.file.close()
+        self.file = None
+
+
+class Replay:
+    """读取回放文件，通过正常的 update 流程重新模拟
+
+    游戏已经执行的步数就是 sim_clock.frame，所以可以从当前位置继续，
+    也可以从最近的关键帧开始跳转到任意一步。
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, self.seed, fps, self.keyframe_interval = REPLAY_HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"Not a replay file: {path}")
+        if fps != Config.FPS:
+            raise ValueError(f"Replay was recorded at {fps} ticks per second, game runs at {Config.FPS}")
+
+        inputs = bytearray()
+        self.keyframes = {}  # 步数 -> 压缩的快照
+        offset = REPLAY_HEADER.size
+        while offset < len(data):
+            kind, length = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+            payload = data[offset:offset + length]
+            offset += length
+            if kind == RECORD_INPUTS:
+                inputs += payload
+            elif kind == RECORD_KEYFRAME:
+                tick, = KEYFRAME_TICK.unpack_from(payload, 0)
+                self.keyframes[tick] = payload[KEYFRAME_TICK.size:]
+            elif kind == RECORD_END:
+                break
+        self.inputs = bytes(inputs)
+        self.keyframe_ticks = sorted(self.keyframes)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def action_at(self, tick):
+        """第 tick 步（从 0 开始）的输入，超出回放长度时返回 None"""
+        if 0 <= tick < len(self.inputs):
+            return self.inputs[tick]
+        return None
+
+    def start(self, game):
+        """从头开始回放"""
+        game.reset(self.seed)
+        game.stop_recording()
+
+    def seek(self, game, tick):
+        """让游戏跳转到第 tick 步之后的状态，返回观测
+
+        从不晚于 tick 的最近关键帧恢复；如果游戏当前已经在这个关键帧
+        和 tick 之间，直接从当前位置继续模拟。
+        """
+        tick = max(0, min(tick, len(self.inputs)))
+        index = bisect.bisect_right(self.keyframe_ticks, tick)
+        keyframe = self.keyframe_ticks[index - 1] if index else 0
+        frame = game.sim_clock.frame
+        if not (game.rng.seed == self.seed and keyframe <= frame <= tick):
+            if keyframe:
+                game.restore(zlib.decompress(self.keyframes[keyframe]))
+                game.stop_recording()
+            else:
+                self.start(game)
+        while game.sim_clock.frame < tick:
+            if not game.simulate(self.inputs[game.sim_clock.frame]):
+                break
+        return game.get_observation()
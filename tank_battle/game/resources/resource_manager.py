@@ -1,16 +1,100 @@
 import os
+import functools
+import hashlib
+import struct
+import time
+import zlib
 import pygame
 from ..config import Config
 import random
 import math
 
+# 资源缓存文件格式
+ASSET_CACHE_MAGIC = b'TBAC'
+ASSET_CACHE_HEADER = struct.Struct('<4sI')
+ASSET_CACHE_ENTRY = struct.Struct('<HHH')
+
+# 坦克图像的方向及旋转角度
+TANK_ANGLES = {'up': 0, 'right': 270, 'down': 180, 'left': 90}
+
+# 按顺序尝试的中文字体
+FONT_CANDIDATES = (
+    "C:/Windows/Fonts/simhei.ttf",  # 黑体
+    "C:/Windows/Fonts/msyh.ttc",  # 微软雅黑
+)
+
+
+def get_cache_dir():
+    """获取用户缓存目录（不写入游戏安装目录）"""
+    cache_dir = os.environ.get('TANK_BATTLE_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'tank_battle')
+
+
 class ResourceManager:
-    def __init__(self):
-        """初始化资源管理器"""
+    # 生成图像所用的参数，修改绘制代码时需要增加版本号
+    ASSET_VERSION = 1
+    
+    # 坦克配色
+    TANK_COLORS = {
+        'player': {
+            'body': (34, 177, 76),  # 深绿色
+            'turret': (28, 145, 62),  # 更深的绿色
+            'track': (20, 100, 45)  # 履带颜色
+        },
+        'normal': {
+            'body': (200, 40, 40),  # 红色
+            'turret': (170, 30, 30),
+            'track': (150, 25, 25)
+        },
+        'fast': {
+            'body': (255, 165, 0),  # 橙色
+            'turret': (230, 140, 0),
+            'track': (200, 120, 0)
+        },
+        'heavy': {
+            'body': (128, 128, 128),  # 灰色
+            'turret': (100, 100, 100),
+            'track': (80, 80, 80)
+        },
+        'elite': {
+            'body': (148, 0, 211),  # 紫色
+            'turret': (128, 0, 181),
+            'track': (108, 0, 151)
+        }
+    }
+    
+    # 子弹配色
+    BULLET_COLORS = {
+        'player': (255, 255, 0),  # 黄色
+        'enemy': (255, 255, 255),  # 白色
+    }
+    
+    # 道具配色
+    POWERUP_COLORS = {
+        'shield': (0, 255, 255),    # 青色
+        'speed': (255, 255, 0),     # 黄色
+        'rapid_fire': (255, 0, 0),  # 红色
+        'base_shield': (192, 192, 192),  # 银色
+    }
+    
+    def __init__(self, cache_dir=None, use_cache=True, lazy=False):
+        """初始化资源管理器
+
+        lazy 为 True 时启动阶段只加载字体，图像在第一次 get_image 时生成
+        （或从缓存读取），也可以通过 warm_up() 分批预热。
+        """
         # 初始化资源字典
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        self.blank_images = {}
+        self.atlas = None  # 打包后的纹理图集
         
         # 获取项目根目录
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,126 +103,213 @@ class ResourceManager:
         self.sounds_dir = os.path.join(self.resources_dir, 'sounds')
         self.fonts_dir = os.path.join(self.resources_dir, 'fonts')
         
-        # 确保资源目录存在
-        os.makedirs(self.images_dir, exist_ok=True)
-        os.makedirs(self.sounds_dir, exist_ok=True)
-        os.makedirs(self.fonts_dir, exist_ok=True)
+        # 生成的图像缓存在用户缓存目录中
+        self.cache_dir = cache_dir if cache_dir is not None else get_cache_dir()
+        self.use_cache = use_cache
+        
+        # 图像键 -> 生成函数
+        self.builders = self._create_builders()
+        self.lazy = lazy
+        self.cache_checked = False  # 是否已经尝试读取过缓存文件
+        self.warmed_up = False  # 是否所有图像都已就绪
+        self.cache_stale = False  # 是否生成了缓存文件中没有的图像
+        self.pack_atlas = False  # 预热完成后是否打包图集
         
         print(f"Resource Manager initialized with resources directory: {self.resources_dir}")
         
         # 加载图像资源
-        self._load_images()
+        if not lazy:
+            self._load_images()
         self._load_sounds()
         self._load_fonts()
         
+    def get_cache_path(self):
+        """当前生成参数对应的缓存文件路径"""
+        return os.path.join(self.cache_dir, f'assets-{self.get_asset_key()}.bin')
+        
+    def _load_cached_images(self):
+        """读取一次缓存文件，返回读到的图像数量"""
+        self.cache_checked = True
+        if not self.use_cache:
+            return 0
+        cache_path = self.get_cache_path()
+        images = self._read_asset_cache(cache_path)
+        if images is None:
+            return 0
+        for key, image in images.items():
+            self.images.setdefault(key, image)
+        print(f"Loaded {len(images)} images from cache: {cache_path}")
+        return len(images)
+        
     def _load_images(self):
-        """加载所有图像"""
-        # 加载坦克和子弹图像
-        self._load_tank_images()
-        self._load_bullet_images()
+        """加载所有图像：优先读取缓存文件，参数变化时重新生成"""
+        if self._load_cached_images() < len(self.builders):
+            self._generate_images()
+            if self.use_cache:
+                self._write_asset_cache(self.get_cache_path(), self.images)
+        self.warmed_up = True
         
-        # 加载地形图像
-        self._load_terrain_images()
+    def warm_up(self, budget_ms=None):
+        """在预算时间内继续加载尚未就绪的图像，全部就绪时返回 True
+
+        用于懒加载模式：在菜单界面每帧调用，把图像生成分摊到多帧中。
+        budget_ms 为 None 时一次加载完。
+        """
+        if self.warmed_up:
+            return True
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        if not self.cache_checked:
+            self._load_cached_images()
+            if deadline is not None and time.perf_counter() >= deadline:
+                return self._finish_warm_up()
+        for key, builder in self.builders.items():
+            if key in self.images:
+                continue
+            self.images[key] = builder()
+            self.cache_stale = True
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return self._finish_warm_up()
         
-        # 加载道具图像
-        self._load_powerup_images()
+    def _finish_warm_up(self):
+        """检查是否所有图像都已就绪，就绪时写入缓存并按需打包图集"""
+        if any(key not in self.images for key in self.builders):
+            return False
+        self.warmed_up = True
+        if self.cache_stale and self.use_cache:
+            self._write_asset_cache(self.get_cache_path(), self.images)
+        self.cache_stale = False
+        print(f"Warmed up {len(self.builders)} images")
+        if self.pack_atlas:
+            self.build_atlas()
+        return True
         
-    def _load_tank_images(self):
-        """加载坦克图像"""
+    def get_asset_key(self):
+        """根据生成参数计算资源缓存的键"""
+        params = (
+            self.ASSET_VERSION,
+            Config.TILE_SIZE,
+            Config.BULLET_SIZE,
+            Config.POWERUP_SIZE,
+            sorted(Config.TERRAIN_TYPES),
+            sorted((name, sorted(colors.items())) for name, colors in self.TANK_COLORS.items()),
+            sorted(self.BULLET_COLORS.items()),
+            sorted(self.POWERUP_COLORS.items()),
+        )
+        return hashlib.sha1(repr(params).encode('utf-8')).hexdigest()[:16]
+        
+    def _read_asset_cache(self, path):
+        """读取资源缓存文件，文件不存在或损坏时返回 None"""
+        try:
+            with open(path, 'rb') as f:
+                data = zlib.decompress(f.read())
+            magic, count = ASSET_CACHE_HEADER.unpack_from(data, 0)
+            if magic != ASSET_CACHE_MAGIC:
+                return None
+            offset = ASSET_CACHE_HEADER.size
+            images = {}
+            for _ in range(count):
+                name_length, width, height = ASSET_CACHE_ENTRY.unpack_from(data, offset)
+                offset += ASSET_CACHE_ENTRY.size
+                name = data[offset:offset + name_length].decode('utf-8')
+                offset += name_length
+                size = width * height * 4
+                pixels = data[offset:offset + size]
+                if len(pixels) != size:
+                    return None
+                offset += size
+                images[name] = pygame.image.frombytes(pixels, (width, height), 'RGBA')
+            return images
+        except (OSError, ValueError, zlib.error, struct.error, pygame.error):
+            return None
+            
+    def _write_asset_cache(self, path, images):
+        """把所有图像打包写入一个缓存文件（写入失败时忽略）"""
+        chunks = [ASSET_CACHE_HEADER.pack(ASSET_CACHE_MAGIC, len(images))]
+        for name, image in images.items():
+            encoded = name.encode('utf-8')
+            width, height = image.get_size()
+            chunks.append(ASSET_CACHE_ENTRY.pack(len(encoded), width, height))
+            chunks.append(encoded)
+            chunks.append(pygame.image.tobytes(image, 'RGBA'))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(zlib.compress(b''.join(chunks)))
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Could not write asset cache: {e}")
+            
+    def _create_builders(self):
+        """登记每张图像的生成函数（键 -> 无参函数），按需调用"""
+        builders = {}
+        for tank_type in self.TANK_COLORS:
+            for direction in TANK_ANGLES:
+                builders[f'tank_{tank_type}_{direction}'] = functools.partial(
+                    self._create_tank_image, tank_type, direction)
+        for bullet_type in self.BULLET_COLORS:
+            for direction in TANK_ANGLES:
+                builders[f'bullet_{bullet_type}_{direction}'] = functools.partial(
+                    self._create_bullet_image, bullet_type)
+        for terrain_type in Config.TERRAIN_TYPES:
+            builders[f'terrain_{terrain_type}'] = functools.partial(
+                self._create_terrain_image, terrain_type)
+        for powerup_type in self.POWERUP_COLORS:
+            builders[f'powerup_{powerup_type}'] = functools.partial(
+                self._create_powerup_image, powerup_type)
+        return builders
+        
+    def _generate_images(self):
+        """程序化生成所有图像"""
+        for key, builder in self.builders.items():
+            if key not in self.images:
+                self.images[key] = builder()
+        print(f"Generated {len(self.builders)} images")
+        
+    def _create_tank_image(self, tank_type, direction):
+        """创建坦克图像"""
         tank_size = Config.TILE_SIZE
+        colors = self.TANK_COLORS[tank_type]
         
-        # 为每种类型的坦克创建图像
-        tank_types = {
-            'player': {
-                'body': (34, 177, 76),  # 深绿色
-                'turret': (28, 145, 62),  # 更深的绿色
-                'track': (20, 100, 45)  # 履带颜色
-            },
-            'normal': {
-                'body': (200, 40, 40),  # 红色
-                'turret': (170, 30, 30),
-                'track': (150, 25, 25)
-            },
-            'fast': {
-                'body': (255, 165, 0),  # 橙色
-                'turret': (230, 140, 0),
-                'track': (200, 120, 0)
-            },
-            'heavy': {
-                'body': (128, 128, 128),  # 灰色
-                'turret': (100, 100, 100),
-                'track': (80, 80, 80)
-            },
-            'elite': {
-                'body': (148, 0, 211),  # 紫色
-                'turret': (128, 0, 181),
-                'track': (108, 0, 151)
-            }
-        }
+        # 创建透明背景的surface
+        image = pygame.Surface((tank_size, tank_size), pygame.SRCALPHA)
         
-        # 为每种类型的坦克创建四个方向的图像
-        directions = ['up', 'right', 'down', 'left']
-        angles = [0, 270, 180, 90]
+        # 绘制履带
+        track_width = 6
+        pygame.draw.rect(image, colors['track'], (0, 0, track_width, tank_size))  # 左履带
+        pygame.draw.rect(image, colors['track'], (tank_size-track_width, 0, track_width, tank_size))  # 右履带
         
-        for tank_type, colors in tank_types.items():
-            for direction, angle in zip(directions, angles):
-                # 创建透明背景的surface
-                image = pygame.Surface((tank_size, tank_size), pygame.SRCALPHA)
-                
-                # 绘制履带
-                track_width = 6
-                pygame.draw.rect(image, colors['track'], (0, 0, track_width, tank_size))  # 左履带
-                pygame.draw.rect(image, colors['track'], (tank_size-track_width, 0, track_width, tank_size))  # 右履带
-                
-                # 绘制坦克主体
-                body_rect = pygame.Rect(track_width, 4, tank_size-2*track_width, tank_size-8)
-                pygame.draw.rect(image, colors['body'], body_rect)
-                
-                # 绘制炮塔
-                turret_size = 16
-                turret_rect = pygame.Rect((tank_size-turret_size)//2, (tank_size-turret_size)//2,
-                                        turret_size, turret_size)
-                pygame.draw.rect(image, colors['turret'], turret_rect)
-                
-                # 绘制炮管
-                barrel_width = 4
-                barrel_length = 20
-                barrel_rect = pygame.Rect((tank_size-barrel_width)//2, 0,
-                                        barrel_width, barrel_length)
-                pygame.draw.rect(image, colors['turret'], barrel_rect)
-                
-                # 旋转图像
-                if angle != 0:
-                    image = pygame.transform.rotate(image, angle)
-                
-                # 保存图像
-                key = f'tank_{tank_type}_{direction}'
-                self.images[key] = image
-                
-                # 保存到文件（可选）
-                image_path = os.path.join(self.images_dir, f'{tank_type}_{direction}.png')
-                pygame.image.save(image, image_path)
-                print(f"Created tank image: {key}")
+        # 绘制坦克主体
+        body_rect = pygame.Rect(track_width, 4, tank_size-2*track_width, tank_size-8)
+        pygame.draw.rect(image, colors['body'], body_rect)
+        
+        # 绘制炮塔
+        turret_size = 16
+        turret_rect = pygame.Rect((tank_size-turret_size)//2, (tank_size-turret_size)//2,
+                                turret_size, turret_size)
+        pygame.draw.rect(image, colors['turret'], turret_rect)
+        
+        # 绘制炮管
+        barrel_width = 4
+        barrel_length = 20
+        barrel_rect = pygame.Rect((tank_size-barrel_width)//2, 0,
+                                barrel_width, barrel_length)
+        pygame.draw.rect(image, colors['turret'], barrel_rect)
+        
+        # 旋转图像
+        angle = TANK_ANGLES[direction]
+        if angle != 0:
+            image = pygame.transform.rotate(image, angle)
+        return image
                 
-    def _load_bullet_images(self):
-        """创建子弹图像"""
-        bullet_size = (8, 8)
-        
-        # 玩家子弹 - 黄色
-        player_color = (255, 255, 0)  # 黄色
-        for direction in ['up', 'down', 'left', 'right']:
-            surface = pygame.Surface(bullet_size, pygame.SRCALPHA)
-            pygame.draw.circle(surface, player_color, (4, 4), 4)
-            self.images[f'bullet_player_{direction}'] = surface
-            
-        # 敌人子弹 - 白色
-        enemy_color = (255, 255, 255)  # 白色
-        for direction in ['up', 'down', 'left', 'right']:
-            surface = pygame.Surface(bullet_size, pygame.SRCALPHA)
-            pygame.draw.circle(surface, enemy_color, (4, 4), 4)
-            self.images[f'bullet_enemy_{direction}'] = surface
-            
-        print("Created bullet images")
+    def _create_bullet_image(self, bullet_type):
+        """创建子弹图像（玩家子弹为黄色，敌人子弹为白色）"""
+        bullet_size = (Config.BULLET_SIZE, Config.BULLET_SIZE)
+        radius = Config.BULLET_SIZE // 2
+        surface = pygame.Surface(bullet_size, pygame.SRCALPHA)
+        pygame.draw.circle(surface, self.BULLET_COLORS[bullet_type], (radius, radius), radius)
+        return surface
         
     def _create_terrain_image(self, terrain_type):
         """创建地形图像"""
@@ -239,14 +410,15 @@ class ResourceManager:
             # 基础草地
             pygame.draw.rect(image, forest_green, (0, 0, tile_size, tile_size))
             
-            # 随机草丛
+            # 随机草丛（固定种子，保证每次生成的图像相同）
+            rng = random.Random(0)
             for _ in range(60):
-                x = random.randint(0, tile_size-1)
-                y = random.randint(0, tile_size-1)
-                color = random.choice([dark_green, lime_green])
-                length = random.randint(3, 7)
-                width = random.randint(1, 2)
-                angle = random.uniform(-0.5, 0.5)
+                x = rng.randint(0, tile_size-1)
+                y = rng.randint(0, tile_size-1)
+                color = rng.choice([dark_green, lime_green])
+                length = rng.randint(3, 7)
+                width = rng.randint(1, 2)
+                angle = rng.uniform(-0.5, 0.5)
                 end_x = x + math.sin(angle) * length
                 end_y = y - math.cos(angle) * length
                 pygame.draw.line(image, color, (x, y), (end_x, end_y), width)
@@ -304,95 +476,66 @@ class ResourceManager:
             
         return image
         
-    def _load_terrain_images(self):
-        """加载地形图像"""
-        for terrain_type in Config.TERRAIN_TYPES.keys():
-            # 创建地形图像
-            image = self._create_terrain_image(terrain_type)
-            
-            # 保存到内存
-            self.images[f'terrain_{terrain_type}'] = image
-            
-            # 保存到文件（可选）
-            image_path = os.path.join(self.images_dir, f'terrain_{terrain_type}.png')
-            pygame.image.save(image, image_path)
-            print(f"Created terrain image: {terrain_type}")
-        
-    def _create_default_powerup_images(self):
-        """创建默认的道具图像"""
+    def _create_powerup_image(self, powerup_type):
+        """创建道具图像"""
         powerup_size = Config.POWERUP_SIZE
+        color = self.POWERUP_COLORS[powerup_type]
         
-        # 道具类型及其颜色
-        powerup_colors = {
-            'shield': (0, 255, 255),    # 青色
-            'speed': (255, 255, 0),     # 黄色
-            'rapid_fire': (255, 0, 0),  # 红色
-            'base_shield': (192, 192, 192),  # 银色
-        }
+        # 创建基础surface
+        surface = pygame.Surface((powerup_size, powerup_size), pygame.SRCALPHA)
         
-        for powerup_type, color in powerup_colors.items():
-            # 创建基础surface
-            surface = pygame.Surface((powerup_size, powerup_size), pygame.SRCALPHA)
-            
-            # 绘制道具外框（圆形）
-            pygame.draw.circle(surface, color, (powerup_size//2, powerup_size//2), powerup_size//2)
-            
-            # 根据道具类型绘制不同的图标
-            if powerup_type == 'shield':
-                # 盾牌图标
-                shield_points = [
-                    (powerup_size//2, 4),  # 顶点
-                    (powerup_size-4, powerup_size//2),  # 右点
-                    (powerup_size//2, powerup_size-4),  # 底点
-                    (4, powerup_size//2),  # 左点
-                ]
-                pygame.draw.polygon(surface, (255, 255, 255), shield_points)
-                
-            elif powerup_type == 'speed':
-                # 闪电图标
-                lightning_points = [
-                    (powerup_size//2, 4),  # 顶点
-                    (powerup_size-6, powerup_size//2),  # 右上
-                    (powerup_size//2, powerup_size//2),  # 中点
-                    (6, powerup_size-4),  # 左上
-                ]
-                pygame.draw.polygon(surface, (255, 255, 255), lightning_points)
+        # 绘制道具外框（圆形）
+        pygame.draw.circle(surface, color, (powerup_size//2, powerup_size//2), powerup_size//2)
+        
+        # 根据道具类型绘制不同的图标
+        if powerup_type == 'shield':
+            # 盾牌图标
+            shield_points = [
+                (powerup_size//2, 4),  # 顶点
+                (powerup_size-4, powerup_size//2),  # 右点
+                (powerup_size//2, powerup_size-4),  # 底点
+                (4, powerup_size//2),  # 左点
+            ]
+            pygame.draw.polygon(surface, (255, 255, 255), shield_points)
+            
+        elif powerup_type == 'speed':
+            # 闪电图标
+            lightning_points = [
+                (powerup_size//2, 4),  # 顶点
+                (powerup_size-6, powerup_size//2),  # 右上
+                (powerup_size//2, powerup_size//2),  # 中点
+                (6, powerup_size-4),  # 左上
+            ]
+            pygame.draw.polygon(surface, (255, 255, 255), lightning_points)
+            
+        elif powerup_type == 'rapid_fire':
+            # 子弹图标
+            bullet_radius = 3
+            for i in range(3):
+                x = powerup_size//2
+                y = 6 + i * 6
+                pygame.draw.circle(surface, (255, 255, 255), (x, y), bullet_radius)
                 
-            elif powerup_type == 'rapid_fire':
-                # 子弹图标
-                bullet_radius = 3
-                for i in range(3):
-                    x = powerup_size//2
-                    y = 6 + i * 6
-                    pygame.draw.circle(surface, (255, 255, 255), (x, y), bullet_radius)
-                    
-            elif powerup_type == 'base_shield':
-                # 基地加固图标 - 小城堡形状
-                castle_color = (255, 255, 255)  # 白色
-                # 主体
-                pygame.draw.rect(surface, castle_color, 
-                               (powerup_size//4, powerup_size//2, 
-                                powerup_size//2, powerup_size//3))
-                # 塔楼
-                pygame.draw.rect(surface, castle_color,
-                               (powerup_size//3, powerup_size//4,
-                                powerup_size//3, powerup_size//2))
-                # 塔尖
-                castle_top = [
-                    (powerup_size//3, powerup_size//4),  # 左
-                    (powerup_size//2, powerup_size//6),  # 顶
-                    (2*powerup_size//3, powerup_size//4)  # 右
-                ]
-                pygame.draw.polygon(surface, castle_color, castle_top)
-            
-            # 保存图像
-            self.images[f'powerup_{powerup_type}'] = surface
-            
-        print("Created powerup images")
+        elif powerup_type == 'base_shield':
+            # 基地加固图标 - 小城堡形状
+            castle_color = (255, 255, 255)  # 白色
+            # 主体
+            pygame.draw.rect(surface, castle_color, 
+                           (powerup_size//4, powerup_size//2, 
+                            powerup_size//2, powerup_size//3))
+            # 塔楼
+            pygame.draw.rect(surface, castle_color,
+                           (powerup_size//3, powerup_size//4,
+                            powerup_size//3, powerup_size//2))
+            # 塔尖
+            castle_top = [
+                (powerup_size//3, powerup_size//4),  # 左
+                (powerup_size//2, powerup_size//6),  # 顶
+                (2*powerup_size//3, powerup_size//4)  # 右
+            ]
+            pygame.draw.polygon(surface, castle_color, castle_top)
         
-    def _load_powerup_images(self):
-        """加载道具图像"""
-        self._create_default_powerup_images()
+        return surface
         
     def _load_sounds(self):
         """加载音效"""
@@ -401,27 +544,65 @@ class ResourceManager:
         
     def _load_fonts(self):
         """加载字体"""
+        # 选择第一个存在的中文字体，都不存在时使用 pygame 自带的默认字体
+        # （不扫描系统字体列表，避免拖慢启动）
+        self.font_path = next((path for path in FONT_CANDIDATES if os.path.exists(path)), None)
         try:
-            # 尝试使用系统自带的中文字体
-            font_path = "C:/Windows/Fonts/simhei.ttf"  # 黑体
-            if not os.path.exists(font_path):
-                font_path = "C:/Windows/Fonts/msyh.ttc"  # 微软雅黑
-            
             self.fonts = {
-                'small': pygame.font.Font(font_path, 16),
-                'medium': pygame.font.Font(font_path, 24),
-                'large': pygame.font.Font(font_path, 32)
+                'small': pygame.font.Font(self.font_path, 16),
+                'medium': pygame.font.Font(self.font_path, 24),
+                'large': pygame.font.Font(self.font_path, 32)
             }
-            print("Loaded custom fonts")
-        except Exception as e:
+        except (OSError, pygame.error) as e:
             print(f"Error loading custom fonts: {e}")
-            # 如果加载失败，使用系统默认字体
+            self.font_path = None
             self.fonts = {
-                'small': pygame.font.SysFont(None, 16),
-                'medium': pygame.font.SysFont(None, 24),
-                'large': pygame.font.SysFont(None, 32)
+                'small': pygame.font.Font(None, 16),
+                'medium': pygame.font.Font(None, 24),
+                'large': pygame.font.Font(None, 32)
             }
-            print("Using system default fonts")
+        if self.font_path:
+            print(f"Loaded custom fonts: {self.font_path}")
+        else:
+            print("Using default fonts")
+        
+    def build_atlas(self, max_width=512, padding=1):
+        """把所有图像打包成一张转换为显示格式的图集，图像改为图集的子表面
+
+        需要在创建显示窗口之后调用；返回每张图像在图集中的位置。
+        """
+        if pygame.display.get_surface() is None:
+            return None
+            
+        # 按高度从高到低排列，逐行（shelf）摆放
+        keys = sorted(self.images, key=lambda key: (-self.images[key].get_height(), key))
+        regions = {}
+        x = y = shelf_height = 0
+        atlas_width = 0
+        for key in keys:
+            width, height = self.images[key].get_size()
+            if x + width > max_width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            regions[key] = pygame.Rect(x, y, width, height)
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+            atlas_width = max(atlas_width, x)
+        atlas_height = y + shelf_height
+        
+        atlas = pygame.Surface((max(atlas_width, 1), max(atlas_height, 1)), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+        for key, rect in regions.items():
+            atlas.blit(self.images[key], rect)
+        self.atlas = atlas.convert_alpha()
+        
+        for key, rect in regions.items():
+            self.images[key] = self.atlas.subsurface(rect)
+        self.blank_images = {size: image.convert_alpha()
+                             for size, image in self.blank_images.items()}
+        print(f"Packed {len(regions)} images into a {atlas_width}x{atlas_height} atlas")
+        return regions
         
     def get_image(self, image_type, name):
         """获取图像"""
@@ -436,6 +617,15 @@ class ResourceManager:
         else:
             key = name
             
+        if key not in self.images and self.lazy:
+            # 懒加载：第一次请求时先尝试缓存文件，再单独生成这一张
+            if not self.cache_checked:
+                self._load_cached_images()
+            builder = self.builders.get(key)
+            if key not in self.images and builder is not None:
+                self.images[key] = builder()
+                self.cache_stale = True
+                
         if key not in self.images:
             print(f"Warning: Image {key} not found!")
             # 返回一个默认的紫色方块作为缺失图像的标记
@@ -445,6 +635,14 @@ class ResourceManager:
             
         return self.images[key]
             
+    def get_blank_image(self, size):
+        """获取指定尺寸的共享透明图像（调用方不能在上面绘制）"""
+        image = self.blank_images.get(size)
+        if image is None:
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            self.blank_images[size] = image
+        return image
+            
     def get_font(self, size):
         """获取指定大小的字体"""
         return self.fonts[size]
@@ -453,3 +651,55 @@ class ResourceManager:
         """播放音效"""
         # 暂时禁用音效播放
         pass
+
+
+class NullResourceManager:
+    """不生成任何图像的资源管理器，用于 headless 批量模拟
+
+    精灵只需要图像来确定 rect 的大小，所以每类图像都返回同一张
+    对应尺寸的空白 Surface；不读写缓存，多局游戏可以共享一个实例。
+    """
+    IMAGE_SIZES = {
+        'tank': Config.TANK_SIZE,
+        'bullet': Config.BULLET_SIZE,
+        'terrain': Config.TILE_SIZE,
+        'powerup': Config.POWERUP_SIZE,
+    }
+
+    def __init__(self):
+        self.images = {}
+        self.blank_images = {}
+        self.atlas = None
+        self.font_path = None
+        self.fonts = {
+            'small': pygame.font.Font(None, 16),
+            'medium': pygame.font.Font(None, 24),
+            'large': pygame.font.Font(None, 32)
+        }
+
+    def warm_up(self, budget_ms=None):
+        """没有需要预热的图像"""
+        return True
+
+    def build_atlas(self, max_width=512, padding=1):
+        return None
+
+    def get_image(self, image_type, name):
+        """获取对应尺寸的空白图像"""
+        size = self.IMAGE_SIZES.get(image_type, 32)
+        return self.get_blank_image((size, size))
+
+    def get_blank_image(self, size):
+        """获取指定尺寸的共享透明图像（调用方不能在上面绘制）"""
+        image = self.blank_images.get(size)
+        if image is None:
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            self.blank_images[size] = image
+        return image
+
+    def get_font(self, size):
+        """获取指定大小的字体"""
+        return self.fonts[size]
+
+    def play_sound(self, sound_name):
+        pass
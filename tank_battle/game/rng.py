@@ -0,0 +1,68 @@
+import hashlib
+import random
+
+# 各子系统独立的随机数流：某个子系统多用或少用随机数不会影响其他子系统
+STREAMS = ('terrain', 'spawn', 'ai', 'loot')
+
+MASK64 = (1 << 64) - 1
+
+
+def new_seed():
+    """生成一个新的游戏种子"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+class StreamRandom(random.Random):
+    """状态只有一个 64 位整数的 random.Random（SplitMix64）
+
+    梅森旋转的状态有 2.5KB，快照中保存四个流会远大于整个地图；
+    这里的状态可以直接存成一个 uint64。
+    """
+    def seed(self, a=None, version=2):
+        # 字符串种子在不同进程和平台之间结果一致
+        digest = hashlib.sha512(str(a).encode('utf-8')).digest()
+        self.state = int.from_bytes(digest[:8], 'little')
+        self.gauss_next = None
+
+    def _next(self):
+        self.state = z = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self):
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k):
+        if k <= 64:
+            return self._next() >> (64 - k)
+        result = 0
+        for shift in range(0, k, 64):
+            result |= self._next() << shift
+        return result & ((1 << k) - 1)
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
+        self.gauss_next = None
+
+
+class RandomStreams:
+    """由一个游戏种子派生出的一组 StreamRandom
+
+    terrain：地形生成；spawn：敌人生成位置和类型；ai：敌人行为；
+    loot：道具掉落。相同种子和相同输入得到完全相同的游戏过程。
+    """
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """用新的种子重置所有流（seed 为 None 时随机生成）"""
+        if seed is None:
+            seed = new_seed()
+        self.seed = seed
+        for name in STREAMS:
+            setattr(self, name, StreamRandom(f'{seed}:{name}'))
+        return seed
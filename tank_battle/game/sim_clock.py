@@ -0,0 +1,113 @@
+import time
+import pygame
+from .config import Config
+
+# 时钟模式
+REALTIME = 'realtime'  # 按真实经过的时间安排固定步长，渲染帧率与模拟频率无关
+FIXED = 'fixed'  # 每个渲染帧推进一个固定步长，按模拟频率限制帧率
+FAST_FORWARD = 'fast_forward'  # 每帧推进一个固定步长，不等待
+MODES = (REALTIME, FIXED, FAST_FORWARD)
+
+
+class SimClock:
+    """模拟时钟：游戏逻辑使用的唯一时间来源（毫秒）
+
+    模拟总是按固定步长 1000 / fps 毫秒推进，用整数累计余数，避免长时间
+    运行产生漂移。每个渲染帧调用一次 tick()，返回本帧需要执行的步数；
+    实时模式下用累加器把真实经过的时间换算成步数，并记录插值系数 alpha。
+    暂停期间 now 保持不变。
+    """
+    def __init__(self, mode=REALTIME, fps=Config.FPS, render_fps=Config.RENDER_FPS,
+                 max_catch_up=Config.MAX_CATCH_UP_STEPS, spin_ms=Config.FRAME_SPIN_MS):
+        if mode not in MODES:
+            raise ValueError(f"Unknown clock mode: {mode}")
+        self.mode = mode
+        self.fps = fps
+        self.step_ms = 1000 / fps
+        self.render_fps = render_fps  # 0 表示不限制渲染帧率
+        self.max_catch_up = max_catch_up  # 每个渲染帧最多补跑的步数
+        self.spin_ms = spin_ms  # 等待下一帧时最后忙等的毫秒数
+        self.next_frame = None  # 下一帧开始的真实时间（毫秒）
+        self.reset()
+
+    def reset(self):
+        """回到时间 0"""
+        self.now = 0
+        self.frame = 0
+        self.paused = False
+        self.remainder = 0  # 固定步长累计的余数（1/fps 毫秒）
+        self.accumulator = 0.0  # 尚未模拟的真实时间（毫秒）
+        self.alpha = 0.0  # 渲染时在上一步和当前步之间插值的比例
+        self.last_real = None
+
+    def pause(self):
+        """暂停：tick() 不再安排模拟步"""
+        self.paused = True
+
+    def resume(self):
+        """继续：不计入暂停期间经过的真实时间"""
+        self.paused = False
+        self.last_real = None
+
+    def set_paused(self, paused):
+        """设置暂停状态（状态不变时不做任何事）"""
+        if paused and not self.paused:
+            self.pause()
+        elif not paused and self.paused:
+            self.resume()
+
+    def advance(self):
+        """推进一个固定步长，返回新的时间"""
+        if not self.paused:
+            self.remainder += 1000
+            step, self.remainder = divmod(self.remainder, self.fps)
+            self.now += step
+            self.frame += 1
+        return self.now
+
+    def wait(self, fps):
+        """等待到下一帧
+
+        先用 pygame.time.wait 睡眠，只在最后 spin_ms 毫秒忙等，既保持计时
+        精度，又不会让一个 CPU 核心一直满载。落后超过一帧时不再追赶。
+        """
+        if not fps:
+            return
+        frame_ms = 1000 / fps
+        now = time.perf_counter() * 1000
+        deadline = self.next_frame
+        if deadline is None or deadline < now - frame_ms:
+            deadline = now
+        sleep_ms = int(deadline - now - self.spin_ms)
+        if sleep_ms > 0:
+            pygame.time.wait(sleep_ms)
+        while time.perf_counter() * 1000 < deadline:
+            pass
+        self.next_frame = deadline + frame_ms
+
+    def tick(self):
+        """开始一个渲染帧：按模式等待，返回本帧需要执行的模拟步数"""
+        if self.mode == FAST_FORWARD:
+            return 0 if self.paused else 1
+        if self.mode == FIXED:
+            self.wait(self.fps)
+            return 0 if self.paused else 1
+
+        self.wait(self.render_fps)
+        real = time.perf_counter() * 1000
+        if self.paused:
+            self.last_real = real
+            return 0
+        if self.last_real is not None:
+            self.accumulator += real - self.last_real
+        self.last_real = real
+
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_catch_up:
+            # 落后太多时丢弃多余的时间，避免越追越慢
+            steps = self.max_catch_up
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.alpha = self.accumulator / self.step_ms
+        return steps
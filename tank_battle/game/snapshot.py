@@ -0,0 +1,326 @@
+import struct
+import numpy as np
+from .config import Config
+from .rng import STREAMS
+from .tile_map import CODE_NAMES, TERRAIN_CODES
+from .bullet_system import DIRECTIONS
+from .sprites.tank import Tank, POWERUP_TIMERS
+from .sprites.terrain import Terrain
+
+# 快照格式版本，修改记录的字段时需要增加
+SNAPSHOT_VERSION = 6
+
+# 字符串字段在快照中保存为它在下面元组中的下标
+GAME_STATES = ('MENU', 'PLAYING', 'GAME_OVER')
+GAME_OVER_REASONS = (None, 'base_destroyed', 'player_dead', 'victory')
+TANK_TYPES = ('player',) + tuple(Config.ENEMY_TYPES)
+POWERUP_TYPES = tuple(Config.POWERUP_TYPES)
+BULLET_TYPES = ('player', 'enemy')
+# 定时事件的名称：坦克道具到期事件的 key 为坦克，powerup_expire 的为道具，其余没有 key
+TANK_EVENTS = tuple(POWERUP_TIMERS.values())
+EVENT_NAMES = ('enemy_spawn', 'base_shield_end', 'powerup_expire') + TANK_EVENTS
+
+# 文件头：版本、游戏标量字段、时钟、种子、各随机数流的状态、各段记录的数量、
+# 敌人生成间隔是否已过（enemy_spawn 事件已经触发、等待屏幕上有空位）
+HEADER = struct.Struct('<HBBBBhiiiiqIHQ' + 'Q' * len(STREAMS) + 'HBHHHHhHHiIHH?')
+
+TANK_RECORD = np.dtype([('type', 'u1'), ('x', '<i2'), ('y', '<i2'), ('direction', 'u1'),
+                        ('old_x', '<i2'), ('old_y', '<i2'), ('last_shot', '<i4'),
+                        ('shield_end_time', '<i4'), ('rapid_fire_end_time', '<i4'),
+                        ('speed_boost_end_time', '<i4'), ('visible', 'u1'),
+                        ('route_col', '<i2'), ('route_row', '<i2'), ('follow_flow', 'u1'),
+                        ('last_think', '<i4'), ('plan_direction', 'u1'), ('fire_direction', 'u1')])
+TERRAIN_RECORD = np.dtype([('x', '<i2'), ('y', '<i2'), ('type', 'u1'), ('health', '<i4')])
+POWERUP_RECORD = np.dtype([('type', 'u1'), ('x', '<i2'), ('y', '<i2'), ('original_y', '<i2'),
+                           ('float_offset', '<f8'), ('spawn_time', '<i4')])
+BULLET_RECORD = np.dtype([('x', '<i2'), ('y', '<i2'), ('direction', 'u1'), ('type', 'u1'),
+                          ('speed', '<i2'), ('owner', '<i2')])
+ORDER_RECORD = np.dtype([('kind', 'u1'), ('index', '<u2')])  # all_sprites 中的先后顺序
+DEAD_WALL_RECORD = np.dtype([('x', '<i2'), ('y', '<i2'), ('type', 'u1')])
+# 定时事件按执行顺序保存，ref 为 key 在坦克或道具记录中的下标（没有 key 时为 -1）
+EVENT_RECORD = np.dtype([('due', '<i4'), ('name', 'u1'), ('ref', '<i2')])
+# BulletSystem 每个已使用槽位的数据，owner 为发射者在坦克记录中的下标
+SYSTEM_RECORD = np.dtype([('x', '<i4'), ('y', '<i4'), ('vx', '<i4'), ('vy', '<i4'),
+                          ('side', 'u1'), ('direction', 'u1'), ('alive', '?'), ('born', '<i8'),
+                          ('owner', '<i2')])
+BULLET_ARRAYS = SYSTEM_RECORD.names[:-1]
+
+# all_sprites 中精灵的种类
+KIND_TANK = 0
+KIND_TERRAIN = 1
+KIND_POWERUP = 2
+
+NO_BASE = -0x8000  # 还没有基地时 base 的引用
+NO_DIRECTION = 0xFF  # 没有方向（None）
+
+DIRECTION_CODES = {direction: index for index, direction in enumerate(DIRECTIONS)}
+TANK_CODES = {name: index for index, name in enumerate(TANK_TYPES)}
+POWERUP_CODES = {name: index for index, name in enumerate(POWERUP_TYPES)}
+EVENT_CODES = {name: index for index, name in enumerate(EVENT_NAMES)}
+BULLET_CODES = {name: index for index, name in enumerate(BULLET_TYPES)}
+
+
+def direction_code(direction):
+    """方向的编码，None 编码为 NO_DIRECTION"""
+    return NO_DIRECTION if direction is None else DIRECTION_CODES[direction]
+
+
+def direction_name(code):
+    """direction_code 的逆操作"""
+    return None if code == NO_DIRECTION else DIRECTIONS[code]
+
+
+def capture(game):
+    """把整局游戏的状态打包为紧凑的字节串（不含 Surface）
+
+    精灵按类型保存为定长的 NumPy 记录；精灵组的顺序会影响模拟结果，
+    所以按组内顺序记录，并记录 all_sprites 中各精灵的先后顺序。
+    """
+    players = game.player_group.sprites()
+    tanks = players + game.enemy_group.sprites()
+    terrain = game.terrain_group.sprites()
+    powerups = game.powerup_group.sprites()
+    bullets = game.bullet_group.sprites()
+    tank_index = {tank: index for index, tank in enumerate(tanks)}
+    terrain_index = {sprite: index for index, sprite in enumerate(terrain)}
+    powerup_index = {sprite: index for index, sprite in enumerate(powerups)}
+
+    order = []
+    for sprite in game.all_sprites:
+        if sprite in tank_index:
+            order.append((KIND_TANK, tank_index[sprite]))
+        elif sprite in terrain_index:
+            order.append((KIND_TERRAIN, terrain_index[sprite]))
+        else:
+            order.append((KIND_POWERUP, powerup_index[sprite]))
+
+    # 已被摧毁的墙仍然留在 base_walls 中，单独记录位置和类型，用负数引用
+    dead_walls = []
+
+    def terrain_ref(sprite):
+        if sprite in terrain_index:
+            return terrain_index[sprite]
+        dead_walls.append((sprite.rect.x, sprite.rect.y, TERRAIN_CODES[sprite.type]))
+        return -len(dead_walls)
+
+    base = getattr(game, 'base', None)
+    base_ref = terrain_ref(base) if base is not None else None
+    wall_refs = [terrain_ref(wall) for wall in game.base_walls]
+
+    system = game.bullet_system
+    system_records = None
+    if system is not None:
+        count = system.count
+        system_records = np.empty(count, dtype=SYSTEM_RECORD)
+        for name in BULLET_ARRAYS:
+            system_records[name] = getattr(system, name)[:count]
+        system_records['owner'] = [tank_index.get(owner, -1) for owner in system.owners[:count]]
+
+    # 已被摧毁的坦克和已消失的道具的事件触发时不会做任何事，不保存
+    events = []
+    for due, name, key in game.timers.events():
+        if key is None:
+            ref = -1
+        elif name in TANK_EVENTS:
+            ref = tank_index.get(key)
+        else:
+            ref = powerup_index.get(key)
+        if ref is not None:
+            events.append((due, EVENT_CODES[name], ref))
+
+    clock = game.sim_clock
+    header = HEADER.pack(
+        SNAPSHOT_VERSION, GAME_STATES.index(game.game_state), game.game_over,
+        GAME_OVER_REASONS.index(game.game_over_reason), game.current_level, game.lives,
+        game.score, game.enemies_remaining, game.last_enemy_spawn, game.base_shield_end_time,
+        clock.now, clock.frame, clock.remainder, game.rng.seed,
+        *[getattr(game.rng, name).getstate() for name in STREAMS],
+        len(tanks), len(players), len(terrain), len(powerups), len(bullets), len(order),
+        NO_BASE if base_ref is None else base_ref, len(wall_refs), len(dead_walls),
+        -1 if system is None else system.count, 0 if system is None else system.frame,
+        0 if system is None else len(system.free_slots), len(events), game.enemy_spawn_ready)
+
+    sections = [
+        np.array([(TANK_CODES[tank.tank_type], tank.rect.x, tank.rect.y,
+                   DIRECTION_CODES[tank.direction], tank.old_x, tank.old_y, tank.last_shot,
+                   tank.shield_end_time, tank.rapid_fire_end_time, tank.speed_boost_end_time,
+                   tank.visible) + (tank.route_tile or (-1, -1)) +
+                  (tank.follow_flow, tank.last_think, direction_code(tank.plan_direction),
+                   direction_code(tank.fire_direction))
+                  for tank in tanks], dtype=TANK_RECORD),
+        np.array([(sprite.rect.x, sprite.rect.y, TERRAIN_CODES[sprite.type], sprite.health)
+                  for sprite in terrain], dtype=TERRAIN_RECORD),
+        np.array([(POWERUP_CODES[sprite.type], sprite.rect.x, sprite.rect.y, sprite.original_y,
+                   sprite.float_offset, sprite.spawn_time) for sprite in powerups],
+                 dtype=POWERUP_RECORD),
+        np.array([(bullet.rect.x, bullet.rect.y, DIRECTION_CODES[bullet.direction],
+                   BULLET_CODES[bullet.tank_type], bullet.speed, tank_index.get(bullet.owner, -1))
+                  for bullet in bullets], dtype=BULLET_RECORD),
+        np.array(order, dtype=ORDER_RECORD),
+        np.array(wall_refs, dtype='<i2'),
+        np.array(dead_walls, dtype=DEAD_WALL_RECORD),
+        np.array(events, dtype=EVENT_RECORD),
+    ]
+    if system is not None:
+        sections.append(system_records)
+        sections.append(np.array(system.free_slots, dtype='<u2'))
+    return b''.join([header] + [section.tobytes() for section in sections])
+
+
+def restore(game, data):
+    """用 capture() 打包的状态替换当前游戏状态"""
+    version, = struct.unpack_from('<H', data, 0)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    (_, game_state, game_over, reason, level, lives, score, enemies_remaining,
+     last_enemy_spawn, base_shield_end_time, now, frame, remainder, seed,
+     *rest) = HEADER.unpack_from(data, 0)
+    rng_states = rest[:len(STREAMS)]
+    (tank_count, player_count, terrain_count, powerup_count, bullet_count, order_count,
+     base_ref, wall_count, dead_count, system_count, system_frame,
+     free_count, event_count, enemy_spawn_ready) = rest[len(STREAMS):]
+
+    offset = HEADER.size
+
+    def read(dtype, count):
+        nonlocal offset
+        records = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        offset += records.nbytes
+        return records
+
+    tank_records = read(TANK_RECORD, tank_count).tolist()
+    terrain_records = read(TERRAIN_RECORD, terrain_count).tolist()
+    powerup_records = read(POWERUP_RECORD, powerup_count).tolist()
+    bullet_records = read(BULLET_RECORD, bullet_count).tolist()
+    order = read(ORDER_RECORD, order_count).tolist()
+    wall_refs = read('<i2', wall_count).tolist()
+    dead_walls = read(DEAD_WALL_RECORD, dead_count).tolist()
+    events = read(EVENT_RECORD, event_count).tolist()
+
+    resource_manager = game.resource_manager
+    game.clear_all_sprites()
+    game.timers.clear()
+    game.game_state = GAME_STATES[game_state]
+    game.game_over = bool(game_over)
+    game.game_over_reason = GAME_OVER_REASONS[reason]
+    game.current_level = level
+    game.lives = lives
+    game.score = score
+    game.enemies_remaining = enemies_remaining
+    game.last_enemy_spawn = last_enemy_spawn
+    game.enemy_spawn_ready = enemy_spawn_ready
+    game.base_shield_end_time = base_shield_end_time
+    clock = game.sim_clock
+    clock.now, clock.frame, clock.remainder = now, frame, remainder
+    game.rng.seed = seed
+    for name, state in zip(STREAMS, rng_states):
+        getattr(game.rng, name).setstate(state)
+
+    # 坦克
+    tanks = []
+    for (tank_type, x, y, direction, old_x, old_y, last_shot, shield_end_time,
+         rapid_fire_end_time, speed_boost_end_time, visible, route_col, route_row,
+         follow_flow, last_think, plan_direction, fire_direction) in tank_records:
+        tank = Tank(x, y, resource_manager, TANK_TYPES[tank_type], game)
+        tank.direction = DIRECTIONS[direction]
+        tank.old_x, tank.old_y = old_x, old_y
+        tank.last_shot = last_shot
+        tank.shield_end_time = shield_end_time
+        tank.rapid_fire_end_time = rapid_fire_end_time
+        tank.speed_boost_end_time = speed_boost_end_time
+        tank.visible = bool(visible)
+        tank.route_tile = (route_col, route_row) if route_col >= 0 else None
+        tank.follow_flow = bool(follow_flow)
+        tank.last_think = last_think
+        tank.plan_direction = direction_name(plan_direction)
+        tank.fire_direction = direction_name(fire_direction)
+        tank.image = tank.images[tank.direction] if tank.visible else tank.hidden_image
+        tanks.append(tank)
+    game.player_group.add(tanks[:player_count])
+    game.enemy_group.add(tanks[player_count:])
+
+    # 地形（同时登记到地形网格）
+    terrain = []
+    for x, y, code, health in terrain_records:
+        sprite = Terrain(x, y, CODE_NAMES[code], resource_manager)
+        sprite.health = health
+        game.tile_map.place(sprite)
+        terrain.append(sprite)
+    game.terrain_group.add(terrain)
+
+    # 道具
+    powerups = []
+    for code, x, y, original_y, float_offset, spawn_time in powerup_records:
+        sprite = game.powerup_pool.acquire(x, original_y, POWERUP_TYPES[code], resource_manager,
+                                           spawn_time)
+        sprite.rect.y = y
+        sprite.float_offset = float_offset
+        powerups.append(sprite)
+    game.powerup_group.add(powerups)
+
+    # 按原来的顺序加入 all_sprites
+    by_kind = (tanks, terrain, powerups)
+    game.all_sprites.add([by_kind[kind][index] for kind, index in order])
+
+    # 发射者已被摧毁的子弹只需要一个能找到 game_manager 的发射者
+    ghost = None
+
+    def owner_of(index):
+        nonlocal ghost
+        if index >= 0:
+            return tanks[index]
+        if ghost is None:
+            ghost = Tank(0, 0, resource_manager, 'player', game)
+        return ghost
+
+    bullets = []
+    for x, y, direction, code, speed, owner in bullet_records:
+        bullet = game.bullet_pool.acquire(x, y, DIRECTIONS[direction], resource_manager,
+                                          BULLET_TYPES[code], owner_of(owner))
+        bullet.speed = speed
+        bullets.append(bullet)
+    game.bullet_group.add(bullets)
+
+    def terrain_of(ref):
+        if ref >= 0:
+            return terrain[ref]
+        x, y, code = dead_walls[-ref - 1]
+        return Terrain(x, y, CODE_NAMES[code], resource_manager)
+
+    game.base = terrain_of(base_ref) if base_ref != NO_BASE else None
+    if game.base is not None:
+        game.flow_field.set_target(*game.tile_map.tile_of(game.base.rect.x, game.base.rect.y))
+    game.base_walls = [terrain_of(ref) for ref in wall_refs]
+
+    # 定时事件（按原来的顺序重新登记）
+    for due, code, ref in events:
+        name = EVENT_NAMES[code]
+        if ref < 0:
+            key = None
+        elif name in TANK_EVENTS:
+            key = tanks[ref]
+        else:
+            key = powerups[ref]
+        game.timers.schedule(name, due, key)
+
+    system = game.bullet_system
+    if system_count >= 0:
+        system_records = read(SYSTEM_RECORD, system_count)
+        free_slots = read('<u2', free_count).tolist()
+        if system is not None:
+            if system_count > system.capacity:
+                system._allocate(system_count)
+            for name in BULLET_ARRAYS:
+                getattr(system, name)[:system_count] = system_records[name]
+            system.count = system_count
+            system.frame = system_frame
+            system.free_slots = free_slots
+            system.owners[:system_count] = [
+                owner_of(index) if index >= 0 or alive else None
+                for index, alive in zip(system_records['owner'].tolist(),
+                                        system_records['alive'].tolist())]
+
+    game.tank_hash.rebuild(tanks)
+    game.previous_positions = {}
+    if game.renderer is not None:
+        game.renderer.invalidate()
@@ -0,0 +1,98 @@
+class SpatialHash:
+    """坦克碰撞粗检测：按固定大小的格子对精灵矩形分桶"""
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sprite_cells = {}
+
+    def _cells_for(self, rect):
+        """计算矩形覆盖的格子键"""
+        size = self.cell_size
+        col_start = rect.left // size
+        col_end = (rect.right - 1) // size
+        row_start = rect.top // size
+        row_end = (rect.bottom - 1) // size
+        if col_start == col_end and row_start == row_end:
+            return ((col_start, row_start),)
+        return tuple((col, row)
+                     for row in range(row_start, row_end + 1)
+                     for col in range(col_start, col_end + 1))
+
+    def clear(self):
+        """清空所有格子"""
+        self.cells.clear()
+        self.sprite_cells.clear()
+
+    def rebuild(self, sprites):
+        """每帧重建一次：只保留当前仍存活的精灵"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        """加入一个精灵"""
+        keys = self._cells_for(sprite.rect)
+        self.sprite_cells[sprite] = keys
+        cells = self.cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def remove(self, sprite):
+        """移除一个精灵"""
+        keys = self.sprite_cells.pop(sprite, ())
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(sprite)
+            if not bucket:
+                del self.cells[key]
+
+    def move(self, sprite):
+        """精灵位置变化后更新所在格子（格子未变时不做任何事）"""
+        keys = self.sprite_cells.get(sprite)
+        if keys is None:
+            return
+        new_keys = self._cells_for(sprite.rect)
+        if new_keys != keys:
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def query(self, rect):
+        """返回与矩形重叠且仍存活的精灵"""
+        cells = self.cells
+        keys = self._cells_for(rect)
+        if len(keys) == 1:
+            bucket = cells.get(keys[0], ())
+            return [sprite for sprite in bucket
+                    if sprite.rect.colliderect(rect) and sprite.alive()]
+        found = []
+        for key in keys:
+            for sprite in cells.get(key, ()):
+                if (sprite not in found and sprite.rect.colliderect(rect)
+                        and sprite.alive()):
+                    found.append(sprite)
+        return found
+
+    def pairs(self):
+        """返回所有相互重叠的精灵对，每对只出现一次"""
+        seen = set()
+        found = []
+        for bucket in self.cells.values():
+            count = len(bucket)
+            if count < 2:
+                continue
+            for i in range(count - 1):
+                a = bucket[i]
+                for j in range(i + 1, count):
+                    b = bucket[j]
+                    if not a.rect.colliderect(b.rect):
+                        continue
+                    pair = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                    if pair in seen:
+                        continue
+                    seen.add(pair)
+                    found.append((a, b))
+        return found
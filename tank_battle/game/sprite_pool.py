@@ -0,0 +1,58 @@
+class SpritePool:
+    """可重复使用的精灵对象池
+
+    acquire(*args) 优先取出空闲的实例并调用它的 reset(*args)，没有空闲
+    实例时用 factory(*args) 创建新实例。精灵 kill() 时调用 release()，
+    先放入待回收列表，每帧结束时 flush() 才回到空闲列表：同一帧内可能
+    还有代码持有它的引用（例如本帧要更新的子弹列表）。空闲实例最多保留
+    capacity 个，超出的交给垃圾回收；capacity 为 0 时相当于不使用对象池。
+    """
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.pending = []
+        self.hits = 0  # 重复使用空闲实例的次数
+        self.misses = 0  # 创建新实例的次数
+        self.discarded = 0  # 超出容量被丢弃的实例数
+
+    def acquire(self, *args):
+        """取出一个精灵（重复使用或新建），参数与构造函数相同"""
+        if self.free:
+            self.hits += 1
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            return sprite
+        self.misses += 1
+        sprite = self.factory(*args)
+        sprite.pool = self
+        return sprite
+
+    def release(self, sprite):
+        """归还已经移除的精灵，flush() 之后才能再次取出"""
+        self.pending.append(sprite)
+
+    def flush(self):
+        """把待回收的精灵放回空闲列表"""
+        for sprite in self.pending:
+            if len(self.free) < self.capacity:
+                self.free.append(sprite)
+            else:
+                sprite.pool = None
+                self.discarded += 1
+        self.pending.clear()
+
+    def hit_rate(self):
+        """取出时重复使用空闲实例的比例"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """统计数据"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'discarded': self.discarded,
+            'free': len(self.free),
+        }
@@ -1,31 +1,138 @@
+import math
 import pygame
 from pygame.sprite import Sprite
 from ..config import Config
+from ..tile_map import EMPTY, GRASS
+
+# 扫掠命中的目标类别（同距离时地形优先）
+HIT_TERRAIN = 0
+HIT_TANK = 1
+
+# 方向对应的单位向量
+DIRECTION_VECTORS = {
+    'up': (0, -1),
+    'down': (0, 1),
+    'left': (-1, 0),
+    'right': (1, 0),
+}
+
+
+def _lead_distance(rect, target, dx, dy):
+    """子弹前沿沿移动方向接触目标矩形所需的距离（已重叠时为0）"""
+    if dy < 0:
+        distance = rect.top - target.bottom + 1
+    elif dy > 0:
+        distance = target.top - rect.bottom + 1
+    elif dx < 0:
+        distance = rect.left - target.right + 1
+    else:
+        distance = target.left - rect.right + 1
+    return max(distance, 0)
+
+
+def sweep_bullet(game_manager, rect, dx, dy, tank_type):
+    """沿子弹本帧的移动路径查找可能命中的目标
+
+    子弹只沿坐标轴移动，用子弹前沿的两条边线做 DDA 网格遍历找到第一个
+    阻挡地形，再在扫掠矩形内查找对方坦克。返回按距离排序的
+    [(distance, kind, target)]，同距离时地形优先于坦克。
+    """
+    length = abs(dx) + abs(dy)
+    tile_map = game_manager.tile_map
+
+    # 子弹前沿的两条边线（取像素中心，避免落在格子边界上）
+    if dx != 0:
+        lead = rect.right - 0.5 if dx > 0 else rect.left + 0.5
+        lanes = [(lead, rect.top + 0.5), (lead, rect.bottom - 0.5)]
+    else:
+        lead = rect.bottom - 0.5 if dy > 0 else rect.top + 0.5
+        lanes = [(rect.left + 0.5, lead), (rect.right - 0.5, lead)]
+
+    hits = []
+    terrain_distance = math.inf
+    codes = tile_map.codes
+    for x0, y0 in lanes:
+        for t, col, row in tile_map.traverse(x0, y0, x0 + dx, y0 + dy):
+            distance = math.ceil(t * length)
+            if distance >= terrain_distance:
+                break
+            if not tile_map.in_bounds(col, row):
+                continue
+            code = codes[row, col]
+            if code != EMPTY and code != GRASS:
+                terrain_distance = distance
+                terrain_hit = tile_map.sprites[row][col]
+                break
+    if terrain_distance != math.inf:
+        hits.append((terrain_distance, HIT_TERRAIN, terrain_hit))
+
+    # 在扫掠范围内查找对方坦克
+    swept = rect.union(rect.move(dx, dy))
+    shooter_is_player = tank_type == 'player'
+    for tank in game_manager.tank_hash.query(swept):
+        if (tank.tank_type == 'player') == shooter_is_player:
+            continue
+        distance = _lead_distance(rect, tank.rect, dx, dy)
+        if distance <= terrain_distance:
+            hits.append((distance, HIT_TANK, tank))
+
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+    return hits
+
+
+def damage_terrain(game_manager, terrain):
+    """子弹击中地形：钢铁和水只挡住子弹，其余地形被摧毁"""
+    if terrain.type != 'steel' and terrain.type != 'water':
+        terrain.kill()
+        # 如果是基地被摧毁，触发游戏结束
+        if terrain.type == 'base':
+            game_manager.game_over = True
+            game_manager.game_over_reason = 'base_destroyed'
+
 
 class Bullet(Sprite):
-    """子弹类"""
+    """子弹类（通常由 GameManager.bullet_pool 创建和重复使用）"""
     def __init__(self, x, y, direction, resource_manager, tank_type, owner):
         super().__init__()
+        self.pool = None  # 所属的对象池
+        self.rect = None
+        self.reset(x, y, direction, resource_manager, tank_type, owner)
+
+    def reset(self, x, y, direction, resource_manager, tank_type, owner):
+        """（重新）初始化子弹，对象池取出已回收的子弹时调用"""
         self.resource_manager = resource_manager
         self.tank_type = tank_type  # player 或 enemy
         self.owner = owner
         self.direction = direction
-        
+
         # 加载图像
         image_key = f"{tank_type}_{direction}"
         self.image = self.resource_manager.get_image('bullet', image_key)
-        self.rect = self.image.get_rect()
+        if self.rect is None:
+            self.rect = self.image.get_rect()
+        else:
+            self.rect.size = self.image.get_size()
         self.rect.x = x
         self.rect.y = y
-        
+
         # 设置速度
         if tank_type == 'player':
             self.speed = Config.PLAYER_BULLET_SPEED
         else:
             self.speed = Config.ENEMY_BULLET_SPEED
-            
+
+    def kill(self):
+        """从所有精灵组中移除，来自对象池的子弹同时归还给对象池"""
+        if self.pool is not None and self.alive():
+            self.pool.release(self)
+        super().kill()
+
     def update(self, current_time):
         """更新子弹位置"""
+        if Config.SWEPT_BULLET_COLLISION:
+            self.update_swept(current_time)
+            return
+
         # 移动子弹
         if self.direction == 'up':
             self.rect.y -= self.speed
@@ -35,32 +142,23 @@ class Bullet(Sprite):
             self.rect.x -= self.speed
         elif self.direction == 'right':
             self.rect.x += self.speed
-            
+
         # 检查是否超出屏幕
-        if (self.rect.bottom < 0 or self.rect.top > Config.SCREEN_HEIGHT or
-            self.rect.right < 0 or self.rect.left > Config.SCREEN_WIDTH):
+        if self.is_off_screen():
             self.kill()
             return
-            
+
         # 获取游戏管理器
         game_manager = self.owner.game_manager
-        
+
         # 检查碰撞
         # 检查与地形的碰撞
         terrain_hits = pygame.sprite.spritecollide(self, game_manager.terrain_group, False)
         for terrain in terrain_hits:
-            # 对于地形，除了钢铁和水外都可以被摧毁
-            if terrain.type != 'steel' and terrain.type != 'water' and terrain.type != 'grass':
-                terrain.kill()
-                # 如果是基地被摧毁，触发游戏结束
-                if terrain.type == 'base':
-                    game_manager.game_over = True
-                    game_manager.game_over_reason = 'base_destroyed'
-            # 除了草地外，子弹都会消失
             if terrain.type != 'grass':
-                self.kill()
+                self.hit_terrain(terrain)
                 return
-            
+
         # 检查与坦克的碰撞
         if self.tank_type == 'player':
             # 玩家子弹检查与敌人的碰撞
@@ -76,3 +174,37 @@ class Bullet(Sprite):
                 if player.hit(current_time):
                     self.kill()
                 return
+
+    def update_swept(self, current_time):
+        """沿移动路径做扫掠碰撞检测，高速子弹也不会穿过目标"""
+        step_x, step_y = DIRECTION_VECTORS[self.direction]
+        dx = step_x * self.speed
+        dy = step_y * self.speed
+
+        # 按距离顺序处理路径上的目标
+        for _, kind, target in sweep_bullet(self.owner.game_manager, self.rect,
+                                            dx, dy, self.tank_type):
+            if kind == HIT_TANK:
+                # 护盾有效时子弹穿过坦克继续飞行
+                if target.hit(current_time):
+                    self.kill()
+                    return
+            else:
+                self.hit_terrain(target)
+                return
+
+        # 没有命中，移动子弹
+        self.rect.x += dx
+        self.rect.y += dy
+        if self.is_off_screen():
+            self.kill()
+
+    def hit_terrain(self, terrain):
+        """击中地形后子弹消失"""
+        damage_terrain(self.owner.game_manager, terrain)
+        self.kill()
+
+    def is_off_screen(self):
+        """检查子弹是否完全离开屏幕"""
+        return (self.rect.bottom < 0 or self.rect.top > Config.SCREEN_HEIGHT or
+                self.rect.right < 0 or self.rect.left > Config.SCREEN_WIDTH)
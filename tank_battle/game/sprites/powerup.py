@@ -12,8 +12,14 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 class PowerUp(Sprite):
-    def __init__(self, x, y, powerup_type, resource_manager):
+    """道具类（通常由 GameManager.powerup_pool 创建和重复使用）"""
+    def __init__(self, x, y, powerup_type, resource_manager, current_time):
         super().__init__()
+        self.pool = None  # 所属的对象池
+        self.reset(x, y, powerup_type, resource_manager, current_time)
+
+    def reset(self, x, y, powerup_type, resource_manager, current_time):
+        """（重新）初始化道具，对象池取出已回收的道具时调用"""
         self.type = powerup_type
         self.resource_manager = resource_manager
         
@@ -32,20 +38,23 @@ class PowerUp(Sprite):
         # 动画效果
         self.original_y = y
         self.float_offset = 0
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = current_time
         
-        # ���出现音效
+        # 播放出现音效
         self.resource_manager.play_sound('powerup_appear')
 
+    def kill(self):
+        """从所有精灵组中移除，来自对象池的道具同时归还给对象池"""
+        if self.pool is not None and self.alive():
+            self.pool.release(self)
+        super().kill()
+
     def update(self, current_time):
         """更新道具状态"""
         # 浮动动画
         self.float_offset += 0.1
         self.rect.centery = self.original_y + int(math.sin(self.float_offset) * 5)
-        
-        # 检查道具是否应该消失
-        if current_time - self.spawn_time >= Config.POWERUP_DURATION:
-            self.kill()
+        # 到期消失由 GameManager.timers 的 powerup_expire 事件处理
 
     def apply(self, tank, current_time):
         """应用道具效果"""
@@ -58,8 +67,9 @@ class PowerUp(Sprite):
         self.kill()  # 使用后消失
 
 class PowerUpManager:
-    def __init__(self, resource_manager):
+    def __init__(self, resource_manager, rng=random):
         self.resource_manager = resource_manager
+        self.rng = rng  # 道具掉落使用的随机数流
         self.powerups = pygame.sprite.Group()
         self.last_spawn_time = 0
         self.spawn_delay = 20000  # 20秒
@@ -69,15 +79,15 @@ class PowerUpManager:
         if current_time - self.last_spawn_time < self.spawn_delay:
             return
             
-        if random.random() < Config.POWERUP_SPAWN_CHANCE:
+        if self.rng.random() < Config.POWERUP_SPAWN_CHANCE:
             # 随机选择道具类型
             powerup_types = ['shield', 'speed', 'rapid_fire', 'base_shield']
-            powerup_type = random.choice(powerup_types)
+            powerup_type = self.rng.choice(powerup_types)
             
             # 随机选择位置（确保不与墙体重叠）
             while True:
-                x = random.randint(0, Config.SCREEN_WIDTH - 32)
-                y = random.randint(0, Config.SCREEN_HEIGHT - 32)
+                x = self.rng.randint(0, Config.SCREEN_WIDTH - 32)
+                y = self.rng.randint(0, Config.SCREEN_HEIGHT - 32)
                 temp_rect = pygame.Rect(x, y, 32, 32)
                 
                 collision = False
@@ -90,13 +100,17 @@ class PowerUpManager:
                     break
             
             # 创建新道具
-            powerup = PowerUp(x, y, powerup_type, self.resource_manager)
+            powerup = PowerUp(x, y, powerup_type, self.resource_manager, current_time)
             self.powerups.add(powerup)
             self.last_spawn_time = current_time
             
     def update(self, current_time):
         """更新所有道具"""
         self.powerups.update(current_time)
+        # 不经过 GameManager 的道具自己检查是否到期
+        for powerup in self.powerups.sprites():
+            if current_time - powerup.spawn_time >= Config.POWERUP_DURATION:
+                powerup.kill()
         
     def check_collision(self, tank, current_time):
         """检查与玩家的碰撞"""
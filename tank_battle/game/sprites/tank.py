@@ -4,8 +4,16 @@
 import pygame
 from pygame.sprite import Sprite
 from ..config import Config
-from .bullet import Bullet
-import random
+from .bullet import DIRECTION_VECTORS
+from ..tile_map import TERRAIN_CODES
+from .. import actions
+
+# 道具效果的结束时间字段 -> 到期时触发的定时事件
+POWERUP_TIMERS = {
+    'shield_end_time': 'shield_end',
+    'speed_boost_end_time': 'speed_boost_end',
+    'rapid_fire_end_time': 'rapid_fire_end',
+}
 
 class Tank(Sprite):
     def __init__(self, x, y, resource_manager, tank_type, game_manager):
@@ -20,9 +28,13 @@ class Tank(Sprite):
         for direction in ['up', 'down', 'left', 'right']:
             self.images[direction] = self.resource_manager.get_image('tank', f'{tank_type}_{direction}')
         self.image = self.images[self.direction]
+        # 无敌闪烁时使用的共享透明图像
+        self.hidden_image = self.resource_manager.get_blank_image((Config.TANK_SIZE, Config.TANK_SIZE))
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        self.old_x = x
+        self.old_y = y
         
         # 设置属性
         if tank_type == 'player':
@@ -43,6 +55,16 @@ class Tank(Sprite):
         # 道具状态
         self.visible = True
         
+        # 寻路状态：每进入一个新格子决定一次是否沿流场走
+        self.path_weight = Config.ENEMY_TYPES.get(tank_type, {}).get('path_weight', 0)
+        self.route_tile = None
+        self.follow_flow = False
+        
+        # AI 决策：由 AIScheduler 分帧调用 think()，其余帧继续执行上次的决策
+        self.last_think = -1  # 上次决策的帧号
+        self.plan_direction = None  # 沿流场要转向的方向
+        self.fire_direction = None  # 朝这个方向能打到玩家或基地
+        
     def update(self, current_time):
         """更新坦克状态"""
         if self.tank_type == 'player':
@@ -50,8 +72,7 @@ class Tank(Sprite):
         else:
             self.update_enemy(current_time)
             
-        # 更新道具状态
-        self.update_powerups(current_time)
+        # 道具效果由 GameManager.timers 在到期时清除
         
         # 更新无敌状态闪烁效果
         if self.shield_end_time > current_time:
@@ -67,38 +88,14 @@ class Tank(Sprite):
                 powerup.apply(self, current_time)
                 self.game_manager.score += Config.POINTS_PER_POWERUP  # 拾取道具加分
             
-        # 检查碰撞
-        for other_tank in self.game_manager.player_group.sprites() + self.game_manager.enemy_group.sprites():
-            if other_tank != self and self.rect.colliderect(other_tank.rect):
-                # 如果是玩家和敌人相撞
-                if (self.tank_type == 'player' and other_tank.tank_type != 'player') or \
-                   (self.tank_type != 'player' and other_tank.tank_type == 'player'):
-                    # 两者都死亡
-                    self.kill()
-                    other_tank.kill()
-                    if self.tank_type == 'player':
-                        self.game_manager.handle_player_death()
-                    else:
-                        self.game_manager.handle_enemy_death(self)
-                    if other_tank.tank_type == 'player':
-                        self.game_manager.handle_player_death()
-                    else:
-                        self.game_manager.handle_enemy_death(other_tank)
-                    break
-                # 如果是敌人之间相撞
-                elif self.tank_type != 'player' and other_tank.tank_type != 'player':
-                    # 返回原位置并改变方向
-                    self.rect.x = self.old_x
-                    self.rect.y = self.old_y
-                    self.direction = random.choice(['up', 'down', 'left', 'right'])
-                    break
+        # 坦克之间的碰撞由 GameManager.resolve_tank_collisions 统一处理
             
         # 根据可见性设置图像
         if self.visible:
             self.image = self.images[self.direction]
         else:
-            # 创建一个透明的surface
-            self.image = pygame.Surface((Config.TANK_SIZE, Config.TANK_SIZE), pygame.SRCALPHA)
+            # 使用共享的透明图像，避免每帧创建新的surface
+            self.image = self.hidden_image
             
     def draw(self, surface):
         """绘制坦克"""
@@ -110,7 +107,7 @@ class Tank(Sprite):
         if direction is None:
             direction = self.direction
         if speed is None:
-            speed = self.get_current_speed()
+            speed = self.get_current_speed(self.game_manager.sim_clock.now)
         
         # 记录原始位置
         self.old_x = self.rect.x
@@ -144,64 +141,166 @@ class Tank(Sprite):
         # 更新方向和图像
         self.direction = direction
         self.image = self.images[direction]
+        self.game_manager.tank_hash.move(self)
         return True
         
     def update_player(self, current_time):
         """更新玩家坦克"""
-        # 获取按键状态
-        keys = pygame.key.get_pressed()
-        speed = self.get_current_speed()
-        
+        # 获取动作：step() 注入的动作优先，否则读取键盘
+        player_actions = self.game_manager.player_actions
+        if player_actions is None:
+            player_actions = actions.actions_from_keys(pygame.key.get_pressed())
+
         # 移动
-        moved = False
-        if keys[pygame.K_UP]:
-            moved = self.move('up', speed)
-        elif keys[pygame.K_DOWN]:
-            moved = self.move('down', speed)
-        elif keys[pygame.K_LEFT]:
-            moved = self.move('left', speed)
-        elif keys[pygame.K_RIGHT]:
-            moved = self.move('right', speed)
-            
+        direction = actions.move_direction(player_actions)
+        if direction is not None:
+            self.move(direction, self.get_current_speed(current_time))
+
         # 射击
-        if keys[pygame.K_SPACE]:
+        if player_actions & actions.FIRE:
             self.shoot(current_time)
             
     def update_enemy(self, current_time):
-        """更新敌人坦克"""
+        """更新敌人坦克：执行最近一次决策"""
+        rng = self.game_manager.rng.ai
         # 记录当前位置
         old_x = self.rect.x
         old_y = self.rect.y
+        speed = self.get_current_speed(current_time)
+        
+        # 沿流场走向基地时先转向
+        self.follow_route(speed)
         
         # 移动
-        moved = self.move()
+        moved = self.move(speed=speed)
         
-        # 如果移动失败（碰到障碍物），随机��择新方向
-        if not moved:
+        if not moved and self.follow_flow and self.facing_destructible():
+            # 路线被砖墙或基地挡住：停下开火
+            self.shoot(current_time)
+        elif not moved:
             # 恢复原位置
             self.rect.x = old_x
             self.rect.y = old_y
+            # 被其他障碍挡住，这个格子内改为随机游走
+            self.follow_flow = False
             # 选择新方向，避免选择当前方向
             available_directions = ['up', 'down', 'left', 'right']
             available_directions.remove(self.direction)
-            self.direction = random.choice(available_directions)
+            self.direction = rng.choice(available_directions)
             # 尝试新方向移动
-            self.move()
+            self.move(speed=speed)
         
         # 随机改变方向（降低频率，从2%改为1%）
-        if random.random() < 0.01:
+        if not self.follow_flow and rng.random() < 0.01:
             available_directions = ['up', 'down', 'left', 'right']
             available_directions.remove(self.direction)  # 避免选择当前方向
-            self.direction = random.choice(available_directions)
+            self.direction = rng.choice(available_directions)
         
-        # 随机射击（保持5%概率）
-        if random.random() < 0.05:
+        if Config.ENEMY_LINE_OF_FIRE:
+            # 只在上次决策时正前方能打到玩家或基地、且还朝着那个方向时射击
+            if self.fire_direction == self.direction:
+                self.shoot(current_time)
+        elif rng.random() < 0.05:
+            # 随机射击（保持5%概率）
             self.shoot(current_time)
             
+    def think(self, frame):
+        """决策（由 AIScheduler 分帧调用）
+
+        进入新格子时按 path_weight 决定是否沿流场走，查询流场方向，
+        并判断正前方能否打到玩家或基地。
+        """
+        tile_size = Config.TILE_SIZE
+        col = (self.rect.x + tile_size // 2) // tile_size
+        row = (self.rect.y + tile_size // 2) // tile_size
+        if (col, row) != self.route_tile:
+            self.route_tile = (col, row)
+            self.follow_flow = Config.ENEMY_PATHFINDING and \
+                self.game_manager.rng.ai.random() < self.path_weight
+        self.plan_direction = None
+        if self.follow_flow:
+            self.plan_direction = self.game_manager.flow_field.direction_at(col, row)
+        self.fire_direction = None
+        if Config.ENEMY_LINE_OF_FIRE and self.target_in_sight():
+            self.fire_direction = self.direction
+        self.last_think = frame
+        
+    def follow_route(self, speed):
+        """沿流场走时朝决策的方向转向
+
+        坦克和格子一样大，转向垂直方向前要先对齐到格子，
+        离对齐位置还差一步以上时继续沿原方向前进。离开决策时
+        所在的格子后，在下一次决策之前保持原方向。
+        """
+        direction = self.plan_direction
+        if not self.follow_flow or direction is None or direction == self.direction:
+            return
+        tile_size = Config.TILE_SIZE
+        col = (self.rect.x + tile_size // 2) // tile_size
+        row = (self.rect.y + tile_size // 2) // tile_size
+        if (col, row) != self.route_tile:
+            return
+        
+        vertical = self.direction in ('up', 'down')
+        if vertical != (direction in ('up', 'down')):
+            # 对齐到格子后再转向
+            x, y = self.rect.x, self.rect.y
+            if vertical:
+                offset = y - row * tile_size
+            else:
+                offset = x - col * tile_size
+            if abs(offset) > speed:
+                return
+            if vertical:
+                self.rect.y = row * tile_size
+            else:
+                self.rect.x = col * tile_size
+            if self.game_manager.check_tank_collision(self, self.rect.x, self.rect.y):
+                self.rect.x, self.rect.y = x, y
+                return
+            self.game_manager.tank_hash.move(self)
+        self.direction = direction
+        self.image = self.images[direction]
+        
+    def facing_destructible(self):
+        """坦克正前方的格子是否为可以打掉的砖墙或基地"""
+        tile_map = self.game_manager.tile_map
+        dx, dy = DIRECTION_VECTORS[self.direction]
+        reach = Config.TILE_SIZE // 2 + 1
+        col, row = tile_map.tile_of(self.rect.centerx + dx * reach, self.rect.centery + dy * reach)
+        return tile_map.code_at(col, row) in (TERRAIN_CODES['brick'], TERRAIN_CODES['base'])
+            
+    def target_in_sight(self):
+        """正前方同一行或列上有玩家或基地，且中间没有阻挡子弹的地形"""
+        game_manager = self.game_manager
+        tile_map = game_manager.tile_map
+        x, y = self.rect.center
+        col, row = tile_map.tile_of(x, y)
+        targets = game_manager.player_group.sprites()
+        if game_manager.base.alive():
+            targets.append(game_manager.base)
+        for target in targets:
+            rect = target.rect
+            if self.direction == 'up' or self.direction == 'down':
+                if not rect.left <= x < rect.right:
+                    continue
+                if (rect.centery < y) != (self.direction == 'up'):
+                    continue
+                target_tile = (col, rect.centery // tile_map.tile_size)
+            else:
+                if not rect.top <= y < rect.bottom:
+                    continue
+                if (rect.centerx < x) != (self.direction == 'left'):
+                    continue
+                target_tile = (rect.centerx // tile_map.tile_size, row)
+            if game_manager.line_of_fire.clear_between(col, row, *target_tile):
+                return True
+        return False
+            
     def shoot(self, current_time):
         """发射子弹"""
         # 检查射击冷却
-        if current_time - self.last_shot < self.get_shoot_delay():
+        if current_time - self.last_shot < self.get_shoot_delay(current_time):
             return False
             
         # 计算子弹生成位置
@@ -218,27 +317,32 @@ class Tank(Sprite):
             bullet_x = self.rect.right
             bullet_y = self.rect.centery
             
-        # 创建子弹
-        bullet = Bullet(
-            bullet_x,
-            bullet_y,
-            self.direction,
-            self.resource_manager,
-            'player' if self.tank_type == 'player' else 'enemy',
-            self
-        )
-        
-        # 将子弹添加到精灵组
-        self.game_manager.bullet_group.add(bullet)
-        self.game_manager.all_sprites.add(bullet)
+        bullet_type = 'player' if self.tank_type == 'player' else 'enemy'
+        if self.game_manager.bullet_system is not None:
+            # 使用批量子弹系统
+            self.game_manager.bullet_system.spawn(bullet_x, bullet_y, self.direction,
+                                                  bullet_type, self)
+        else:
+            # 从对象池取出子弹
+            bullet = self.game_manager.bullet_pool.acquire(
+                bullet_x,
+                bullet_y,
+                self.direction,
+                self.resource_manager,
+                bullet_type,
+                self
+            )
+            
+            # 将子弹添加到精灵组（子弹由 GameManager 在坦克之后统一更新）
+            self.game_manager.bullet_group.add(bullet)
         
         # 更新最后射击时间
         self.last_shot = current_time
         return True
         
-    def take_damage(self):
+    def take_damage(self, current_time):
         """受到伤害"""
-        if pygame.time.get_ticks() < self.shield_end_time:
+        if current_time < self.shield_end_time:
             return False  # 护盾有效，不受伤害
             
         self.health -= 1
@@ -250,14 +354,19 @@ class Tank(Sprite):
     def add_powerup(self, powerup_type, current_time):
         """添加道具效果"""
         if powerup_type == 'shield':
-            self.shield_end_time = current_time + Config.SHIELD_DURATION
+            self.set_timer('shield_end_time', current_time + Config.SHIELD_DURATION)
         elif powerup_type == 'speed':
-            self.speed_boost_end_time = current_time + Config.SPEED_BOOST_DURATION
+            self.set_timer('speed_boost_end_time', current_time + Config.SPEED_BOOST_DURATION)
         elif powerup_type == 'rapid_fire':
-            self.rapid_fire_end_time = current_time + Config.RAPID_FIRE_DURATION
+            self.set_timer('rapid_fire_end_time', current_time + Config.RAPID_FIRE_DURATION)
+            
+    def set_timer(self, field, end_time):
+        """设置道具效果的结束时间，并（重新）登记到期事件"""
+        setattr(self, field, end_time)
+        self.game_manager.timers.schedule(POWERUP_TIMERS[field], end_time, self)
             
     def update_powerups(self, current_time):
-        """更新道具状态"""
+        """清除已到期的道具效果（由道具的到期事件调用）"""
         # 道具时间到期后自动失效
         if current_time >= self.shield_end_time:
             self.shield_end_time = 0
@@ -266,15 +375,15 @@ class Tank(Sprite):
         if current_time >= self.rapid_fire_end_time:
             self.rapid_fire_end_time = 0
             
-    def get_current_speed(self):
+    def get_current_speed(self, current_time):
         """获取当前速度（考虑道具加成）"""
-        if pygame.time.get_ticks() < self.speed_boost_end_time:
+        if current_time < self.speed_boost_end_time:
             return self.speed * Config.SPEED_BOOST_MULTIPLIER
         return self.speed
         
-    def get_shoot_delay(self):
+    def get_shoot_delay(self, current_time):
         """获取当前射击延迟（考虑道具加成）"""
-        if pygame.time.get_ticks() < self.rapid_fire_end_time:
+        if current_time < self.rapid_fire_end_time:
             return self.shoot_delay / Config.RAPID_FIRE_MULTIPLIER
         return self.shoot_delay
 
@@ -290,7 +399,8 @@ class Tank(Sprite):
                 self.rect.bottom = Config.SCREEN_HEIGHT - Config.TILE_SIZE
                 self.direction = 'right'  # 朝向右边
                 self.image = self.images[self.direction]
-                self.shield_end_time = current_time + Config.SHIELD_DURATION
+                self.set_timer('shield_end_time', current_time + Config.SHIELD_DURATION)
+                self.game_manager.tank_hash.move(self)
             else:
                 self.kill()
         else:
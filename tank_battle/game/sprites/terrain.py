@@ -1,4 +1,3 @@
-import pygame
 from pygame.sprite import Sprite
 from ..config import Config
 
@@ -20,10 +19,19 @@ class Terrain(Sprite):
         self.health = terrain_config['health']
         self.destructible = terrain_config['destructible']
         
+        # 所在的地形网格（由 TileMap.place 设置）
+        self.tile_map = None
+        
     def update(self, current_time):
         """更新地形状态"""
         pass  # 地形是静态的，不需要更新
 
+    def kill(self):
+        """移除地形，同时从地形网格中注销"""
+        if self.tile_map is not None:
+            self.tile_map.remove(self)
+        super().kill()
+
     def take_damage(self):
         """受到伤害"""
         if not self.destructible:
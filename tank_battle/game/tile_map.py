@@ -0,0 +1,142 @@
+import math
+import numpy as np
+from .config import Config
+
+# 地形类型编码（0 表示空地）
+EMPTY = 0
+TERRAIN_CODES = {
+    'brick': 1,
+    'steel': 2,
+    'water': 3,
+    'grass': 4,
+    'base': 5,
+}
+CODE_NAMES = {code: name for name, code in TERRAIN_CODES.items()}
+GRASS = TERRAIN_CODES['grass']
+
+
+class TileMap:
+    """地形网格：记录每个格子的地形类型编码及对应的地形精灵"""
+    def __init__(self, width=Config.GRID_WIDTH, height=Config.GRID_HEIGHT,
+                 tile_size=Config.TILE_SIZE):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.codes = np.zeros((height, width), dtype=np.uint8)
+        self.sprites = [[None] * width for _ in range(height)]
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """注册地形变化回调 callback(tiles)，tiles 为变化的格子列表，None 表示整张地图"""
+        self.listeners.append(callback)
+
+    def _notify(self, tiles):
+        """通知地形发生变化"""
+        for callback in self.listeners:
+            callback(tiles)
+
+    def clear(self):
+        """清空网格"""
+        self.codes.fill(EMPTY)
+        for row in self.sprites:
+            for col in range(self.width):
+                row[col] = None
+        self._notify(None)
+
+    def in_bounds(self, col, row):
+        """检查格子坐标是否在地图内"""
+        return 0 <= col < self.width and 0 <= row < self.height
+
+    def tile_of(self, x, y):
+        """获取像素坐标所在的格子"""
+        return int(x) // self.tile_size, int(y) // self.tile_size
+
+    def place(self, terrain):
+        """将地形精灵登记到它所在的格子，返回被替换的旧精灵"""
+        col, row = self.tile_of(terrain.rect.x, terrain.rect.y)
+        old = self.sprites[row][col]
+        self.sprites[row][col] = terrain
+        self.codes[row, col] = TERRAIN_CODES[terrain.type]
+        terrain.tile_map = self
+        if old is not None and old is not terrain:
+            old.tile_map = None
+        self._notify([(col, row)])
+        return old
+
+    def remove(self, terrain):
+        """从网格中移除地形精灵"""
+        col, row = self.tile_of(terrain.rect.x, terrain.rect.y)
+        if self.in_bounds(col, row) and self.sprites[row][col] is terrain:
+            self.sprites[row][col] = None
+            self.codes[row, col] = EMPTY
+            self._notify([(col, row)])
+        terrain.tile_map = None
+
+    def code_at(self, col, row):
+        """获取格子的地形编码，地图外视为空地"""
+        if not self.in_bounds(col, row):
+            return EMPTY
+        return self.codes[row, col]
+
+    def sprite_at(self, col, row):
+        """获取格子上的地形精灵"""
+        if not self.in_bounds(col, row):
+            return None
+        return self.sprites[row][col]
+
+    def tiles_in_rect(self, rect):
+        """遍历矩形覆盖的所有格子坐标"""
+        size = self.tile_size
+        col_start = max(rect.left // size, 0)
+        col_end = min((rect.right - 1) // size, self.width - 1)
+        row_start = max(rect.top // size, 0)
+        row_end = min((rect.bottom - 1) // size, self.height - 1)
+        for row in range(row_start, row_end + 1):
+            for col in range(col_start, col_end + 1):
+                yield col, row
+
+    def blocks_tank(self, rect):
+        """检查矩形是否与阻挡坦克的地形（除草地外）重叠"""
+        codes = self.codes
+        for col, row in self.tiles_in_rect(rect):
+            code = codes[row, col]
+            if code != EMPTY and code != GRASS:
+                return True
+        return False
+
+    def traverse(self, x0, y0, x1, y1):
+        """DDA 网格遍历：按进入顺序返回线段经过的格子 (t, col, row)，t 为线段参数 0~1"""
+        size = self.tile_size
+        col, row = int(x0 // size), int(y0 // size)
+        end_col, end_row = int(x1 // size), int(y1 // size)
+        dx = x1 - x0
+        dy = y1 - y0
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+        if dx != 0:
+            boundary = (col + 1) * size if dx > 0 else col * size
+            t_max_x = (boundary - x0) / dx
+            t_delta_x = size / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0:
+            boundary = (row + 1) * size if dy > 0 else row * size
+            t_max_y = (boundary - y0) / dy
+            t_delta_y = size / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        cells = [(0.0, col, row)]
+        while col != end_col or row != end_row:
+            if t_max_x < t_max_y:
+                t = t_max_x
+                col += step_col
+                t_max_x += t_delta_x
+            else:
+                t = t_max_y
+                row += step_row
+                t_max_y += t_delta_y
+            if t > 1:
+                break
+            cells.append((t, col, row))
+        return cells
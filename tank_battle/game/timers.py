@@ -0,0 +1,68 @@
+import heapq
+
+
+class TimerQueue:
+    """按模拟时间触发的定时事件（最小堆）
+
+    事件由名称和 key（例如坦克或道具，可以为 None）确定，register()
+    为每种名称登记处理函数 handler(key, current_time)。每帧 run_due()
+    只弹出已经到期的事件，不再逐帧检查所有计时器。同一个事件再次
+    schedule() 时替换原来的到期时间（例如重复拾取道具），被替换或
+    cancel() 的堆条目标记为失效，弹出时跳过。到期时间相同的事件按
+    登记的先后顺序执行。
+    """
+    def __init__(self):
+        self.handlers = {}
+        self.clear()
+
+    def clear(self):
+        """取消所有事件（保留处理函数）"""
+        self.heap = []
+        self.entries = {}  # (名称, key) -> 堆条目 [到期时间, 序号, 名称, key, 有效]
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def register(self, name, handler):
+        """登记 name 事件的处理函数"""
+        self.handlers[name] = handler
+
+    def schedule(self, name, due, key=None):
+        """在 due 时刻触发 name 事件，替换同一事件原来的到期时间"""
+        self.cancel(name, key)
+        entry = [due, self.sequence, name, key, True]
+        self.sequence += 1
+        self.entries[name, key] = entry
+        heapq.heappush(self.heap, entry)
+
+    def cancel(self, name, key=None):
+        """取消事件，事件存在时返回 True"""
+        entry = self.entries.pop((name, key), None)
+        if entry is None:
+            return False
+        entry[4] = False
+        return True
+
+    def due_time(self, name, key=None):
+        """事件的到期时间，没有这个事件时返回 None"""
+        entry = self.entries.get((name, key))
+        return None if entry is None else entry[0]
+
+    def run_due(self, current_time):
+        """执行所有到期的事件，返回执行的个数"""
+        heap = self.heap
+        count = 0
+        while heap and heap[0][0] <= current_time:
+            due, _, name, key, active = heapq.heappop(heap)
+            if not active:
+                continue
+            del self.entries[name, key]
+            self.handlers[name](key, current_time)
+            count += 1
+        return count
+
+    def events(self):
+        """所有未到期的事件 [(到期时间, 名称, key)]，按执行顺序排列"""
+        return [(entry[0], entry[2], entry[3])
+                for entry in sorted(self.entries.values(), key=lambda entry: entry[:2])]
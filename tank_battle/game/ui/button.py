@@ -1,11 +1,12 @@
 import pygame
 
 class Button:
-    def __init__(self, x, y, width, height, text, action, font):
+    def __init__(self, x, y, width, height, text, action, font, text_cache=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.action = action
         self.font = font
+        self.text_cache = text_cache  # 共享的文字渲染缓存
         self.color = (128, 128, 128)  # 默认颜色
         self.hover_color = (200, 200, 200)  # 鼠标悬停时的颜色
         self.text_color = (255, 255, 255)  # 文字颜色
@@ -32,6 +33,9 @@ class Button:
         pygame.draw.rect(surface, (255, 255, 255), self.rect, 2)  # 白色边框
         
         # 绘制文本
-        text_surface = self.font.render(self.text, True, self.text_color)
+        if self.text_cache is not None:
+            text_surface = self.text_cache.render(self.font, self.text, self.text_color)
+        else:
+            text_surface = self.font.render(self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
@@ -0,0 +1,90 @@
+import pygame
+from ..config import Config
+
+# 道具类型及其显示名称
+POWERUP_DISPLAY_NAMES = (
+    ('shield', '护盾'),
+    ('speed', '加速'),
+    ('rapid_fire', '快射'),
+    ('base_shield', '基地加固'),
+)
+
+
+class Hud:
+    """右侧HUD面板：缓存为一张 Surface，只在显示的数值变化时重新绘制"""
+    def __init__(self, font, text_cache):
+        self.font = font
+        self.text_cache = text_cache
+        self.rect = pygame.Rect(Config.SCREEN_WIDTH, 0,
+                                Config.WINDOW_WIDTH - Config.SCREEN_WIDTH,
+                                Config.WINDOW_HEIGHT)
+        self.surface = pygame.Surface(self.rect.size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.state = None
+        # 数字逐个绘制并预先渲染，数值（例如道具倒计时）变化时不再渲染新的文字
+        for color in (Config.WHITE, Config.GREEN):
+            for digit in '0123456789-':
+                text_cache.render(font, digit, color)
+
+    def collect_state(self, game_manager, current_time):
+        """收集HUD显示的所有数值（道具剩余时间精确到秒）"""
+        player = next(iter(game_manager.player_group.sprites()), None)
+        end_times = {
+            'shield': player.shield_end_time if player else 0,
+            'speed': player.speed_boost_end_time if player else 0,
+            'rapid_fire': player.rapid_fire_end_time if player else 0,
+            'base_shield': game_manager.base_shield_end_time if player else 0,
+        }
+        powerups = tuple(
+            (end_times[powerup_type] - current_time) // 1000
+            if current_time < end_times[powerup_type] else None
+            for powerup_type, _ in POWERUP_DISPLAY_NAMES
+        )
+        return (game_manager.lives, game_manager.score, game_manager.current_level,
+                len(game_manager.enemy_group), powerups)
+
+    def draw(self, surface, game_manager, current_time, force=False):
+        """绘制HUD，返回面板是否重新绘制到了 surface 上"""
+        state = self.collect_state(game_manager, current_time)
+        if state != self.state:
+            self.state = state
+            self.render(state)
+        elif not force:
+            return False
+        surface.blit(self.surface, self.rect)
+        return True
+
+    def blit_text(self, panel, position, color, *parts):
+        """依次绘制文字片段，int 片段按单个数字绘制"""
+        x, y = position
+        render = self.text_cache.render
+        for part in parts:
+            for text in (str(part) if isinstance(part, int) else (part,)):
+                surface = render(self.font, text, color)
+                panel.blit(surface, (x, y))
+                x += surface.get_width()
+
+    def render(self, state):
+        """重新绘制缓存的面板"""
+        lives, score, level, enemies, powerups = state
+        panel = self.surface
+        panel.fill(Config.BLACK)
+        text_color = Config.WHITE
+
+        # 生命数、分数、关卡、剩余敌人数量
+        self.blit_text(panel, (10, 10), text_color, "生命: ", lives)
+        self.blit_text(panel, (10, 40), text_color, "分数: ", score)
+        self.blit_text(panel, (10, 70), text_color, "关卡: ", level)
+        self.blit_text(panel, (10, 100), text_color, "敌人: ", enemies)
+
+        # 道具状态
+        self.blit_text(panel, (10, 130), text_color, "道具状态:")
+        y_offset = 160  # 起始Y坐标
+        for (_, display_name), remaining_time in zip(POWERUP_DISPLAY_NAMES, powerups):
+            if remaining_time is not None:
+                self.blit_text(panel, (10, y_offset), Config.GREEN,
+                               f"{display_name}: 激活 (", remaining_time, "秒)")
+            else:
+                self.blit_text(panel, (10, y_offset), Config.GRAY, f"{display_name}: 未激活")
+            y_offset += 25  # 每个道具状态之间的间距
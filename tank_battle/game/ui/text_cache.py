@@ -0,0 +1,30 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """文字渲染缓存：按 (字体, 文本, 颜色) 缓存渲染好的 Surface，超出容量时淘汰最久未用的"""
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """获取渲染好的文字 Surface（调用方不能修改返回的 Surface）"""
+        key = (font, text, antialias, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """清空缓存"""
+        self.entries.clear()
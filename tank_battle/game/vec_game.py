@@ -0,0 +1,139 @@
+import numpy as np
+import pygame
+from .config import Config
+from .game_manager import GameManager
+from .resources.resource_manager import NullResourceManager
+from .rng import new_seed
+from .bullet_system import DIRECTIONS, SIDE_NAMES
+from .snapshot import TANK_TYPES, POWERUP_TYPES
+
+# 观测中每局最多记录的实体数量，超出的部分被截断，不足的部分填 -1
+MAX_ENEMIES = 8
+MAX_BULLETS = 32
+MAX_POWERUPS = 4
+
+# stats 数组各列的含义
+STATS_FIELDS = ('frame', 'time', 'score', 'lives', 'level', 'enemies_remaining')
+
+DIRECTION_CODES = {direction: index for index, direction in enumerate(DIRECTIONS)}
+TANK_CODES = {name: index for index, name in enumerate(TANK_TYPES)}
+SIDE_CODES = {name: index for index, name in enumerate(SIDE_NAMES)}
+POWERUP_CODES = {name: index for index, name in enumerate(POWERUP_TYPES)}
+
+
+class VecGame:
+    """在一个进程里同时运行 N 局相互独立的 headless 游戏
+
+    所有游戏共享一个只读的资源管理器（默认为不生成图像的
+    NullResourceManager），step() 用一组动作同时推进所有游戏一步，
+    返回批量的观测、奖励和结束标志数组。观测是预先分配的数组，
+    每步原地更新，需要保留时请自行复制。
+    """
+    def __init__(self, num_envs, resource_manager=None, auto_reset=True):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if resource_manager is None:
+            resource_manager = NullResourceManager()
+        self.num_envs = num_envs
+        self.resource_manager = resource_manager
+        self.auto_reset = auto_reset
+        self.games = [GameManager(None, resource_manager, headless=True) for _ in range(num_envs)]
+        self.seeds = [None] * num_envs  # 每局当前使用的种子
+        self.next_seed = 0
+        self.last_scores = [0] * num_envs
+
+        self.observations = {
+            'tiles': np.zeros((num_envs, Config.GRID_HEIGHT, Config.GRID_WIDTH), dtype=np.uint8),
+            'player': np.full((num_envs, 3), -1, dtype=np.int16),  # x, y, 方向
+            'enemies': np.full((num_envs, MAX_ENEMIES, 4), -1, dtype=np.int16),  # x, y, 方向, 类型
+            'bullets': np.full((num_envs, MAX_BULLETS, 4), -1, dtype=np.int16),  # x, y, 方向, 阵营
+            'powerups': np.full((num_envs, MAX_POWERUPS, 3), -1, dtype=np.int16),  # x, y, 类型
+            'stats': np.zeros((num_envs, len(STATS_FIELDS)), dtype=np.int32),
+        }
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=np.bool_)
+
+    def __len__(self):
+        return self.num_envs
+
+    def reset(self, seed=None):
+        """重新开始所有游戏，第 i 局使用种子 seed + i，返回观测"""
+        if seed is None:
+            seed = new_seed()
+        self.next_seed = seed
+        for index in range(self.num_envs):
+            self.reset_env(index)
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.observations
+
+    def reset_env(self, index):
+        """用下一个种子重新开始第 index 局"""
+        game = self.games[index]
+        self.seeds[index] = self.next_seed
+        self.next_seed += 1
+        game.reset(self.seeds[index])
+        self.last_scores[index] = game.score
+        self.write_observation(index)
+
+    def step(self, actions):
+        """每局执行一个模拟步，返回 (观测, 奖励, 结束标志)
+
+        actions 是长度为 N 的动作位标志序列。奖励为本步的得分增量。
+        auto_reset 为 True 时，结束的游戏会立即用下一个种子重新开始，
+        返回的是新一局的初始观测（dones 中对应的位置仍为 True）。
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        rewards = self.rewards
+        dones = self.dones
+        for index, (game, player_actions) in enumerate(zip(self.games, actions)):
+            game.simulate(int(player_actions))
+            rewards[index] = game.score - self.last_scores[index]
+            self.last_scores[index] = game.score
+            done = dones[index] = game.game_over
+            if done and self.auto_reset:
+                self.reset_env(index)
+            else:
+                self.write_observation(index)
+        return self.observations, rewards, dones
+
+    def write_observation(self, index):
+        """把第 index 局的状态写入观测数组"""
+        game = self.games[index]
+        observations = self.observations
+        observations['tiles'][index] = game.tile_map.codes
+
+        player = observations['player']
+        tank = next(iter(game.player_group), None)
+        if tank is not None:
+            player[index] = (tank.rect.x, tank.rect.y, DIRECTION_CODES[tank.direction])
+        else:
+            player[index] = -1
+
+        enemies = observations['enemies'][index]
+        records = [(enemy.rect.x, enemy.rect.y, DIRECTION_CODES[enemy.direction],
+                    TANK_CODES[enemy.tank_type]) for enemy in game.enemy_group][:MAX_ENEMIES]
+        enemies[len(records):] = -1
+        if records:
+            enemies[:len(records)] = records
+
+        bullets = observations['bullets'][index]
+        sprites = game.bullet_group.sprites()
+        if game.bullet_system is not None:
+            sprites += game.bullet_system.sprites()
+        records = [(bullet.rect.x, bullet.rect.y, DIRECTION_CODES[bullet.direction],
+                    SIDE_CODES[bullet.tank_type]) for bullet in sprites[:MAX_BULLETS]]
+        bullets[len(records):] = -1
+        if records:
+            bullets[:len(records)] = records
+
+        powerups = observations['powerups'][index]
+        records = [(powerup.rect.x, powerup.rect.y, POWERUP_CODES[powerup.type])
+                   for powerup in game.powerup_group][:MAX_POWERUPS]
+        powerups[len(records):] = -1
+        if records:
+            powerups[:len(records)] = records
+
+        observations['stats'][index] = (game.sim_clock.frame, game.sim_clock.now, game.score,
+                                        game.lives, game.current_level, game.enemies_remaining)
@@ -1,5 +1,10 @@
+import logging
 import os
 import sys
+import time
+
+# 记录启动时间，用于报告首帧耗时
+start_time = time.perf_counter()
 
 # 添加项目根目录到 Python 路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,9 +14,13 @@ if project_root not in sys.path:
 
 from tank_battle.game.game_manager import GameManager
 from tank_battle.game.resources.resource_manager import ResourceManager
+from tank_battle.game.config import Config
 import pygame
 
 def main():
+    # 日志中记录每局游戏的种子等信息
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(name)s: %(message)s')
+    
     # 初始化 Pygame
     pygame.init()
     
@@ -20,13 +29,19 @@ def main():
     pygame.display.set_caption("坦克大战")
     
     # 创建资源管理器
-    resource_manager = ResourceManager()
+    resource_manager = ResourceManager(lazy=Config.LAZY_ASSET_LOADING)
+    if Config.USE_TEXTURE_ATLAS:
+        # 窗口创建后才能转换为显示格式；懒加载时等全部图像预热完再打包
+        if resource_manager.warmed_up:
+            resource_manager.build_atlas()
+        else:
+            resource_manager.pack_atlas = True
     
     # 创建游戏管理器
     game_manager = GameManager(screen, resource_manager)
     
     # 运行游戏
-    game_manager.run()
+    game_manager.run(start_time)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
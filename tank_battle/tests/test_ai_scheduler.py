@@ -0,0 +1,74 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.ai.scheduler import AIScheduler
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import NullResourceManager
+
+
+class TestAIScheduler(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置：场上有 4 个敌人"""
+        pygame.init()
+        self.game = GameManager(None, NullResourceManager(), headless=True)
+        self.game.reset(6)
+        for enemy in self.game.enemy_group.sprites():
+            enemy.kill()
+        size = Config.TILE_SIZE
+        self.enemies = [self.game.create_enemy(col * 3 * size, 0, 'normal') for col in range(4)]
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_round_robin(self):
+        """测试每帧最多决策 thinks_per_frame 辆，最久没有决策的优先"""
+        scheduler = AIScheduler(thinks_per_frame=2)
+        for frame in range(1, 9):
+            self.assertEqual(scheduler.run(self.game.enemy_group, frame), 2)
+        self.assertEqual([enemy.last_think for enemy in self.enemies], [7, 7, 8, 8])
+        metrics = scheduler.metrics()
+        self.assertEqual(metrics['thinks'], 16)
+        self.assertEqual(metrics['skipped'], 16)
+        self.assertEqual(metrics['max_latency'], 2)
+        self.assertEqual(metrics['mean_latency'], 2)
+
+    def test_unlimited(self):
+        """测试 thinks_per_frame 为 None 时每帧全部决策"""
+        scheduler = AIScheduler(thinks_per_frame=None)
+        for frame in range(1, 4):
+            self.assertEqual(scheduler.run(self.game.enemy_group, frame), 4)
+        self.assertEqual(scheduler.metrics()['skipped'], 0)
+        self.assertEqual(scheduler.metrics()['max_latency'], 1)
+
+    def test_budget_thinks_at_least_one(self):
+        """测试时间预算用完时停止，但每帧至少决策一辆"""
+        scheduler = AIScheduler(thinks_per_frame=None, budget_us=0)
+        for frame in range(1, 5):
+            self.assertEqual(scheduler.run(self.game.enemy_group, frame), 1)
+        self.assertEqual([enemy.last_think for enemy in self.enemies], [1, 2, 3, 4])
+        self.assertEqual(scheduler.metrics()['skipped'], 12)
+
+    def test_enemy_keeps_last_decision(self):
+        """测试没有轮到决策的帧里，敌人继续按上次的决策射击"""
+        game = self.game
+        game.schedule_enemy_spawn(10 ** 9)
+        game.ai_scheduler = AIScheduler(thinks_per_frame=1)
+        enemy = self.enemies[0]
+        enemy.direction = enemy.fire_direction = 'down'
+        enemy.last_shot = -Config.ENEMY_SHOOT_DELAY
+        enemy.last_think = 10 ** 9  # 排在最后，不会轮到
+        game.update(game.sim_clock.advance())
+        self.assertEqual(enemy.last_think, 10 ** 9)
+        self.assertEqual(enemy.last_shot, game.sim_clock.now)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.debug import SurfaceAllocationCounter
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+
+
+class TestSurfaceAllocations(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.game = GameManager(screen, ResourceManager(use_cache=False))
+        self.game.start_game(5)
+        self.game.schedule_enemy_spawn(0)
+        self.counter = SurfaceAllocationCounter()
+        self.counter.install()
+        self.counter.watch(self.game.text_cache)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        self.counter.uninstall()
+        pygame.quit()
+
+    def run_frames(self, start, count):
+        """运行若干帧，返回创建了 Surface 的帧数"""
+        allocating = 0
+        for frame in range(start, start + count):
+            self.counter.begin_frame()
+            self.game.update(frame * 16)
+            self.game.draw()
+            if self.counter.end_frame(steady=False):
+                allocating += 1
+        return allocating
+
+    def test_counts_c_level_allocations(self):
+        """测试 transform、copy/subsurface、字体渲染和文字缓存未命中都会被统计"""
+        counter = self.counter
+        start = counter.count()
+        surface = pygame.Surface((8, 8))
+        pygame.transform.rotate(surface, 90)
+        surface.copy()
+        surface.subsurface((0, 0, 4, 4))
+        font = pygame.font.Font(None, 16)
+        font.render('x', True, Config.WHITE)
+        self.assertEqual(counter.count() - start, 5)
+        start = counter.count()
+        self.game.text_cache.render(self.game.hud.font, 'new text', Config.WHITE)
+        self.game.text_cache.render(self.game.hud.font, 'new text', Config.WHITE)
+        self.assertEqual(counter.count() - start, 1)
+
+    def test_shield_blink_does_not_allocate(self):
+        """测试护盾闪烁、HUD 倒计时期间不创建新的 Surface（包括文字）"""
+        player = self.game.player_group.sprites()[0]
+        player.shield_end_time = 100000
+        # 加固基地，避免测试期间基地被摧毁导致游戏结束
+        self.game.apply_base_shield(0)
+        self.run_frames(1, 10)  # 预热（首帧整屏绘制等）
+        misses = self.game.text_cache.misses
+        hud_state = self.game.hud.state
+        self.assertEqual(self.run_frames(11, 300), 0)
+        # HUD 的倒计时在这期间变化过，但没有渲染新的文字
+        self.assertNotEqual(self.game.hud.state, hud_state)
+        self.assertEqual(self.game.text_cache.misses, misses)
+
+    def test_game_over_overlay_allocated_once(self):
+        """测试游戏结束遮罩只创建一次"""
+        self.game.game_over = True
+        self.game.game_over_reason = 'base_destroyed'
+        self.run_frames(1, 2)
+        self.assertEqual(self.run_frames(3, 60), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import csv
+import shutil
+import tempfile
+import unittest
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from tools import balance_sweep
+
+
+class TestBalanceSweep(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.out = os.path.join(self.temp_dir, 'sweep.csv')
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_build_grid(self):
+        """测试参数解析和笛卡尔积"""
+        params = [balance_sweep.parse_param('enemies=4,8'),
+                  balance_sweep.parse_param('enemy_types.elite=0,0.5')]
+        grid = balance_sweep.build_grid(params)
+        self.assertEqual(len(grid), 4)
+        self.assertIn({'enemies': 8, 'enemy_types.elite': 0.5}, grid)
+        config = balance_sweep.apply_point({'enemies': 5, 'enemy_types': {'elite': 0.1}},
+                                           {'enemies': 8, 'enemy_types.elite': 0.5})
+        self.assertEqual(config, {'enemies': 8, 'enemy_types': {'elite': 0.5}})
+        with self.assertRaises(Exception):
+            balance_sweep.parse_param('speed=1,2')
+
+    def test_sweep_is_resumable(self):
+        """测试结果写入 CSV，重新运行时跳过已完成的局"""
+        grid = balance_sweep.build_grid([balance_sweep.parse_param('enemies=2,3')])
+        count = balance_sweep.sweep(1, grid, 2, max_ticks=60, out=self.out, workers=1)
+        self.assertEqual(count, 4)
+        self.assertEqual(balance_sweep.sweep(1, grid, 3, max_ticks=60, out=self.out, workers=1), 2)
+        with open(self.out, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual({row['outcome'] for row in rows} - {'win', 'loss', 'timeout'}, set())
+        summary = dict(balance_sweep.summarize(self.out))
+        self.assertEqual(summary['enemies=2']['games'], 3)
+
+    def test_resume_without_params(self):
+        """测试没有参数时（只有一个空的参数组合）也能跳过已完成的局并汇总"""
+        grid = balance_sweep.build_grid([])
+        self.assertEqual(grid, [{}])
+        self.assertEqual(balance_sweep.sweep(1, grid, 2, max_ticks=60, out=self.out, workers=1), 2)
+        self.assertEqual(balance_sweep.sweep(1, grid, 2, max_ticks=60, out=self.out, workers=1), 0)
+        with open(self.out, newline='') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 2)
+        self.assertEqual(dict(balance_sweep.summarize(self.out))['']['games'], 2)
+
+    def test_resume_after_partial_row(self):
+        """测试最后一行只写了一部分时，重新运行会截掉它并重跑这一局"""
+        grid = balance_sweep.build_grid([balance_sweep.parse_param('enemies=2')])
+        balance_sweep.sweep(1, grid, 2, max_ticks=60, out=self.out, workers=1)
+        with open(self.out, 'rb') as f:
+            data = f.read()
+        last = data.rstrip(b'\r\n').rfind(b'\n') + 1
+        with open(self.out, 'wb') as f:
+            f.write(data[:last] + b'enemies=2,2,1,wi')
+        self.assertEqual(dict(balance_sweep.summarize(self.out))['enemies=2']['games'], 1)
+
+        self.assertEqual(balance_sweep.sweep(1, grid, 2, max_ticks=60, out=self.out, workers=1), 1)
+        with open(self.out, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(sorted(int(row['seed']) for row in rows), [0, 1])
+        self.assertTrue(all(balance_sweep.complete_row(row) for row in rows))
+        self.assertEqual(dict(balance_sweep.summarize(self.out))['enemies=2']['games'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+from game.sprites.bullet import Bullet
+
+
+class TestSweptBullet(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.game = GameManager(screen, ResourceManager(use_cache=False))
+        self.game.start_game()
+        self.game.clear_all_sprites()
+        self.game.create_player()
+        self.player = self.game.player_group.sprites()[0]
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def fire(self, x, y, direction, speed):
+        """发射一颗指定速度的玩家子弹"""
+        bullet = Bullet(x, y, direction, self.game.resource_manager, 'player', self.player)
+        bullet.speed = speed
+        self.game.bullet_group.add(bullet)
+        return bullet
+
+    def test_fast_bullet_does_not_tunnel_through_steel(self):
+        """测试高速子弹不会穿过钢墙"""
+        size = Config.TILE_SIZE
+        self.game.add_terrain(5 * size, 5 * size, 'steel')
+        bullet = self.fire(5 * size + 16, 7 * size, 'up', 3 * size)
+        bullet.update(0)
+        self.assertFalse(bullet.alive())
+
+    def test_nearest_brick_destroyed_first(self):
+        """测试只摧毁路径上最近的砖墙，草地不阻挡子弹"""
+        size = Config.TILE_SIZE
+        near = self.game.add_terrain(4 * size, 5 * size, 'brick')
+        far = self.game.add_terrain(2 * size, 5 * size, 'brick')
+        self.game.add_terrain(6 * size, 5 * size, 'grass')
+        bullet = self.fire(7 * size, 5 * size + 16, 'left', 4 * size)
+        bullet.update(0)
+        self.assertFalse(near.alive())
+        self.assertTrue(far.alive())
+        self.assertFalse(bullet.alive())
+
+    def test_bullet_hits_enemy_in_path(self):
+        """测试子弹命中路径上的敌人"""
+        size = Config.TILE_SIZE
+        enemy = self.game.create_enemy(5 * size, 2 * size, 'normal')
+        bullet = self.fire(5 * size + 16, 6 * size, 'up', 4 * size)
+        bullet.update(0)
+        self.assertFalse(enemy.alive())
+        self.assertFalse(bullet.alive())
+
+    def test_bullet_moves_when_path_clear(self):
+        """测试路径畅通时子弹正常移动"""
+        bullet = self.fire(400, 300, 'right', 12)
+        bullet.update(0)
+        self.assertTrue(bullet.alive())
+        self.assertEqual(bullet.rect.x, 412)
+
+
+class TestBulletSystem(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.resource_manager = ResourceManager(use_cache=False)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        Config.USE_BULLET_SYSTEM = False
+        pygame.quit()
+
+    def run_game(self, use_bullet_system, seed, frames=600):
+        """以固定随机种子运行一局，返回每帧的局面"""
+        Config.USE_BULLET_SYSTEM = use_bullet_system
+        game = GameManager(self.screen, self.resource_manager)
+        game.start_game(seed)
+        game.current_level = 5
+        game.init_level()
+        game.schedule_enemy_spawn(0)
+        states = []
+        for frame in range(1, frames + 1):
+            game.update(frame * 16)
+            if use_bullet_system:
+                bullets = game.bullet_system.sprites()
+            else:
+                bullets = game.bullet_group.sprites()
+            states.append((
+                sorted(tank.rect.topleft for tank in game.enemy_group),
+                sorted(terrain.rect.topleft for terrain in game.terrain_group),
+                sorted(bullet.rect.topleft for bullet in bullets),
+                game.game_over,
+            ))
+        return states
+
+    def test_same_outcome_as_sprites(self):
+        """测试批量子弹系统与子弹精灵的游戏结果一致"""
+        for seed in (1, 2):
+            self.assertEqual(self.run_game(False, seed), self.run_game(True, seed))
+
+
+if __name__ == '__main__':
+    unittest.main()
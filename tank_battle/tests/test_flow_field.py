@@ -0,0 +1,170 @@
+import sys
+import os
+import random
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.ai.flow_field import FlowField, UNREACHABLE
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import NullResourceManager
+from game.sprites.terrain import Terrain
+from game.tile_map import TileMap
+
+
+class TestFlowField(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置：5x4 的空地图，目标在底部中间"""
+        pygame.init()
+        self.resource_manager = NullResourceManager()
+        self.tile_map = TileMap(5, 4)
+        self.field = FlowField(self.tile_map, brick_cost=4)
+        self.field.set_target(2, 3)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def place(self, col, row, terrain_type):
+        size = self.tile_map.tile_size
+        return self.tile_map.place(Terrain(col * size, row * size, terrain_type, self.resource_manager))
+
+    def test_open_map_distances(self):
+        """测试空地图上的距离和方向"""
+        self.assertEqual(self.field.distance_at(2, 3), 0)
+        self.assertEqual(self.field.distance_at(2, 0), 3)
+        self.assertEqual(self.field.distance_at(0, 0), 5)
+        self.assertEqual(self.field.direction_at(2, 0), 'down')
+        self.assertEqual(self.field.direction_at(0, 3), 'right')
+        self.assertEqual(self.field.direction_at(4, 3), 'left')
+        self.assertIsNone(self.field.direction_at(2, 3))
+        self.assertEqual(self.field.distance_at(-1, 0), UNREACHABLE)
+
+    def test_terrain_costs(self):
+        """测试砖墙代价更高，钢墙和水无法通过"""
+        for col in range(5):
+            self.place(col, 1, 'brick')
+        self.assertEqual(self.field.distance_at(2, 0), 2 + 4)
+        self.assertEqual(self.field.direction_at(2, 0), 'down')
+        self.place(2, 1, 'steel')
+        self.assertEqual(self.field.distance_at(2, 0), 1 + 4 + 3)
+        self.assertIn(self.field.direction_at(2, 0), ('left', 'right'))
+        for col in range(5):
+            self.place(col, 1, 'water')
+        self.assertEqual(self.field.distance_at(2, 0), UNREACHABLE)
+        self.assertIsNone(self.field.direction_at(2, 0))
+        self.assertEqual(self.field.distance_at(1, 1), UNREACHABLE)
+
+    def test_repaired_after_tile_changes(self):
+        """测试个别格子变化后只修复受影响的区域，整张地图变化后才重新计算"""
+        for _ in range(10):
+            self.field.direction_at(0, 0)
+        self.assertEqual(self.field.recomputes, 1)
+        self.place(0, 1, 'brick')
+        self.assertEqual(self.field.distance_at(0, 0), 3 + 2)
+        self.assertEqual(self.field.direction_at(0, 0), 'right')
+        self.assertEqual(self.field.recomputes, 1)
+        self.assertLess(self.field.repaired_tiles, 5 * 4)
+        self.tile_map.clear()
+        self.assertEqual(self.field.distance_at(0, 0), 5)
+        self.assertEqual(self.field.recomputes, 2)
+
+    def test_large_repair_falls_back_to_compute(self):
+        """测试修复涉及大片区域（基地被钢墙围住再打开）时改为整张重新计算"""
+        tile_map = TileMap(30, 20)
+        field = FlowField(tile_map, brick_cost=4)
+        field.set_target(15, 19)
+        field.update()
+        size = tile_map.tile_size
+        walls = [(14, 19), (16, 19), (14, 18), (15, 18), (16, 18)]
+        for terrain_type in ('steel', 'brick'):
+            for col, row in walls:
+                tile_map.place(Terrain(col * size, row * size, terrain_type, self.resource_manager))
+            recomputes = field.recomputes
+            field.update()
+            self.assertEqual(field.recomputes, recomputes + 1)
+            expected = FlowField(tile_map, brick_cost=4)
+            expected.set_target(15, 19)
+            expected.update()
+            self.assertEqual(field.distances, expected.distances)
+        self.assertEqual(field.distance_at(15, 0), 19 + 4 - 1)
+
+    def test_repair_matches_full_compute(self):
+        """测试随机打掉、放置地形（包括目标格子）后修复的结果与整张重新计算一致"""
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                self.check_repair_matches_full_compute(seed)
+
+    def check_repair_matches_full_compute(self, seed):
+        rng = random.Random(seed)
+        tile_map = TileMap(12, 9)
+        field = FlowField(tile_map, brick_cost=4)
+        field.set_target(6, 8)
+        expected = FlowField(tile_map, brick_cost=4)
+        expected.set_target(6, 8)
+        for _ in range(300):
+            if rng.random() < 0.1:
+                col, row = 6, 8
+            else:
+                col, row = rng.randrange(12), rng.randrange(9)
+            sprite = tile_map.sprite_at(col, row)
+            if sprite is not None and rng.random() < 0.5:
+                tile_map.remove(sprite)
+            else:
+                size = tile_map.tile_size
+                terrain_type = rng.choice(('brick', 'brick', 'steel', 'water'))
+                tile_map.place(Terrain(col * size, row * size, terrain_type, self.resource_manager))
+            field.update()
+            expected.compute()
+            self.assertEqual(field.distances, expected.distances)
+            self.assertEqual(field.directions, expected.directions)
+        # 修复涉及大片区域时会改为重新计算，但大多数变化仍然只做增量修复
+        self.assertLess(field.recomputes, 100)
+
+
+class TestEnemyPathfinding(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = GameManager(None, NullResourceManager(), headless=True)
+        self.game.reset(2)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_enemy_follows_flow_field_to_base(self):
+        """测试完全沿流场走的敌人绕过钢墙走到基地前并摧毁基地"""
+        game = self.game
+        size = Config.TILE_SIZE
+        for sprite in game.terrain_group.sprites():
+            if sprite is not game.base:
+                sprite.kill()
+        for enemy in game.enemy_group.sprites():
+            enemy.kill()
+        player = game.player_group.sprites()[0]
+        player.rect.topleft = ((Config.GRID_WIDTH - 1) * size, (Config.GRID_HEIGHT - 1) * size)
+        player.shield_end_time = 10 ** 9
+        game.enemies_remaining = 1
+        game.schedule_enemy_spawn(10 ** 9)
+        # 在敌人和基地之间放一排钢墙，只留最左边的缺口
+        for col in range(1, Config.GRID_WIDTH):
+            game.add_terrain(col * size, 6 * size, 'steel')
+        enemy = game.create_enemy(15 * size, 0, 'heavy')
+        enemy.path_weight = 1
+        visited = set()
+        for _ in range(2000):
+            game.update(game.sim_clock.advance())
+            visited.add(game.tile_map.tile_of(enemy.rect.centerx, enemy.rect.centery))
+            if game.game_over:
+                break
+        self.assertEqual(game.game_over_reason, 'base_destroyed')
+        self.assertIn((0, 6), visited)
+        col, row = game.tile_map.tile_of(enemy.rect.centerx, enemy.rect.centery)
+        self.assertEqual(game.flow_field.direction_at(col, row), enemy.direction)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import sys
+import os
+import random
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import actions
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+
+
+class TestActions(unittest.TestCase):
+    def test_move_direction_priority(self):
+        """测试移动方向的优先级与键盘操作一致"""
+        self.assertIsNone(actions.move_direction(actions.NOOP))
+        self.assertIsNone(actions.move_direction(actions.FIRE))
+        self.assertEqual(actions.move_direction(actions.LEFT | actions.FIRE), 'left')
+        self.assertEqual(actions.move_direction(actions.UP | actions.RIGHT), 'up')
+        self.assertEqual(actions.move_direction(actions.DOWN | actions.LEFT), 'down')
+
+
+class TestHeadlessStep(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置（不创建显示窗口）"""
+        pygame.init()
+        self.game = GameManager(None, ResourceManager(use_cache=False, lazy=True), headless=True)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_reset_returns_observation(self):
+        """测试 reset() 开始游戏并返回初始观测"""
+        observation = self.game.reset(3)
+        self.assertEqual(observation['frame'], 0)
+        self.assertEqual(observation['lives'], Config.PLAYER_LIVES)
+        self.assertIsNotNone(observation['player'])
+        self.assertEqual(observation['tiles'].shape, (Config.GRID_HEIGHT, Config.GRID_WIDTH))
+        self.assertIsNone(self.game.renderer)
+
+    def test_step_uses_injected_actions(self):
+        """测试 step() 使用注入的动作移动玩家并发射子弹"""
+        self.game.reset(3)
+        player = self.game.player_group.sprites()[0]
+        self.game.enemy_group.empty()
+        self.game.enemies_remaining = 1
+        player.rect.x, player.rect.y = 0, 0
+        self.game.tile_map.clear()
+        self.game.tank_hash.rebuild([player])
+        observation = self.game.step(actions.RIGHT)
+        self.assertEqual(observation['player'], (Config.PLAYER_SPEED, 0, 'right'))
+        self.assertEqual(observation['frame'], 1)
+        self.assertEqual(observation['time'], 1000 // Config.FPS)
+        player.last_shot = -Config.PLAYER_SHOOT_DELAY
+        observation = self.game.step(actions.DOWN | actions.FIRE)
+        self.assertEqual(observation['player'][2], 'down')
+        self.assertEqual(len(observation['bullets']), 1)
+        self.assertIsNone(self.game.player_actions)
+
+    def test_step_stops_after_game_over(self):
+        """测试游戏结束后 step() 不再推进"""
+        self.game.reset(3)
+        self.game.game_over = True
+        observation = self.game.step(actions.UP)
+        self.assertEqual(observation['frame'], 0)
+        self.assertTrue(observation['game_over'])
+
+    def test_last_level_ends_in_victory(self):
+        """测试完成最后一关时以胜利结束游戏"""
+        self.game.reset(3)
+        self.game.current_level = Config.MAX_LEVEL
+        self.game.level_complete()
+        self.assertTrue(self.game.game_over)
+        self.assertEqual(self.game.game_over_reason, 'victory')
+
+
+class TestDeterminism(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.resource_manager = ResourceManager(use_cache=False, lazy=True)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def run_game(self, seed, ticks=1500):
+        """用固定种子和固定输入运行一局，返回最终观测"""
+        game = GameManager(None, self.resource_manager, headless=True)
+        game.reset(seed)
+        inputs = random.Random(7)
+        moves = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+        for _ in range(ticks):
+            observation = game.step(inputs.choice(moves) | inputs.choice((0, actions.FIRE)))
+        return observation
+
+    def assert_same_observation(self, first, second):
+        self.assertEqual(first['tiles'].tobytes(), second['tiles'].tobytes())
+        self.assertEqual({key: value for key, value in first.items() if key != 'tiles'},
+                         {key: value for key, value in second.items() if key != 'tiles'})
+
+    def test_same_seed_same_state(self):
+        """测试相同种子和输入的两局游戏状态完全一致"""
+        first = self.run_game(11)
+        self.assertGreater(first['frame'], 0)
+        self.assert_same_observation(first, self.run_game(11))
+
+    def test_global_random_does_not_affect_game(self):
+        """测试全局 random 模块的状态不影响游戏过程"""
+        random.seed(1)
+        first = self.run_game(11, ticks=300)
+        random.seed(2)
+        self.assert_same_observation(first, self.run_game(11, ticks=300))
+
+    def test_different_seed_different_map(self):
+        """测试不同种子生成不同的地图"""
+        game = GameManager(None, self.resource_manager, headless=True)
+        tiles = game.reset(1)['tiles']
+        self.assertNotEqual(tiles.tobytes(), game.reset(2)['tiles'].tobytes())
+        self.assertEqual(game.rng.seed, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+from game.ui.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.SysFont(None, 16)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_reuses_rendered_surface(self):
+        """测试相同文字只渲染一次"""
+        cache = TextCache()
+        first = cache.render(self.font, 'score', Config.WHITE)
+        self.assertIs(cache.render(self.font, 'score', Config.WHITE), first)
+        self.assertIsNot(cache.render(self.font, 'score', Config.GRAY), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_evicts_least_recently_used(self):
+        """测试超出容量时淘汰最久未用的文字"""
+        cache = TextCache(max_entries=2)
+        a = cache.render(self.font, 'a', Config.WHITE)
+        cache.render(self.font, 'b', Config.WHITE)
+        cache.render(self.font, 'a', Config.WHITE)
+        cache.render(self.font, 'c', Config.WHITE)
+        self.assertEqual(len(cache.entries), 2)
+        self.assertIs(cache.render(self.font, 'a', Config.WHITE), a)
+        misses = cache.misses
+        cache.render(self.font, 'b', Config.WHITE)
+        self.assertEqual(cache.misses, misses + 1)
+
+
+class TestHud(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.game = GameManager(self.screen, ResourceManager(use_cache=False))
+        self.game.start_game()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_redraws_only_on_change(self):
+        """测试数值不变时HUD不重新绘制"""
+        hud = self.game.hud
+        self.assertTrue(hud.draw(self.screen, self.game, 0))
+        self.assertFalse(hud.draw(self.screen, self.game, 16))
+        self.game.score += 100
+        self.assertTrue(hud.draw(self.screen, self.game, 32))
+
+    def test_powerup_countdown_changes_per_second(self):
+        """测试道具倒计时按整秒刷新"""
+        hud = self.game.hud
+        player = self.game.player_group.sprites()[0]
+        player.add_powerup('speed', 0)
+        hud.draw(self.screen, self.game, 1)
+        self.assertFalse(hud.draw(self.screen, self.game, 999))
+        self.assertTrue(hud.draw(self.screen, self.game, 1001))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.ai.line_of_fire import LineOfFire
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import NullResourceManager
+from game.sprites.terrain import Terrain
+from game.tile_map import TileMap
+
+
+class TestLineOfFire(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置：6x5 的空地图"""
+        pygame.init()
+        self.resource_manager = NullResourceManager()
+        self.tile_map = TileMap(6, 5)
+        self.line_of_fire = LineOfFire(self.tile_map)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def place(self, col, row, terrain_type):
+        size = self.tile_map.tile_size
+        terrain = Terrain(col * size, row * size, terrain_type, self.resource_manager)
+        self.tile_map.place(terrain)
+        return terrain
+
+    def test_clear_between(self):
+        """测试同一行或列上的射线判断，草地不阻挡，其他地形阻挡"""
+        self.assertTrue(self.line_of_fire.clear_between(0, 2, 5, 2))
+        self.assertTrue(self.line_of_fire.clear_between(3, 4, 3, 0))
+        self.assertFalse(self.line_of_fire.clear_between(0, 0, 1, 1))
+        self.assertFalse(self.line_of_fire.clear_between(0, 0, 6, 0))
+        self.place(2, 2, 'grass')
+        self.assertTrue(self.line_of_fire.clear_between(0, 2, 5, 2))
+        self.place(3, 2, 'water')
+        self.assertFalse(self.line_of_fire.clear_between(0, 2, 5, 2))
+        self.assertFalse(self.line_of_fire.clear_between(3, 0, 3, 4))
+        # 两端的格子不计入
+        self.assertTrue(self.line_of_fire.clear_between(3, 2, 5, 2))
+        self.assertTrue(self.line_of_fire.clear_between(0, 2, 3, 2))
+
+    def test_updated_after_terrain_changes(self):
+        """测试地形变化后只重建变化的行和列"""
+        brick = self.place(1, 3, 'brick')
+        self.assertFalse(self.line_of_fire.clear_between(0, 3, 4, 3))
+        self.assertFalse(self.line_of_fire.clear_between(1, 0, 1, 4))
+        self.tile_map.remove(brick)
+        self.assertEqual(self.line_of_fire.changed_rows, {3})
+        self.assertEqual(self.line_of_fire.changed_cols, {1})
+        self.assertTrue(self.line_of_fire.clear_between(0, 3, 4, 3))
+        self.assertTrue(self.line_of_fire.clear_between(1, 0, 1, 4))
+        self.place(4, 0, 'steel')
+        self.tile_map.clear()
+        self.assertTrue(self.line_of_fire.clear_between(0, 0, 5, 0))
+
+
+class TestEnemyShooting(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = GameManager(None, NullResourceManager(), headless=True)
+        self.game.reset(2)
+        game = self.game
+        for sprite in game.terrain_group.sprites():
+            if sprite is not game.base:
+                sprite.kill()
+        for enemy in game.enemy_group.sprites():
+            enemy.kill()
+        game.schedule_enemy_spawn(10 ** 9)
+        size = Config.TILE_SIZE
+        self.player = game.player_group.sprites()[0]
+        self.player.rect.topleft = (2 * size, 3 * size)
+        self.enemy = game.create_enemy(8 * size, 3 * size, 'normal')
+        self.enemy.direction = 'left'
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_fires_only_with_clear_line(self):
+        """测试敌人只在正前方能打到玩家时射击"""
+        self.assertTrue(self.enemy.target_in_sight())
+        self.enemy.direction = 'right'
+        self.assertFalse(self.enemy.target_in_sight())
+        self.enemy.direction = 'left'
+        wall = self.game.add_terrain(5 * Config.TILE_SIZE, 3 * Config.TILE_SIZE, 'steel')
+        self.assertFalse(self.enemy.target_in_sight())
+        wall.kill()
+        self.assertTrue(self.enemy.target_in_sight())
+        self.player.rect.y += Config.TILE_SIZE
+        self.assertFalse(self.enemy.target_in_sight())
+
+    def test_fires_at_base_below(self):
+        """测试敌人在基地正上方朝下且中间畅通时射击"""
+        base = self.game.base
+        for wall in self.game.base_walls:
+            wall.kill()
+        self.player.kill()
+        self.enemy.rect.topleft = (base.rect.x, 2 * Config.TILE_SIZE)
+        self.enemy.direction = 'down'
+        self.assertTrue(self.enemy.target_in_sight())
+        self.game.add_terrain(base.rect.x, base.rect.y - Config.TILE_SIZE, 'brick')
+        self.assertFalse(self.enemy.target_in_sight())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.game_manager import GameManager
+from game.renderer import interpolate_position
+from game.resources.resource_manager import ResourceManager
+
+
+class TestDirtyRenderer(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.game = GameManager(self.screen, ResourceManager(use_cache=False))
+        self.game.start_game(3)
+        self.game.schedule_enemy_spawn(0)
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_incremental_frames_match_full_redraw(self):
+        """测试逐帧局部刷新的画面与整屏重绘一致"""
+        game = self.game
+        for frame in range(1, 200):
+            game.update(frame * 16)
+            if frame == 100:
+                # 地形变化只重绘对应的格子
+                game.base_walls[0].kill()
+            game.draw()
+        incremental = pygame.image.tobytes(self.screen, 'RGB')
+
+        game.renderer.invalidate()
+        game.draw()
+        full = pygame.image.tobytes(self.screen, 'RGB')
+        self.assertEqual(incremental, full)
+
+    def test_only_changed_regions_submitted(self):
+        """测试静止画面只提交精灵所在的区域"""
+        game = self.game
+        game.draw()
+        dirty = game.renderer.draw(game.get_render_groups(), game.draw_hud_panel)
+        area = sum(rect.width * rect.height for rect in dirty)
+        self.assertLess(area, Config.WINDOW_WIDTH * Config.WINDOW_HEIGHT // 4)
+
+    def test_interpolated_frame_erased_next_frame(self):
+        """测试插值位置绘制的精灵在下一帧被正确擦除"""
+        game = self.game
+        for frame in range(1, 60):
+            game.record_positions()
+            game.update(frame * 16)
+            game.renderer.draw(game.get_render_groups(), game.draw_hud_panel,
+                               game.previous_positions, 0.5)
+        game.renderer.draw(game.get_render_groups(), game.draw_hud_panel)
+        incremental = pygame.image.tobytes(self.screen, 'RGB')
+
+        game.renderer.invalidate()
+        game.draw()
+        self.assertEqual(incremental, pygame.image.tobytes(self.screen, 'RGB'))
+
+    def test_fallback_draw_interpolates(self):
+        """测试不使用 DirtyRenderer 的整屏绘制同样按 alpha 插值"""
+        game = self.game
+        game.renderer = None
+        player = game.player_group.sprites()[0]
+        game.previous_positions = {player: (player.rect.x - 8, player.rect.y)}
+        game.sim_clock.alpha = 0.5
+        game.draw()
+        interpolated = pygame.image.tobytes(self.screen, 'RGB')
+
+        game.previous_positions = {}
+        game.sim_clock.alpha = 0.0
+        player.rect.x -= 4
+        game.draw()
+        self.assertEqual(interpolated, pygame.image.tobytes(self.screen, 'RGB'))
+
+
+class TestInterpolation(unittest.TestCase):
+    def test_interpolate_between_steps(self):
+        """测试在两步之间按比例插值"""
+        rect = pygame.Rect(10, 20, 8, 8)
+        self.assertEqual(interpolate_position(rect, (6, 20), 0.5), (8, 20))
+        self.assertEqual(interpolate_position(rect, (6, 20), 0.0), (6, 20))
+        self.assertEqual(interpolate_position(rect, (10, 28), 0.25), (10, 26))
+
+    def test_teleport_is_not_interpolated(self):
+        """测试跳变（如重生）时直接使用当前位置"""
+        rect = pygame.Rect(400, 500, 8, 8)
+        self.assertEqual(interpolate_position(rect, (0, 0), 0.5), (400, 500))
+
+
+if __name__ == '__main__':
+    unittest.main()
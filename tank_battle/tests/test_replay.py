@@ -0,0 +1,160 @@
+import sys
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import actions, snapshot
+from game.rng import StreamRandom
+from game.config import Config
+from game.game_manager import GameManager
+from game.replay import Replay
+from game.resources.resource_manager import ResourceManager
+from game.sprites.powerup import PowerUp
+
+MOVES = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+
+
+def random_inputs(seed, count):
+    """生成固定的随机输入序列"""
+    rng = random.Random(seed)
+    return [rng.choice(MOVES) | rng.choice((0, actions.FIRE)) for _ in range(count)]
+
+
+def comparable(observation):
+    """把观测转换为可以直接比较的形式"""
+    result = dict(observation)
+    result['tiles'] = observation['tiles'].tobytes()
+    return result
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        self.resource_manager = ResourceManager(use_cache=False, lazy=True)
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'game.tbr')
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        shutil.rmtree(self.temp_dir)
+        pygame.quit()
+
+    def new_game(self):
+        return GameManager(None, self.resource_manager, headless=True)
+
+    def record(self, seed=21, ticks=700):
+        """录制一局游戏，返回每一步之后的观测"""
+        game = self.new_game()
+        game.reset(seed)
+        game.start_recording(self.path, keyframe_interval=100)
+        observations = [comparable(game.get_observation())]
+        for player_actions in random_inputs(5, ticks):
+            if game.game_over:
+                break
+            observations.append(comparable(game.step(player_actions)))
+        game.stop_recording()
+        return observations
+
+    def test_playback_matches_recording(self):
+        """测试回放重新模拟的结果与录制时一致"""
+        observations = self.record()
+        replay = Replay(self.path)
+        self.assertEqual(len(replay), len(observations) - 1)
+        self.assertEqual(replay.seed, 21)
+        self.assertTrue(replay.keyframe_ticks)
+
+        game = self.new_game()
+        replay.start(game)
+        for tick in range(len(replay)):
+            game.simulate(replay.action_at(tick))
+        self.assertEqual(comparable(game.get_observation()), observations[-1])
+
+    def test_seek_uses_keyframes(self):
+        """测试从关键帧跳转到任意一步（包括向后跳转）"""
+        observations = self.record()
+        replay = Replay(self.path)
+        game = self.new_game()
+        for tick in (len(replay), 250, 99, 100, len(replay) - 7, len(replay) // 2):
+            observation = replay.seek(game, tick)
+            self.assertEqual(game.sim_clock.frame, tick)
+            self.assertEqual(comparable(observation), observations[tick], tick)
+
+    def test_snapshot_round_trip(self):
+        """测试恢复快照后继续模拟与原来的结果一致"""
+        for use_bullet_system in (False, True):
+            Config.USE_BULLET_SYSTEM = use_bullet_system
+            try:
+                game = self.new_game()
+                game.reset(8)
+                inputs = random_inputs(9, 600)
+                for player_actions in inputs[:300]:
+                    game.step(player_actions)
+                # 补充道具、基地加固、已摧毁的墙等不常出现的状态
+                now = game.sim_clock.now
+                game.base_walls[0].kill()
+                game.apply_base_shield(now)
+                powerup = PowerUp(96, 160, 'speed', self.resource_manager, now)
+                game.powerup_group.add(powerup)
+                game.all_sprites.add(powerup)
+                game.player_group.sprites()[0].rapid_fire_end_time = now + 3000
+                state = game.snapshot()
+                for player_actions in inputs[300:]:
+                    expected = comparable(game.step(player_actions))
+
+                other = self.new_game()
+                other.reset(99)
+                other.restore(state)
+                for player_actions in inputs[300:]:
+                    observation = comparable(other.step(player_actions))
+                self.assertEqual(observation, expected)
+            finally:
+                Config.USE_BULLET_SYSTEM = False
+
+    def test_snapshot_is_compact(self):
+        """测试快照是紧凑的字节串，恢复后再次快照得到相同的内容"""
+        game = self.new_game()
+        game.reset(4)
+        for player_actions in random_inputs(3, 200):
+            game.step(player_actions)
+        data = game.snapshot()
+        self.assertIsInstance(data, bytes)
+        self.assertLess(len(data), 4096)
+
+        other = self.new_game()
+        other.reset(5)
+        other.restore(data)
+        self.assertEqual(other.snapshot(), data)
+        self.assertEqual(comparable(other.get_observation()), comparable(game.get_observation()))
+
+    def test_snapshot_version_mismatch(self):
+        """测试拒绝恢复其他版本的快照"""
+        game = self.new_game()
+        game.reset(4)
+        data = bytearray(game.snapshot())
+        data[0] = snapshot.SNAPSHOT_VERSION + 1
+        with self.assertRaises(ValueError):
+            game.restore(bytes(data))
+
+    def test_random_stream_state(self):
+        """测试随机数流的状态可以保存和恢复"""
+        rng = StreamRandom('1:ai')
+        rng.random()
+        state = rng.getstate()
+        expected = [rng.randint(0, 25) for _ in range(20)] + [rng.choice('abcd'), rng.random()]
+        rng.setstate(state)
+        self.assertEqual([rng.randint(0, 25) for _ in range(20)] + [rng.choice('abcd'), rng.random()],
+                         expected)
+        self.assertEqual(StreamRandom('1:ai').random(), StreamRandom('1:ai').random())
+        self.assertNotEqual(StreamRandom('1:ai').random(), StreamRandom('2:ai').random())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.resources.resource_manager import ResourceManager
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        shutil.rmtree(self.cache_dir)
+        pygame.quit()
+
+    def assert_same_images(self, first, second):
+        self.assertEqual(sorted(first.images), sorted(second.images))
+        for key, image in first.images.items():
+            other = second.images[key]
+            self.assertEqual(image.get_size(), other.get_size(), key)
+            self.assertEqual(pygame.image.tobytes(image, 'RGBA'),
+                             pygame.image.tobytes(other, 'RGBA'), key)
+
+    def test_cached_images_match_generated(self):
+        """测试从缓存读取的图像与重新生成的完全一致"""
+        generated = ResourceManager(cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        cached = ResourceManager(cache_dir=self.cache_dir)
+        self.assert_same_images(generated, cached)
+        self.assert_same_images(generated, ResourceManager(use_cache=False))
+
+    def test_parameter_change_regenerates(self):
+        """测试生成参数变化时使用新的缓存文件"""
+        manager = ResourceManager(cache_dir=self.cache_dir)
+        key = manager.get_asset_key()
+        original = ResourceManager.POWERUP_COLORS
+        ResourceManager.POWERUP_COLORS = dict(original, shield=(1, 2, 3))
+        try:
+            self.assertNotEqual(ResourceManager(cache_dir=self.cache_dir).get_asset_key(), key)
+        finally:
+            ResourceManager.POWERUP_COLORS = original
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_corrupt_cache_is_ignored(self):
+        """测试缓存文件损坏时重新生成"""
+        manager = ResourceManager(cache_dir=self.cache_dir)
+        path = os.path.join(self.cache_dir, f'assets-{manager.get_asset_key()}.bin')
+        with open(path, 'wb') as f:
+            f.write(b'broken')
+        self.assert_same_images(manager, ResourceManager(cache_dir=self.cache_dir))
+
+
+class TestLazyLoading(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        pygame.quit()
+
+    def test_get_image_generates_on_demand(self):
+        """测试懒加载模式下图像在第一次请求时生成，并与预先生成的一致"""
+        eager = ResourceManager(use_cache=False)
+        lazy = ResourceManager(use_cache=False, lazy=True)
+        self.assertEqual(lazy.images, {})
+        image = lazy.get_image('tank', 'player_left')
+        self.assertEqual(list(lazy.images), ['tank_player_left'])
+        self.assertIs(lazy.get_image('tank', 'player_left'), image)
+        self.assertEqual(pygame.image.tobytes(image, 'RGBA'),
+                         pygame.image.tobytes(eager.images['tank_player_left'], 'RGBA'))
+
+    def test_warm_up_is_incremental_and_writes_cache(self):
+        """测试分批预热最终加载全部图像，并写入缓存供下次启动使用"""
+        lazy = ResourceManager(cache_dir=self.cache_dir, lazy=True)
+        steps = 1
+        while not lazy.warm_up(budget_ms=0):
+            steps += 1
+        self.assertGreater(steps, 1)
+        self.assertEqual(sorted(lazy.images), sorted(lazy.builders))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        cached = ResourceManager(cache_dir=self.cache_dir, lazy=True)
+        self.assertTrue(cached.warm_up(budget_ms=0))
+        self.assertEqual(sorted(cached.images), sorted(lazy.images))
+
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_atlas_regions_keep_pixels(self):
+        """测试打包进图集后图像内容不变且不重叠"""
+        manager = ResourceManager(use_cache=False)
+        originals = {key: pygame.image.tobytes(image, 'RGBA')
+                     for key, image in manager.images.items()}
+        regions = manager.build_atlas()
+        self.assertEqual(sorted(regions), sorted(originals))
+        rects = list(regions.values())
+        for index, rect in enumerate(rects):
+            self.assertEqual(rect.collidelist(rects[index + 1:]), -1)
+        for key, data in originals.items():
+            image = manager.get_image('', key)
+            self.assertIs(image.get_parent(), manager.atlas)
+            self.assertEqual(pygame.image.tobytes(image, 'RGBA'), data, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
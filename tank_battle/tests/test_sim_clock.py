@@ -0,0 +1,98 @@
+import sys
+import os
+import time
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.sim_clock import SimClock, REALTIME, FIXED, FAST_FORWARD
+
+
+class TestSimClock(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_fixed_step_does_not_drift(self):
+        """测试固定步长累计余数，不产生漂移"""
+        clock = SimClock(FAST_FORWARD, fps=60)
+        for _ in range(3):
+            clock.advance()
+        self.assertEqual(clock.now, 50)
+        for _ in range(3597):
+            clock.advance()
+        self.assertEqual(clock.frame, 3600)
+        self.assertEqual(clock.now, 60000)
+
+    def test_pause_stops_time(self):
+        """测试暂停期间时间不变"""
+        clock = SimClock(FIXED, fps=1000)
+        self.assertEqual(clock.tick(), 1)
+        clock.advance()
+        clock.set_paused(True)
+        self.assertEqual(clock.tick(), 0)
+        clock.advance()
+        self.assertEqual((clock.now, clock.frame), (1, 1))
+        clock.set_paused(False)
+        clock.advance()
+        self.assertEqual((clock.now, clock.frame), (2, 2))
+
+    def test_realtime_accumulates_fixed_steps(self):
+        """测试实时模式把经过的时间换算成固定步数并记录插值比例"""
+        clock = SimClock(REALTIME, fps=50, render_fps=0)
+        self.assertEqual(clock.tick(), 0)
+        clock.last_real -= 50
+        self.assertEqual(clock.tick(), 2)
+        self.assertGreater(clock.alpha, 0.49)
+        self.assertLess(clock.alpha, 0.6)
+        for _ in range(2):
+            clock.advance()
+        self.assertEqual(clock.now, 40)
+
+    def test_realtime_limits_catch_up(self):
+        """测试落后太多时每帧最多补跑 max_catch_up 步并丢弃多余时间"""
+        clock = SimClock(REALTIME, fps=50, render_fps=0, max_catch_up=3)
+        clock.tick()
+        clock.last_real -= 1000
+        self.assertEqual(clock.tick(), 3)
+        self.assertEqual(clock.accumulator, 0.0)
+        self.assertLessEqual(clock.tick(), 1)
+
+    def test_realtime_skips_paused_time(self):
+        """测试实时模式不计入暂停期间经过的时间"""
+        clock = SimClock(REALTIME, fps=50, render_fps=0)
+        clock.tick()
+        clock.pause()
+        clock.last_real -= 1000
+        self.assertEqual(clock.tick(), 0)
+        clock.resume()
+        self.assertEqual(clock.tick(), 0)
+        self.assertLessEqual(clock.tick(), 1)
+
+    def test_wait_sleeps_most_of_the_frame(self):
+        """测试等待下一帧时保持帧间隔，大部分时间睡眠而不是忙等"""
+        clock = SimClock(REALTIME, fps=50, spin_ms=2)
+        clock.wait(100)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        for _ in range(20):
+            clock.wait(100)
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        self.assertGreaterEqual(wall, 0.195)
+        self.assertLess(wall, 0.4)
+        self.assertLess(cpu, wall * 0.6)
+
+    def test_unknown_mode(self):
+        """测试未知模式报错"""
+        with self.assertRaises(ValueError):
+            SimClock('slow_motion')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.spatial_hash import SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    """测试用的简单精灵"""
+    def __init__(self, x, y, size=40):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, size, size)
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        self.group = pygame.sprite.Group()
+        self.hash = SpatialHash(80)
+
+    def add(self, x, y):
+        box = Box(x, y)
+        self.group.add(box)
+        return box
+
+    def test_query_matches_brute_force(self):
+        """测试查询结果与逐个比较一致"""
+        boxes = [self.add(x, y) for x in range(0, 800, 55) for y in range(0, 600, 70)]
+        self.hash.rebuild(boxes)
+        for probe in (pygame.Rect(75, 75, 40, 40), pygame.Rect(300, 10, 90, 200),
+                      pygame.Rect(0, 0, 1, 1)):
+            expected = {box for box in boxes if box.rect.colliderect(probe)}
+            self.assertEqual(set(self.hash.query(probe)), expected)
+
+    def test_move_rebuckets(self):
+        """测试移动后可以在新位置查到精灵"""
+        box = self.add(0, 0)
+        self.hash.rebuild([box])
+        box.rect.topleft = (400, 400)
+        self.hash.move(box)
+        self.assertEqual(self.hash.query(pygame.Rect(410, 410, 10, 10)), [box])
+        self.assertEqual(self.hash.query(pygame.Rect(0, 0, 10, 10)), [])
+
+    def test_pairs_reported_once(self):
+        """测试跨多个格子的重叠对只报告一次"""
+        a = self.add(60, 60)
+        b = self.add(70, 70)
+        c = self.add(500, 500)
+        self.hash.rebuild([a, b, c])
+        pairs = self.hash.pairs()
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(set(pairs[0]), {a, b})
+
+    def test_dead_sprites_ignored(self):
+        """测试已销毁的精灵不会被查询到"""
+        box = self.add(0, 0)
+        self.hash.rebuild([box])
+        box.kill()
+        self.assertEqual(self.hash.query(pygame.Rect(0, 0, 40, 40)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
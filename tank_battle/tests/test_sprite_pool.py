@@ -0,0 +1,92 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import actions
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import NullResourceManager
+from game.sprite_pool import SpritePool
+from game.sprites.bullet import Bullet
+from game.sprites.powerup import PowerUp
+
+
+class TestSpritePool(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        self.resource_manager = NullResourceManager()
+        self.group = pygame.sprite.Group()
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def bullet(self, pool, x=0, direction='up', tank_type='player'):
+        bullet = pool.acquire(x, 10, direction, self.resource_manager, tank_type, None)
+        self.group.add(bullet)
+        return bullet
+
+    def test_released_after_flush(self):
+        """测试被移除的子弹在 flush() 之后才会被重新使用，并按新参数重置"""
+        pool = SpritePool(Bullet, 4)
+        bullet = self.bullet(pool)
+        bullet.kill()
+        bullet.kill()  # 重复 kill 不会重复归还
+        self.assertEqual(pool.pending, [bullet])
+        other = self.bullet(pool)
+        self.assertIsNot(other, bullet)
+        pool.flush()
+        reused = self.bullet(pool, x=40, direction='left', tank_type='enemy')
+        self.assertIs(reused, bullet)
+        self.assertEqual(reused.rect.topleft, (40, 10))
+        self.assertEqual((reused.direction, reused.tank_type), ('left', 'enemy'))
+        self.assertEqual(reused.speed, Config.ENEMY_BULLET_SPEED)
+        self.assertTrue(reused.alive())
+        self.assertEqual(pool.stats()['hits'], 1)
+        self.assertEqual(pool.stats()['misses'], 2)
+        self.assertAlmostEqual(pool.hit_rate(), 1 / 3)
+
+    def test_capacity(self):
+        """测试空闲实例超过容量时被丢弃，容量为 0 时不重复使用"""
+        pool = SpritePool(Bullet, 2)
+        bullets = [self.bullet(pool) for _ in range(3)]
+        for bullet in bullets:
+            bullet.kill()
+        pool.flush()
+        self.assertEqual(len(pool.free), 2)
+        self.assertEqual(pool.discarded, 1)
+        self.assertIsNone(bullets[2].pool)
+
+        pool = SpritePool(PowerUp, 0)
+        powerup = pool.acquire(0, 0, 'speed', self.resource_manager, 0)
+        self.group.add(powerup)
+        powerup.kill()
+        pool.flush()
+        self.assertIsNot(pool.acquire(0, 0, 'shield', self.resource_manager, 0), powerup)
+        self.assertEqual(pool.hits, 0)
+
+    def test_game_reuses_bullets(self):
+        """测试游戏中连续射击时重复使用子弹"""
+        game = GameManager(None, self.resource_manager, headless=True)
+        game.reset(3)
+        for enemy in game.enemy_group.sprites():
+            enemy.kill()
+        game.schedule_enemy_spawn(10 ** 9)
+        player = game.player_group.sprites()[0]
+        player.direction = 'up'
+        for _ in range(600):
+            player.shield_end_time = game.sim_clock.now + 1000
+            game.simulate(actions.FIRE)
+        stats = game.bullet_pool.stats()
+        self.assertGreater(stats['hits'], 10)
+        self.assertLessEqual(stats['misses'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
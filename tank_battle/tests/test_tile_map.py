@@ -0,0 +1,82 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+from game.tile_map import TileMap, TERRAIN_CODES, EMPTY
+
+
+class TestTileMap(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        self.game = GameManager(screen, ResourceManager(use_cache=False))
+        self.game.start_game()
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_grid_matches_terrain_group(self):
+        """测试网格与地形精灵组保持一致"""
+        tile_map = self.game.tile_map
+        occupied = 0
+        for row in range(tile_map.height):
+            for col in range(tile_map.width):
+                sprite = tile_map.sprite_at(col, row)
+                if sprite is None:
+                    self.assertEqual(tile_map.code_at(col, row), EMPTY)
+                else:
+                    occupied += 1
+                    self.assertTrue(sprite.alive())
+                    self.assertEqual(tile_map.code_at(col, row), TERRAIN_CODES[sprite.type])
+        self.assertEqual(occupied, len(self.game.terrain_group))
+
+    def test_kill_clears_tile(self):
+        """测试地形被摧毁后格子被清空"""
+        wall = self.game.base_walls[0]
+        col, row = self.game.tile_map.tile_of(wall.rect.x, wall.rect.y)
+        wall.kill()
+        self.assertIsNone(self.game.tile_map.sprite_at(col, row))
+        self.assertEqual(self.game.tile_map.code_at(col, row), EMPTY)
+
+    def test_base_shield_updates_tiles(self):
+        """测试基地加固及恢复时网格同步更新"""
+        tile_map = self.game.tile_map
+        self.game.apply_base_shield(1000)
+        for wall in self.game.base_walls:
+            col, row = tile_map.tile_of(wall.rect.x, wall.rect.y)
+            self.assertEqual(tile_map.code_at(col, row), TERRAIN_CODES['steel'])
+            self.assertIs(tile_map.sprite_at(col, row), wall)
+        self.game.update_base_shield(1000 + Config.BASE_SHIELD_DURATION)
+        for wall in self.game.base_walls:
+            col, row = tile_map.tile_of(wall.rect.x, wall.rect.y)
+            self.assertEqual(tile_map.code_at(col, row), TERRAIN_CODES['brick'])
+        self.assertEqual(len(self.game.terrain_group),
+                         sum(1 for row in tile_map.sprites for sprite in row if sprite))
+
+    def test_blocks_tank(self):
+        """测试坦克地形碰撞查询"""
+        tile_map = TileMap()
+        self.game.clear_all_sprites()
+        size = Config.TILE_SIZE
+        self.game.add_terrain(2 * size, 2 * size, 'steel')
+        self.game.add_terrain(4 * size, 2 * size, 'grass')
+        # 跨越两个格子的矩形
+        self.assertTrue(self.game.tile_map.blocks_tank(pygame.Rect(size + 5, 2 * size, size, size)))
+        self.assertFalse(self.game.tile_map.blocks_tank(pygame.Rect(size, 2 * size, size, size)))
+        # 草地不阻挡坦克
+        self.assertFalse(self.game.tile_map.blocks_tank(pygame.Rect(4 * size, 2 * size, size, size)))
+        self.assertFalse(tile_map.blocks_tank(pygame.Rect(0, 0, size, size)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import sys
+import os
+import unittest
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import NullResourceManager
+from game.timers import TimerQueue
+
+
+class TestTimerQueue(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        self.fired = []
+        self.timers = TimerQueue()
+        for name in ('a', 'b'):
+            self.timers.register(name, lambda key, now, name=name: self.fired.append((name, key, now)))
+
+    def test_runs_only_due_events(self):
+        """测试只执行到期的事件，到期时间相同时按登记顺序"""
+        timers = self.timers
+        timers.schedule('b', 200)
+        timers.schedule('a', 100, 'x')
+        timers.schedule('a', 200, 'y')
+        self.assertEqual(timers.run_due(99), 0)
+        self.assertEqual(timers.run_due(100), 1)
+        self.assertEqual(self.fired, [('a', 'x', 100)])
+        self.assertEqual(timers.run_due(250), 2)
+        self.assertEqual(self.fired[1:], [('b', None, 250), ('a', 'y', 250)])
+        self.assertEqual(len(timers), 0)
+
+    def test_cancel_and_reschedule(self):
+        """测试取消事件，再次登记同一事件时替换原来的到期时间"""
+        timers = self.timers
+        timers.schedule('a', 100, 'x')
+        timers.schedule('a', 150, 'y')
+        timers.schedule('a', 300, 'x')
+        self.assertEqual(timers.due_time('a', 'x'), 300)
+        self.assertEqual(timers.events(), [(150, 'a', 'y'), (300, 'a', 'x')])
+        self.assertTrue(timers.cancel('a', 'y'))
+        self.assertFalse(timers.cancel('a', 'y'))
+        self.assertEqual(timers.run_due(200), 0)
+        self.assertEqual(timers.run_due(300), 1)
+        self.assertEqual(self.fired, [('a', 'x', 300)])
+
+
+class TestGameTimers(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+        self.game = GameManager(None, NullResourceManager(), headless=True)
+        self.game.reset(5)
+        self.player = self.game.player_group.sprites()[0]
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_recollected_powerup_extends_effect(self):
+        """测试重复拾取护盾时到期事件被推迟，到期后护盾才清除"""
+        game, player = self.game, self.player
+        player.add_powerup('shield', 0)
+        player.add_powerup('shield', 1000)
+        end_time = 1000 + Config.SHIELD_DURATION
+        self.assertEqual(game.timers.due_time('shield_end', player), end_time)
+        game.timers.run_due(Config.SHIELD_DURATION)
+        self.assertEqual(player.shield_end_time, end_time)
+        game.timers.run_due(end_time)
+        self.assertEqual(player.shield_end_time, 0)
+
+    def test_powerup_expires_and_base_shield_reverts(self):
+        """测试掉落的道具到期消失，基地加固到期后恢复砖墙"""
+        game = self.game
+        enemy = game.enemy_group.sprites()[0]
+        game.rng.loot.random = lambda: 0.0  # 必定掉落
+        game.handle_enemy_death(enemy)
+        powerup = game.powerup_group.sprites()[0]
+        game.apply_base_shield(0)
+        game.timers.run_due(Config.POWERUP_DURATION - 1)
+        self.assertTrue(powerup.alive())
+        game.timers.run_due(Config.POWERUP_DURATION)
+        self.assertFalse(powerup.alive())
+        self.assertTrue(any(wall.type == 'steel' for wall in game.base_walls))
+        game.timers.run_due(Config.BASE_SHIELD_DURATION)
+        self.assertEqual(game.base_shield_end_time, 0)
+        self.assertFalse(any(wall.type == 'steel' for wall in game.base_walls))
+
+    def test_enemy_spawn_waits_for_event(self):
+        """测试生成间隔的事件到期之前不生成敌人"""
+        game = self.game
+        for enemy in game.enemy_group.sprites():
+            enemy.kill()
+        game.schedule_enemy_spawn(game.sim_clock.now)
+        due = game.sim_clock.now + Config.ENEMY_SPAWN_DELAY
+        while not game.enemy_group:
+            game.simulate(0)
+        # 在到期后的第一帧生成
+        self.assertGreaterEqual(game.sim_clock.now, due)
+        self.assertLess(game.sim_clock.now - due, 1000 / Config.FPS)
+        self.assertEqual(game.last_enemy_spawn, game.sim_clock.now)
+        self.assertEqual(game.timers.due_time('enemy_spawn'),
+                         game.last_enemy_spawn + Config.ENEMY_SPAWN_DELAY)
+
+    def test_snapshot_restores_events(self):
+        """测试快照保存并恢复未到期的事件"""
+        game, player = self.game, self.player
+        player.add_powerup('speed', 500)
+        player.add_powerup('shield', 200)
+        game.apply_base_shield(100)
+        other = GameManager(None, NullResourceManager(), headless=True)
+        other.restore(game.snapshot())
+        other_player = other.player_group.sprites()[0]
+        expected = [(due, name, other_player if key is player else key)
+                    for due, name, key in game.timers.events()]
+        self.assertEqual(other.timers.events(), expected)
+        self.assertIn((200 + Config.SHIELD_DURATION, 'shield_end', other_player), expected)
+
+
+    def test_snapshot_keeps_fired_enemy_spawn(self):
+        """测试生成间隔事件已经触发后保存的快照，恢复时不会重新登记这个事件"""
+        game = self.game
+        game.schedule_enemy_spawn(0)
+        game.timers.run_due(Config.ENEMY_SPAWN_DELAY)
+        self.assertTrue(game.enemy_spawn_ready)
+        data = game.snapshot()
+        other = GameManager(None, NullResourceManager(), headless=True)
+        other.restore(data)
+        self.assertTrue(other.enemy_spawn_ready)
+        self.assertIsNone(other.timers.due_time('enemy_spawn'))
+        self.assertEqual(other.snapshot(), data)
+
+if __name__ == '__main__':
+    unittest.main()
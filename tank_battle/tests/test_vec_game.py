@@ -0,0 +1,85 @@
+import sys
+import os
+import random
+import unittest
+import numpy as np
+import pygame
+
+# 添加项目根目录到 Python 路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import actions
+from game.config import Config
+from game.game_manager import GameManager
+from game.resources.resource_manager import ResourceManager
+from game.vec_game import MAX_ENEMIES, STATS_FIELDS, VecGame
+
+MOVES = (actions.NOOP, actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT)
+
+
+class TestVecGame(unittest.TestCase):
+    def setUp(self):
+        """每个测试用例前的设置"""
+        pygame.init()
+
+    def tearDown(self):
+        """每个测试用例后的清理"""
+        pygame.quit()
+
+    def test_reset_fills_batched_observations(self):
+        """测试 reset() 为每局生成对应形状的观测数组"""
+        vec = VecGame(3)
+        observations = vec.reset(10)
+        self.assertEqual(vec.seeds, [10, 11, 12])
+        self.assertEqual(observations['tiles'].shape, (3, Config.GRID_HEIGHT, Config.GRID_WIDTH))
+        self.assertEqual(observations['enemies'].shape, (3, MAX_ENEMIES, 4))
+        self.assertEqual(observations['stats'].shape, (3, len(STATS_FIELDS)))
+        self.assertTrue((observations['player'][:, 0] >= 0).all())
+        self.assertTrue((observations['stats'][:, STATS_FIELDS.index('lives')] == Config.PLAYER_LIVES).all())
+        self.assertNotEqual(observations['tiles'][0].tobytes(), observations['tiles'][1].tobytes())
+
+    def test_matches_single_game(self):
+        """测试不生成图像的批量模拟与单独运行的游戏结果一致"""
+        vec = VecGame(2)
+        vec.reset(30)
+        game = GameManager(None, ResourceManager(use_cache=False, lazy=True), headless=True)
+        game.reset(31)
+        rng = random.Random(4)
+        total_reward = 0
+        for _ in range(400):
+            player_actions = rng.choice(MOVES) | rng.choice((0, actions.FIRE))
+            observations, rewards, dones = vec.step([actions.NOOP, player_actions])
+            observation = game.step(player_actions)
+            total_reward += rewards[1]
+            if observation['game_over']:
+                self.assertTrue(dones[1])
+                break
+            player = observation['player']
+            self.assertEqual(tuple(observations['player'][1][:2]), player[:2])
+            self.assertEqual(observations['tiles'][1].tobytes(), observation['tiles'].tobytes())
+            self.assertEqual(len(observation['enemies']),
+                             int((observations['enemies'][1][:, 0] >= 0).sum()))
+        self.assertEqual(total_reward, game.score)
+
+    def test_auto_reset_finished_games(self):
+        """测试结束的游戏用下一个种子自动重新开始"""
+        vec = VecGame(2)
+        vec.reset(5)
+        vec.step([actions.UP, actions.UP])
+        vec.games[0].game_over = True
+        observations, _, dones = vec.step(np.array([actions.UP, actions.UP], dtype=np.uint8))
+        self.assertEqual(dones.tolist(), [True, False])
+        self.assertEqual(vec.seeds, [7, 6])
+        self.assertEqual(observations['stats'][:, STATS_FIELDS.index('frame')].tolist(), [0, 2])
+
+    def test_rejects_wrong_number_of_actions(self):
+        """测试动作数量与游戏数量不一致时报错"""
+        vec = VecGame(2)
+        vec.reset(1)
+        with self.assertRaises(ValueError):
+            vec.step([actions.UP])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,342 @@
+"""关卡平衡扫描：在参数网格上批量运行 headless 游戏
+
+对 Config.LEVEL_CONFIGS 中某一关的参数（敌人数量、地形密度、各类敌人
+权重）做笛卡尔积，每个参数组合用不同种子运行若干局，玩家由随机或脚本
+策略控制。进程池中的每个 worker 只初始化一次 pygame 和游戏对象，之后
+重复使用。每局结果完成后立即追加到 CSV 文件，中断后用相同命令重新运行
+会跳过已经完成的局。最后按参数组合汇总胜率、平均关卡时长和每步耗时。
+
+    python tools/balance_sweep.py --level 3 --param enemies=8,10,12 \\
+        --param terrain_density=0.1,0.2 --param enemy_types.elite=0,0.2 \\
+        --games 200 --out sweep.csv
+
+    python tools/balance_sweep.py --out sweep.csv --summary  # 只汇总已有结果
+"""
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 添加项目根目录到 Python 路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# 每局结果的固定列（参数列排在 point 之后）
+RESULT_FIELDS = ('seed', 'outcome', 'ticks', 'duration_s', 'score', 'lives_lost',
+                 'mean_step_us', 'max_step_us')
+
+# 结果列的解析函数，用于识别中断时只写了一部分的行
+RESULT_PARSERS = {'seed': int, 'ticks': int, 'score': int, 'lives_lost': int,
+                  'duration_s': float, 'mean_step_us': float, 'max_step_us': float}
+OUTCOMES = ('win', 'loss', 'timeout')
+
+# 策略换方向的间隔（步）
+RANDOM_HOLD_TICKS = 15
+
+# 每个 worker 进程中重复使用的游戏（由 init_worker 创建）
+worker_game = None
+
+
+def parse_param(text):
+    """解析 name=v1,v2,... 形式的参数，返回 (name, [values])"""
+    name, sep, values = text.partition('=')
+    if not sep or not values:
+        raise argparse.ArgumentTypeError(f"Expected name=v1,v2,...: {text}")
+    key = name.split('.')
+    if key[0] not in ('enemies', 'terrain_density', 'enemy_types') or \
+            (key[0] == 'enemy_types') != (len(key) == 2) or len(key) > 2:
+        raise argparse.ArgumentTypeError(f"Unknown level parameter: {name}")
+    return name, [json.loads(value) for value in values.split(',')]
+
+
+def build_grid(params):
+    """由参数列表生成所有参数组合（每个组合是一个 name -> value 字典）"""
+    names = [name for name, _ in params]
+    return [dict(zip(names, values)) for values in itertools.product(*[v for _, v in params])]
+
+
+def point_key(point):
+    """参数组合在结果文件中的标识"""
+    return ';'.join(f'{name}={point[name]}' for name in sorted(point))
+
+
+def apply_point(level_config, point):
+    """返回替换了参数组合中各项的关卡配置副本"""
+    level_config = copy.deepcopy(level_config)
+    for name, value in point.items():
+        if name.startswith('enemy_types.'):
+            level_config['enemy_types'][name.split('.', 1)[1]] = value
+        else:
+            level_config[name] = value
+    return level_config
+
+
+def init_worker():
+    """worker 进程初始化：pygame 和游戏对象在每个进程中只创建一次"""
+    global worker_game
+    import pygame
+    from tank_battle.game.game_manager import GameManager
+    from tank_battle.game.resources.resource_manager import NullResourceManager
+    pygame.init()
+    worker_game = GameManager(None, NullResourceManager(), headless=True)
+
+
+def random_policy(game, rng, state):
+    """随机策略：每隔一段时间换一个方向，随机开火"""
+    from tank_battle.game import actions
+    if game.sim_clock.frame % RANDOM_HOLD_TICKS == 0:
+        state['move'] = rng.choice((actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT,
+                                    actions.NOOP))
+    return state.get('move', actions.NOOP) | (actions.FIRE if rng.random() < 0.3 else 0)
+
+
+def scripted_policy(game, rng, state):
+    """脚本策略：与最近的敌人对齐行或列后朝它开火"""
+    from tank_battle.game import actions
+    player = next(iter(game.player_group), None)
+    if player is None or not game.enemy_group:
+        return actions.NOOP
+    px, py = player.rect.center
+    target = min(game.enemy_group, key=lambda enemy: abs(enemy.rect.centerx - px) +
+                 abs(enemy.rect.centery - py))
+    dx = target.rect.centerx - px
+    dy = target.rect.centery - py
+    half = player.rect.width // 2
+    if abs(dx) <= half:
+        return (actions.DOWN if dy > 0 else actions.UP) | actions.FIRE
+    if abs(dy) <= half:
+        return (actions.RIGHT if dx > 0 else actions.LEFT) | actions.FIRE
+    # 卡住时随机换个方向
+    if game.sim_clock.frame % RANDOM_HOLD_TICKS == 0 and (player.rect.x, player.rect.y) == state.get('last'):
+        state['detour'] = rng.choice((actions.UP, actions.DOWN, actions.LEFT, actions.RIGHT))
+    if game.sim_clock.frame % RANDOM_HOLD_TICKS == 0:
+        state['last'] = (player.rect.x, player.rect.y)
+    if state.get('detour'):
+        move = state['detour']
+        if game.sim_clock.frame % RANDOM_HOLD_TICKS == RANDOM_HOLD_TICKS - 1:
+            state['detour'] = None
+        return move | actions.FIRE
+    if abs(dx) < abs(dy):
+        return actions.RIGHT if dx > 0 else actions.LEFT
+    return actions.DOWN if dy > 0 else actions.UP
+
+
+POLICIES = {'random': random_policy, 'scripted': scripted_policy}
+
+
+def run_game(level, point, seed, policy, max_ticks):
+    """在当前 worker 中运行一局（只玩第 level 关），返回结果字典
+
+    outcome 为 win（过关）、loss（游戏结束）或 timeout（超过 max_ticks）。
+    """
+    from tank_battle.game.config import Config
+    game = worker_game
+    original = Config.LEVEL_CONFIGS[level]
+    Config.LEVEL_CONFIGS[level] = apply_point(original, point)
+    try:
+        game.reset(seed)
+        game.current_level = level
+        game.init_level()
+        rng = random.Random(seed)
+        choose = POLICIES[policy]
+        state = {}
+        lives = game.lives
+        step_times = []
+        outcome = 'timeout'
+        for _ in range(max_ticks):
+            player_actions = choose(game, rng, state)
+            start = time.perf_counter()
+            game.simulate(player_actions)
+            step_times.append(time.perf_counter() - start)
+            if game.current_level != level or game.game_over_reason == 'victory':
+                outcome = 'win'
+                break
+            if game.game_over:
+                outcome = 'loss'
+                break
+    finally:
+        Config.LEVEL_CONFIGS[level] = original
+    ticks = len(step_times)
+    return {
+        'seed': seed,
+        'outcome': outcome,
+        'ticks': ticks,
+        'duration_s': round(ticks / Config.FPS, 3),
+        'score': game.score,
+        'lives_lost': lives - game.lives,
+        'mean_step_us': round(sum(step_times) / max(ticks, 1) * 1e6, 1),
+        'max_step_us': round(max(step_times, default=0) * 1e6, 1),
+    }
+
+
+def run_batch(level, point, seeds, policy, max_ticks):
+    """在 worker 中运行同一参数组合的一批种子"""
+    return point, [run_game(level, point, seed, policy, max_ticks) for seed in seeds]
+
+
+def complete_row(row):
+    """结果行的各列是否都存在且能解析（进程被强行结束时最后一行可能不完整）"""
+    # 没有 --param 时参数组合为空，point 列是空字符串
+    if None in row or row.get('point') is None or row.get('outcome') not in OUTCOMES:
+        return False
+    try:
+        for name, parse in RESULT_PARSERS.items():
+            parse(row[name])
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def drop_partial_row(path):
+    """把结果文件截断到最后一个完整的换行，去掉没有写完的最后一行"""
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        # 从末尾向前找换行符
+        end = size
+        while end > 0:
+            start = max(end - 4096, 0)
+            f.seek(start)
+            index = f.read(end - start).rfind(b'\n')
+            if index >= 0:
+                f.truncate(start + index + 1)
+                return
+            end = start
+        f.truncate(0)
+
+
+def load_done(path, columns):
+    """读取已有的结果文件，返回已完成的 (参数组合, 种子) 集合（跳过不完整的行）"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    drop_partial_row(path)
+    if os.path.getsize(path) == 0:
+        return done
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        if tuple(reader.fieldnames or ()) != tuple(columns):
+            raise SystemExit(f"{path} was written with different columns: {reader.fieldnames}")
+        for row in reader:
+            if complete_row(row):
+                done.add((row['point'], int(row['seed'])))
+    return done
+
+
+def sweep(level, grid, games, policy='random', max_ticks=None, out='sweep.csv',
+          workers=None, base_seed=0, batch_size=8):
+    """运行整个参数网格，把每局结果追加到 out，返回本次新运行的局数"""
+    from tank_battle.game.config import Config
+    if max_ticks is None:
+        max_ticks = 5 * 60 * Config.FPS
+    names = sorted({name for point in grid for name in point})
+    columns = ['point'] + names + list(RESULT_FIELDS)
+    done = load_done(out, columns)
+
+    tasks = []
+    for point in grid:
+        key = point_key(point)
+        seeds = [seed for seed in range(base_seed, base_seed + games) if (key, seed) not in done]
+        for start in range(0, len(seeds), batch_size):
+            tasks.append((point, seeds[start:start + batch_size]))
+    if not tasks:
+        return 0
+
+    total = sum(len(seeds) for _, seeds in tasks)
+    finished = 0
+    write_header = os.path.getsize(out) == 0 if os.path.exists(out) else True
+    with open(out, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        if write_header:
+            writer.writeheader()
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=init_worker) as executor:
+            futures = [executor.submit(run_batch, level, point, seeds, policy, max_ticks)
+                       for point, seeds in tasks]
+            for future in as_completed(futures):
+                point, results = future.result()
+                for result in results:
+                    writer.writerow(dict(point=point_key(point), **point, **result))
+                f.flush()
+                finished += len(results)
+                print(f"\r{finished}/{total} games", end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    return total
+
+
+def summarize(path):
+    """按参数组合汇总结果文件，返回 [(point, 统计字典)]（跳过不完整的行）"""
+    groups = defaultdict(list)
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            if complete_row(row):
+                groups[row['point']].append(row)
+    summary = []
+    for point, rows in sorted(groups.items()):
+        count = len(rows)
+        wins = [row for row in rows if row['outcome'] == 'win']
+        summary.append((point, {
+            'games': count,
+            'win_rate': len(wins) / count,
+            'timeout_rate': sum(row['outcome'] == 'timeout' for row in rows) / count,
+            'mean_win_duration_s': (sum(float(row['duration_s']) for row in wins) / len(wins)
+                                    if wins else float('nan')),
+            'mean_step_us': sum(float(row['mean_step_us']) * int(row['ticks']) for row in rows) /
+                            max(sum(int(row['ticks']) for row in rows), 1),
+            'max_step_us': max(float(row['max_step_us']) for row in rows),
+        }))
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'point':<48} {'games':>6} {'win':>6} {'timeout':>8} {'win dur s':>10} "
+          f"{'step us':>8} {'max us':>8}")
+    for point, stats in summary:
+        print(f"{point:<48} {stats['games']:>6} {stats['win_rate']:>6.1%} "
+              f"{stats['timeout_rate']:>8.1%} {stats['mean_win_duration_s']:>10.1f} "
+              f"{stats['mean_step_us']:>8.1f} {stats['max_step_us']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--level', type=int, default=1, help='要调整的关卡')
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        help='参数及取值，如 enemies=8,10 或 enemy_types.elite=0,0.2')
+    parser.add_argument('--games', type=int, default=100, help='每个参数组合运行的局数')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='scripted')
+    parser.add_argument('--max-ticks', type=int, default=None, help='每局最多模拟的步数')
+    parser.add_argument('--workers', type=int, default=None, help='进程数（默认为 CPU 核数）')
+    parser.add_argument('--seed', type=int, default=0, help='第一局的种子')
+    parser.add_argument('--out', default='sweep.csv')
+    parser.add_argument('--summary', action='store_true', help='只汇总已有的结果文件')
+    args = parser.parse_args()
+
+    if not args.summary:
+        from tank_battle.game.config import Config
+        if args.level not in Config.LEVEL_CONFIGS:
+            parser.error(f"Unknown level: {args.level}")
+        grid = build_grid(args.param)
+        start = time.perf_counter()
+        count = sweep(args.level, grid, args.games, args.policy, args.max_ticks, args.out,
+                      args.workers, args.seed)
+        print(f"Ran {count} games in {time.perf_counter() - start:.1f}s")
+    print_summary(summarize(args.out))
+
+
+if __name__ == '__main__':
+    main()